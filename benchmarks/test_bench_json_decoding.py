@@ -0,0 +1,41 @@
+"""Benchmarks for JSON decoding of large block lists.
+
+Run with ``pytest benchmarks/test_bench_json_decoding.py``. Compares the
+block-by-block ``model_validate`` loop with the bulk path that
+``deserialize_from_json`` uses, which groups the blocks by kind and validates
+each group with ``validate_many``.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from corelab_blockkit import BlockList, ImageBlock, TextBlock
+from corelab_blockkit.registry import registry
+from corelab_blockkit.ser.json_codec import _load_blocks
+
+
+@pytest.fixture(scope="module")
+def blocks_data():
+    """The dictionary forms of 20,000 text and image blocks."""
+    blocks = [
+        TextBlock(text=f"Paragraph {i}")
+        if i % 4
+        else ImageBlock(url=f"https://example.com/{i}.png")
+        for i in range(20_000)
+    ]
+    return json.loads(BlockList(blocks=blocks).to_json())["blocks"]
+
+
+def test_decode_per_block(benchmark, blocks_data):
+    """Validate every block on its own."""
+    benchmark(
+        lambda: [registry.get(d["kind"]).model_validate(d) for d in blocks_data]
+    )
+
+
+def test_decode_grouped_by_kind(benchmark, blocks_data):
+    """Validate the blocks in groups by kind."""
+    benchmark(_load_blocks, blocks_data, False)
@@ -0,0 +1,65 @@
+"""Benchmarks for JSON encoding of large block lists.
+
+Run with ``pytest benchmarks/test_bench_json_encoding.py``. Compares the
+json.dumps encoder, which calls back into Python for every model, UUID and
+timestamp, with pydantic's compiled serializer on a list of 10,000 blocks.
+The json.dumps benchmarks run with the fragment cache disabled, so that
+every round encodes every block, except for the one that measures
+encoding again after an edit.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from corelab_blockkit import BlockList, ImageBlock, TextBlock
+from corelab_blockkit.ser.fragments import fragment_cache
+from corelab_blockkit.ser.json_codec import serialize_to_json
+
+
+@pytest.fixture(scope="module")
+def block_list():
+    """A block list with 10,000 text and image blocks."""
+    blocks = []
+    for i in range(5_000):
+        blocks.append(TextBlock(text=f"Paragraph {i} with **some** text"))
+        blocks.append(
+            ImageBlock(url=f"https://example.com/{i}.png", alt_text=f"Image {i}")
+        )
+    return BlockList(blocks=blocks)
+
+
+@pytest.fixture
+def uncached():
+    """Disable the fragment cache for the duration of a benchmark."""
+    maxsize = fragment_cache.maxsize
+    fragment_cache.maxsize = 0
+    yield
+    fragment_cache.maxsize = maxsize
+
+
+def test_json_encoder(benchmark, block_list, uncached):
+    """Encode with json.dumps and BlockJSONEncoder."""
+    benchmark(serialize_to_json, block_list)
+
+
+def test_json_compiled(benchmark, block_list):
+    """Encode with pydantic's compiled serializer."""
+    benchmark(serialize_to_json, block_list, compiled=True)
+
+
+def test_json_encoder_indent(benchmark, block_list, uncached):
+    """Encode with json.dumps and BlockJSONEncoder, indented."""
+    benchmark(serialize_to_json, block_list, indent=2)
+
+
+def test_json_compiled_indent(benchmark, block_list):
+    """Encode with pydantic's compiled serializer, indented."""
+    benchmark(serialize_to_json, block_list, compiled=True, indent=2)
+
+
+def test_json_encoder_after_edit(benchmark, block_list):
+    """Encode again after one edit, with the other blocks already cached."""
+    serialize_to_json(block_list)
+    edited = block_list.replace(TextBlock(id=block_list[0].id, text="Edited"))
+    benchmark(serialize_to_json, edited)
@@ -0,0 +1,43 @@
+"""Benchmarks for block kind validation.
+
+Run with ``pytest benchmarks/test_bench_kind_validation.py``. The uncached
+benchmark uses a kind that is not registered, so it goes through the pattern
+match on every construction like every block did before registered kinds
+were cached.
+"""
+
+import re
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from corelab_blockkit import TextBlock
+from corelab_blockkit.blocks.base import BaseBlock, _known_kinds
+
+
+def test_validate_kind_regex(benchmark):
+    """Validate a kind the way every block did before (uncompiled re.match)."""
+    benchmark(re.match, r"^[a-z][a-z0-9_]*$", "text")
+
+
+def test_validate_kind_cached(benchmark):
+    """Validate a registered kind through the cache."""
+    benchmark(BaseBlock.validate_kind, "text")
+
+
+def test_base_block_uncached_kind(benchmark):
+    """Construct a BaseBlock whose kind has to be matched against the pattern."""
+    assert "unregistered_kind" not in _known_kinds
+    benchmark(BaseBlock, kind="unregistered_kind")
+
+
+def test_base_block_cached_kind(benchmark):
+    """Construct a BaseBlock whose kind is registered and cached."""
+    assert "text" in _known_kinds
+    benchmark(BaseBlock, kind="text")
+
+
+def test_text_block_cached_kind(benchmark):
+    """Construct a TextBlock, the most common block type."""
+    benchmark(TextBlock, text="Hello **world**!")
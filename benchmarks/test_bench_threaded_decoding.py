@@ -0,0 +1,44 @@
+"""Benchmarks for decoding block lists from several threads.
+
+Run with ``pytest benchmarks/test_bench_threaded_decoding.py``. Decodes the
+same 16 documents with 1 to 8 threads. Every block lookup goes through the
+registry, whose lookups do not take a lock, so on a free-threaded build of
+Python (``python3.13t``) the time drops with the number of threads up to the
+number of cores. With the GIL enabled the threads take turns and the times
+stay about the same.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from corelab_blockkit import BlockList, ImageBlock, TextBlock
+from corelab_blockkit.ser.json_codec import deserialize_from_json
+
+
+@pytest.fixture(scope="module")
+def documents():
+    """16 JSON documents with 2,000 text and image blocks each."""
+    documents = []
+    for document in range(16):
+        blocks = [
+            TextBlock(text=f"Paragraph {document}.{i}")
+            if i % 4
+            else ImageBlock(url=f"https://example.com/{document}/{i}.png")
+            for i in range(2_000)
+        ]
+        documents.append(BlockList(blocks=blocks).to_json())
+    return documents
+
+
+@pytest.mark.parametrize("threads", [1, 2, 4, 8])
+def test_decode_threads(benchmark, documents, threads):
+    """Decode all documents with a pool of threads."""
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    benchmark.extra_info["gil_enabled"] = gil_enabled
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        benchmark(lambda: list(executor.map(deserialize_from_json, documents)))
@@ -0,0 +1,49 @@
+"""Benchmarks for batch edits in block list transactions.
+
+Run with ``pytest benchmarks/test_bench_transactions.py``. Each benchmark
+removes or moves half of the blocks of a list in one transaction, at several
+list sizes. Every edit costs O(log n), so doubling the size should a little
+more than double the time; a linear search per edit would quadruple it.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from corelab_blockkit import BlockList, TextBlock
+
+SIZES = [10_000, 20_000, 40_000]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"n={size}")
+def block_list(request):
+    """A block list of text blocks."""
+    blocks = [TextBlock(text=f"Block {i}") for i in range(request.param)]
+    return BlockList(blocks=blocks)
+
+
+def test_transaction_remove_half(benchmark, block_list):
+    """Remove every other block."""
+    block_ids = [block.id for block in block_list][::2]
+
+    def remove():
+        with block_list.transaction() as tx:
+            for block_id in block_ids:
+                tx.remove(block_id)
+        return tx.result
+
+    assert len(benchmark(remove)) == len(block_list) - len(block_ids)
+
+
+def test_transaction_move_half(benchmark, block_list):
+    """Move every other block to a scattered position."""
+    size = len(block_list)
+    block_ids = [block.id for block in block_list][::2]
+
+    def move():
+        with block_list.transaction() as tx:
+            for i, block_id in enumerate(block_ids):
+                tx.move(block_id, i * 7919 % size)
+        return tx.result
+
+    assert len(benchmark(move)) == size
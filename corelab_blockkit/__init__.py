@@ -6,8 +6,10 @@ of course content as discrete "blocks" that can be serialized, rendered, and ext
 
 from corelab_blockkit.blocks.base import BaseBlock
 from corelab_blockkit.enums import AudioFormat, MimeType, TextFormat, VideoProvider
+from corelab_blockkit.lazy import LazyBlockList
 from corelab_blockkit.list import BlockList
 from corelab_blockkit.meta import BlockMeta, toggle_favorite
+from corelab_blockkit.ops import AddOp, MoveOp, RemoveOp, ReplaceOp
 from corelab_blockkit.registry import registry
 
 # Import all block types
@@ -17,7 +17,7 @@ from corelab_blockkit.blocks.supplement import SupplementBlock
 from corelab_blockkit.registry import registry
 
 # Clear the registry first to avoid duplicate registrations
-registry._types = {}
+registry.clear()
 
 registry.register(TextBlock)
 registry.register(ImageBlock)
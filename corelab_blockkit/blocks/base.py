@@ -1,10 +1,24 @@
 """Base block definition for the blockkit package."""
 
+import hashlib
+import json
 import re
-from typing import Any, ClassVar, Dict, Optional, Type, TypeVar
+from functools import cached_property, lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from corelab_blockkit.exceptions import BlockValidationError
 from corelab_blockkit.meta import BlockMeta
@@ -12,6 +26,58 @@ from corelab_blockkit.meta import BlockMeta
 
 T = TypeVar("T", bound="BaseBlock")
 
+# Pattern that every block kind must match
+_KIND_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+# Kinds that are known to match _KIND_PATTERN. The registry adds every
+# registered kind, so blocks of registered types skip the pattern match.
+_known_kinds: Set[str] = set()
+
+
+def remember_kind(kind: str) -> bool:
+    """Remember a kind as valid so that later validations skip the pattern match.
+
+    Args:
+        kind: The kind to remember
+
+    Returns:
+        True if the kind is valid and was remembered, False otherwise
+    """
+    if kind in _known_kinds:
+        return True
+    if not isinstance(kind, str) or not _KIND_PATTERN.match(kind):
+        return False
+    _known_kinds.add(kind)
+    return True
+
+
+class _BlockFields(BaseModel):
+    """The standard fields of a block's dictionary form, for bulk validation."""
+
+    id: Optional[UUID] = None
+    meta: Optional[BlockMeta] = None
+
+
+_fields_adapter = TypeAdapter(List[_BlockFields])
+
+
+@lru_cache(maxsize=None)
+def _cached_properties(cls: type) -> Tuple[str, ...]:
+    """Get the names of the cached properties of a class.
+
+    Args:
+        cls: The class
+
+    Returns:
+        The names of the cached_property attributes of the class and its bases
+    """
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, cached_property)
+    )
+
 
 class BaseBlock(BaseModel):
     """Base class for all blocks.
@@ -68,7 +134,57 @@ class BaseBlock(BaseModel):
         else:
             meta = meta_data
 
-        # Create a new instance with the extracted fields
+        return cls._from_fields(id_value, meta, obj.get("kind"), payload)
+
+    @classmethod
+    def validate_many(cls: Type[T], objs: Sequence[Any]) -> List[T]:
+        """Validate and create model instances from many dictionaries at once.
+
+        This gives the same blocks as calling ``model_validate`` on every
+        dictionary, but the IDs and metadata of all of them are validated in
+        a single pass by pydantic-core.
+
+        Args:
+            objs: The dictionaries to validate and create models from
+
+        Returns:
+            The model instances, in the order of ``objs``
+        """
+        if cls.model_validate.__func__ is not BaseBlock.model_validate.__func__:
+            # A subclass with its own model_validate knows its data best
+            return [cls.model_validate(obj) for obj in objs]
+
+        for obj in objs:
+            if not isinstance(obj, dict):
+                raise ValueError(f"Expected dict, got {type(obj)}")
+
+        fields = _fields_adapter.validate_python(objs)
+        return [
+            cls._from_fields(
+                field.id, field.meta, obj.get("kind"), obj.get("payload", {})
+            )
+            for obj, field in zip(objs, fields)
+        ]
+
+    @classmethod
+    def _from_fields(
+        cls: Type[T],
+        id_value: Optional[UUID],
+        meta: Optional[BlockMeta],
+        kind: Optional[str],
+        payload: Dict[str, Any],
+    ) -> T:
+        """Create a model instance from validated standard fields and a payload.
+
+        Args:
+            id_value: The block ID (a new one is generated if None)
+            meta: The block metadata (defaults are used if None)
+            kind: The kind (only used for BaseBlock itself)
+            payload: The payload
+
+        Returns:
+            An instance of the model
+        """
         # Pass all the standard fields (id, meta) and the payload fields
         kwargs = {}
         if id_value is not None:
@@ -80,7 +196,6 @@ class BaseBlock(BaseModel):
         # For subclasses, the kind is set in the __init__ method
         # and payload fields are passed directly
         if cls is BaseBlock:
-            kind = obj.get("kind")
             if kind is not None:
                 kwargs["kind"] = kind
             if payload:
@@ -92,6 +207,108 @@ class BaseBlock(BaseModel):
 
         return cls(**kwargs)
 
+    @classmethod
+    def from_trusted(cls: Type[T], obj: Dict[str, Any]) -> T:
+        """Create a block from trusted serialized data without validating it.
+
+        This is the ``model_construct`` counterpart of ``model_validate``: the
+        ID and timestamps are converted back to their Python types, but the
+        kind, metadata and payload are not validated and the subclass
+        ``__init__`` is not called. Only use this for data produced by
+        blockkit's own serializers, where the block was validated when it was
+        first created.
+
+        Args:
+            obj: The dictionary form of a block
+
+        Returns:
+            An instance of the model
+        """
+        values: Dict[str, Any] = {
+            "kind": obj.get("kind", cls.KIND),
+            "payload": obj.get("payload", {}),
+        }
+
+        id_value = obj.get("id")
+        if id_value is not None:
+            values["id"] = UUID(id_value) if isinstance(id_value, str) else id_value
+
+        meta_data = obj.get("meta")
+        if isinstance(meta_data, dict):
+            values["meta"] = BlockMeta.from_trusted(meta_data)
+        elif meta_data is not None:
+            values["meta"] = meta_data
+
+        return cls.model_construct(**values)
+
+    @classmethod
+    def from_dict(cls: Type[T], obj: Dict[str, Any], trusted: bool = False) -> T:
+        """Create a block from its dictionary form.
+
+        This is the loader the codecs share: it validates the data with
+        ``model_validate``, or skips validation with ``from_trusted``.
+
+        Args:
+            obj: The dictionary form of a block
+            trusted: Construct the block without validating it. Only use this
+                for data produced by blockkit's own serializers.
+
+        Returns:
+            An instance of the model
+        """
+        if trusted:
+            return cls.from_trusted(obj)
+        return cls.model_validate(obj)
+
+    def fingerprint(self) -> str:
+        """Get a stable hash of the block's contents.
+
+        The hash is taken over the canonical JSON form of the block (ID,
+        kind, metadata and payload with sorted keys), so equal blocks have
+        equal fingerprints in every process. It is computed once and cached
+        on the block.
+
+        Returns:
+            The fingerprint as a hex string
+        """
+        return self._fingerprint_digest.hex()
+
+    @cached_property
+    def _fingerprint_digest(self) -> bytes:
+        """Get the raw digest behind ``fingerprint``.
+
+        Like any cached_property it lives in the instance ``__dict__``, which
+        pydantic leaves out of comparisons and serialization.
+
+        Returns:
+            The 16-byte digest of the canonical form
+        """
+        canonical = json.dumps(
+            self.model_dump(mode="json"),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+    def model_copy(
+        self: T, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> T:
+        """Copy the block, optionally with some fields replaced.
+
+        Args:
+            update: Values to change in the copy
+            deep: Whether to make a deep copy
+
+        Returns:
+            The copy (without cached properties if fields were changed)
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _cached_properties(type(copied)):
+                copied.__dict__.pop(name, None)
+        return copied
+
     @field_validator("kind")
     @classmethod
     def validate_kind(cls, value: str) -> str:
@@ -106,7 +323,9 @@ class BaseBlock(BaseModel):
         Raises:
             BlockValidationError: If the kind value is invalid
         """
-        if not re.match(r"^[a-z][a-z0-9_]*$", value):
+        if value in _known_kinds:
+            return value
+        if not _KIND_PATTERN.match(value):
             raise BlockValidationError(
                 f"Invalid kind: {value}. Must start with a lowercase letter and "
                 "contain only lowercase letters, numbers, and underscores."
@@ -1,5 +1,6 @@
 """Glossary block implementation for the blockkit package."""
 
+from functools import cached_property
 from typing import Any, ClassVar, Dict, List, Optional
 
 from pydantic import Field
@@ -65,6 +66,21 @@ class GlossaryBlock(BaseBlock):
         """
         return self.payload.get("title")
 
+    @cached_property
+    def _definitions(self) -> Dict[str, Optional[str]]:
+        """Get the definition of every term.
+
+        Blocks are immutable, so the map is built once and cached on the
+        block.
+
+        Returns:
+            A dict from each term to its first definition
+        """
+        definitions: Dict[str, Optional[str]] = {}
+        for term_dict in self.terms:
+            definitions.setdefault(term_dict.get("term"), term_dict.get("definition"))
+        return definitions
+
     def get_term(self, term: str) -> Optional[str]:
         """Get the definition for a specific term.
 
@@ -74,10 +90,7 @@ class GlossaryBlock(BaseBlock):
         Returns:
             The definition, or None if the term is not found
         """
-        for term_dict in self.terms:
-            if term_dict.get("term") == term:
-                return term_dict.get("definition")
-        return None
+        return self._definitions.get(term)
 
     def get_terms(self) -> List[str]:
         """Get a list of all terms.
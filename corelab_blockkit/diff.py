@@ -0,0 +1,173 @@
+"""Structural diffs between block lists in the blockkit package."""
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Sequence, Set, Tuple
+from uuid import UUID
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.ops import AddOp, BlockOp, MoveOp, RemoveOp, ReplaceOp
+
+if TYPE_CHECKING:
+    from corelab_blockkit.list import BlockList
+
+
+def _longest_increasing_subsequence(values: Sequence[int]) -> Set[int]:
+    """Find a longest strictly increasing subsequence.
+
+    Args:
+        values: The values to search
+
+    Returns:
+        The positions in ``values`` of the subsequence's elements
+    """
+    # tails[k] is the position of the smallest value ending a subsequence of
+    # length k + 1, and previous links every position to its predecessor
+    tails: List[int] = []
+    tail_values: List[int] = []
+    previous: List[int] = [-1] * len(values)
+    for position, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length > 0:
+            previous[position] = tails[length - 1]
+        if length == len(tails):
+            tails.append(position)
+            tail_values.append(value)
+        else:
+            tails[length] = position
+            tail_values[length] = value
+
+    result: Set[int] = set()
+    position = tails[-1] if tails else -1
+    while position != -1:
+        result.add(position)
+        position = previous[position]
+    return result
+
+
+def _moves(
+    common: List[BaseBlock], stay: Set[int], new_blocks: Sequence[BaseBlock]
+) -> List[MoveOp]:
+    """Compute the moves that put the common blocks into their new order.
+
+    Every block that is not part of ``stay`` is moved, in the new order,
+    right behind the block that precedes it in the new order. That decides
+    up front where each block ends up relative to the blocks that stay, so
+    the indices of the moves are counted with a Fenwick tree over those
+    final slots instead of by replaying the moves on a list.
+
+    Args:
+        common: The blocks in both lists, in their old order
+        stay: The positions in ``common`` of the blocks that are not moved
+        new_blocks: The blocks of the new list
+
+    Returns:
+        The moves, in the order they must be applied
+    """
+    # Integer forms of the block IDs hash much faster than UUIDs
+    old_positions = {block.id.int: i for i, block in enumerate(common)}
+
+    # Each moved block lands behind the last block that stays before it in
+    # the new order (or at the front), after the moved blocks put there first
+    moving: List[Tuple[int, UUID]] = []
+    behind: Dict[int, List[int]] = {}
+    anchor = -1
+    for block in new_blocks:
+        position = old_positions.get(block.id.int)
+        if position is None:
+            continue
+        if position in stay:
+            anchor = position
+        else:
+            moving.append((position, block.id))
+            behind.setdefault(anchor, []).append(position)
+
+    # Slots in final order: the moved blocks behind each old position follow
+    # the slot of that old position
+    old_slots: List[int] = []
+    new_slots: Dict[int, int] = {}
+    slot = 0
+    for position in range(-1, len(common)):
+        if position >= 0:
+            old_slots.append(slot)
+            slot += 1
+        for moved in behind.get(position, ()):
+            new_slots[moved] = slot
+            slot += 1
+
+    # Fenwick tree counting the blocks in the slots
+    tree = [0] * (slot + 1)
+
+    def update(index: int, delta: int) -> None:
+        index += 1
+        while index <= slot:
+            tree[index] += delta
+            index += index & -index
+
+    def count_before(index: int) -> int:
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    for old_slot in old_slots:
+        update(old_slot, 1)
+
+    moves = []
+    for position, block_id in moving:
+        update(old_slots[position], -1)
+        new_slot = new_slots[position]
+        moves.append(MoveOp(block_id=block_id, new_index=count_before(new_slot)))
+        update(new_slot, 1)
+    return moves
+
+
+def diff_block_lists(old: "BlockList", new: "BlockList") -> List[BlockOp]:
+    """Compute the operations that turn one block list into another.
+
+    Blocks are matched by ID. The result removes the blocks that are only in
+    ``old``, moves as few of the remaining blocks as possible, adds the
+    blocks that are only in ``new`` and replaces the blocks whose contents
+    changed, in that order. The blocks that keep their relative order are
+    found with a longest increasing subsequence over their new positions,
+    which gives the minimal number of moves in O(n log n).
+
+    Args:
+        old: The list to start from
+        new: The list to end with
+
+    Returns:
+        The operations, to be applied in order with ``BlockList.apply_ops``
+    """
+    old_blocks = list(old)
+    new_blocks = list(new)
+    # Integer forms of the block IDs hash much faster than UUIDs
+    new_positions: Dict[int, int] = {
+        block.id.int: position for position, block in enumerate(new_blocks)
+    }
+    old_keys = {block.id.int for block in old_blocks}
+
+    ops: List[BlockOp] = []
+    common: List[BaseBlock] = []
+    for block in old_blocks:
+        if block.id.int in new_positions:
+            common.append(block)
+        else:
+            ops.append(RemoveOp(block_id=block.id))
+
+    stay = _longest_increasing_subsequence(
+        [new_positions[block.id.int] for block in common]
+    )
+    if len(stay) < len(common):
+        ops.extend(_moves(common, stay, new_blocks))
+
+    for position, block in enumerate(new_blocks):
+        if block.id.int not in old_keys:
+            ops.append(AddOp(block=block, index=position))
+
+    for block in common:
+        new_block = new_blocks[new_positions[block.id.int]]
+        if new_block is not block and new_block != block:
+            ops.append(ReplaceOp(block=new_block))
+
+    return ops
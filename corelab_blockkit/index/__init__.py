@@ -0,0 +1,22 @@
+"""Secondary indexes over block lists for the blockkit package."""
+
+from corelab_blockkit.index.base import BlockIndex
+from corelab_blockkit.index.glossary import GlossaryEntry, GlossaryIndex
+from corelab_blockkit.index.kinds import KindIndex, KindView
+from corelab_blockkit.index.search import SearchIndex, tokenize
+from corelab_blockkit.index.tags import TagIndex, block_tags
+from corelab_blockkit.index.times import TimeIndex, timestamp_key
+
+__all__ = [
+    "BlockIndex",
+    "GlossaryEntry",
+    "GlossaryIndex",
+    "KindIndex",
+    "KindView",
+    "SearchIndex",
+    "TagIndex",
+    "TimeIndex",
+    "block_tags",
+    "timestamp_key",
+    "tokenize",
+]
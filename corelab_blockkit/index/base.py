@@ -0,0 +1,322 @@
+"""Base classes for the secondary indexes of block lists."""
+
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from uuid import UUID
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.list import Rank
+from corelab_blockkit.persistent import PersistentHashMap
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# A block together with its rank
+Entry = Tuple[Rank, BaseBlock]
+
+_EMPTY_MAP: PersistentHashMap = PersistentHashMap()
+
+_MISSING = object()
+
+
+class BlockIndex(ABC):
+    """An immutable secondary index over the blocks of a BlockList version.
+
+    A BlockList builds an index the first time it is queried and caches it.
+    When ``add``, ``remove``, ``replace`` or ``move`` derive a new version
+    from a list that has an index, the new version gets its index from
+    ``update``, which only looks at the changed block. Indexes must key
+    blocks by ID or by rank, never by position, since an insert changes the
+    positions of all later blocks but no other block's ID or rank.
+    """
+
+    @classmethod
+    @abstractmethod
+    def build(cls, entries: Iterable[Entry]) -> "BlockIndex":
+        """Build the index for the blocks of a list.
+
+        Args:
+            entries: The rank and block of every block, in list order
+
+        Returns:
+            The index
+        """
+
+    @abstractmethod
+    def update(self, removed: Optional[Entry], added: Optional[Entry]) -> "BlockIndex":
+        """Get the index of the next version of the list.
+
+        A removal passes only ``removed``, an addition only ``added``. A
+        replacement passes both with the same rank, and a move passes the
+        same block with its old and new rank.
+
+        Args:
+            removed: The rank and block that left the list
+            added: The rank and block that entered the list
+
+        Returns:
+            The updated index (``self`` if nothing changed)
+        """
+
+
+class Postings(Generic[K, V]):
+    """An immutable inverted index from keys to the blocks that contain them.
+
+    Every block has a document: a dict of the keys it contains, with a value
+    per key (such as a term frequency). The documents and postings of the
+    initial build are kept in plain dicts that are never modified. Later
+    versions record their changes in an overlay of persistent maps, which
+    queries merge in, and fold the overlay into new dicts once it grows past
+    ``OVERLAY_LIMIT`` blocks. That keeps builds at dict speed and makes an
+    edit cost O(log n) plus, every ``OVERLAY_LIMIT`` edits, one copy of the
+    changed postings.
+    """
+
+    OVERLAY_LIMIT = 1024
+
+    def __init__(
+        self,
+        docs: Dict[UUID, Dict[K, V]],
+        postings: Dict[K, Dict[UUID, V]],
+        hidden: PersistentHashMap = _EMPTY_MAP,
+        overlay: PersistentHashMap = _EMPTY_MAP,
+    ) -> None:
+        """Initialize the postings.
+
+        Args:
+            docs: The documents of the base, by block ID
+            postings: The postings of the base, by key
+            hidden: The IDs of base blocks that were removed or changed
+            overlay: The documents of blocks added or changed since the base
+        """
+        self._docs = docs
+        self._postings = postings
+        self._hidden = hidden
+        self._overlay = overlay
+
+    @classmethod
+    def build(cls, docs: Iterable[Tuple[UUID, Dict[K, V]]]) -> "Postings[K, V]":
+        """Build postings from documents.
+
+        Args:
+            docs: Pairs of block IDs and their documents. Empty documents are
+                skipped.
+
+        Returns:
+            The postings
+        """
+        base: Dict[UUID, Dict[K, V]] = {}
+        postings: Dict[K, Dict[UUID, V]] = {}
+        for block_id, doc in docs:
+            if not doc:
+                continue
+            base[block_id] = doc
+            for key, value in doc.items():
+                posting = postings.get(key)
+                if posting is None:
+                    postings[key] = {block_id: value}
+                else:
+                    posting[block_id] = value
+        return cls(base, postings)
+
+    def doc(self, block_id: UUID) -> Optional[Dict[K, V]]:
+        """Get the document of a block.
+
+        Args:
+            block_id: The ID of the block
+
+        Returns:
+            The document, or None if the block has none
+        """
+        doc = self._overlay.get(block_id)
+        if doc is None and block_id not in self._hidden:
+            doc = self._docs.get(block_id)
+        return doc
+
+    def with_doc(
+        self, block_id: UUID, doc: Optional[Dict[K, V]]
+    ) -> "Postings[K, V]":
+        """Get postings in which a block has a new document.
+
+        Args:
+            block_id: The ID of the block
+            doc: The new document, or None (or empty) to remove the block
+
+        Returns:
+            The new postings
+        """
+        hidden = self._hidden
+        if block_id in self._docs and block_id not in hidden:
+            hidden = hidden.set(block_id, True)
+        overlay = self._overlay
+        if doc:
+            overlay = overlay.set(block_id, doc)
+        elif block_id in overlay:
+            overlay = overlay.delete(block_id)
+
+        if len(overlay) + len(hidden) > self.OVERLAY_LIMIT:
+            return self._compact(hidden, overlay)
+        return type(self)(self._docs, self._postings, hidden, overlay)
+
+    def _compact(
+        self, hidden: PersistentHashMap, overlay: PersistentHashMap
+    ) -> "Postings[K, V]":
+        """Fold an overlay into new base dicts.
+
+        Only the postings of changed keys are copied; the others are shared
+        with the old base.
+
+        Args:
+            hidden: The IDs of base blocks that were removed or changed
+            overlay: The documents of blocks added or changed
+
+        Returns:
+            Postings with an empty overlay
+        """
+        docs = dict(self._docs)
+        postings = dict(self._postings)
+        copied = set()
+
+        def posting_for(key: Any) -> Dict[UUID, V]:
+            if key not in copied:
+                copied.add(key)
+                postings[key] = dict(postings.get(key, ()))
+            return postings[key]
+
+        for block_id in hidden:
+            for key in docs.pop(block_id):
+                posting = posting_for(key)
+                del posting[block_id]
+                if not posting:
+                    del postings[key]
+                    copied.discard(key)
+        for block_id, doc in overlay.items():
+            docs[block_id] = doc
+            for key, value in doc.items():
+                posting_for(key)[block_id] = value
+        return type(self)(docs, postings)
+
+    def get(self, key: K) -> Dict[UUID, V]:
+        """Get the blocks that contain a key.
+
+        The result must not be modified.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            A dict from the IDs of the blocks to their values for the key
+        """
+        posting = self._postings.get(key, {})
+        if not self._hidden and not self._overlay:
+            return posting
+        hidden = self._hidden
+        result = {
+            block_id: value
+            for block_id, value in posting.items()
+            if block_id not in hidden
+        }
+        for block_id, doc in self._overlay.items():
+            value = doc.get(key, _MISSING)
+            if value is not _MISSING:
+                result[block_id] = value
+        return result
+
+    def keys(self) -> Iterator[K]:
+        """Iterate over the keys that at least one block contains.
+
+        Returns:
+            An iterator over the keys in no particular order
+        """
+        overlay_keys = set()
+        for _, doc in self._overlay.items():
+            overlay_keys.update(doc)
+        yield from overlay_keys
+        hidden = self._hidden
+        for key, posting in self._postings.items():
+            if key in overlay_keys:
+                continue
+            if not hidden or any(block_id not in hidden for block_id in posting):
+                yield key
+
+    def __len__(self) -> int:
+        """Get the number of blocks with a document.
+
+        Returns:
+            The number of blocks
+        """
+        return len(self._docs) - len(self._hidden) + len(self._overlay)
+
+
+class PostingIndex(BlockIndex, Generic[K, V]):
+    """A block index backed by postings of a document per block.
+
+    Subclasses define ``document``, which extracts the keys of a block.
+    """
+
+    def __init__(self, postings: Postings[K, V]) -> None:
+        """Initialize the index.
+
+        Args:
+            postings: The postings of the indexed blocks
+        """
+        self._postings = postings
+
+    @classmethod
+    @abstractmethod
+    def document(cls, block: BaseBlock) -> Dict[K, V]:
+        """Extract the document of a block.
+
+        Args:
+            block: The block
+
+        Returns:
+            The keys of the block with their values (empty if the block is
+            not indexed)
+        """
+
+    @classmethod
+    def build(cls, entries: Iterable[Entry]) -> "PostingIndex[K, V]":
+        """Build the index for the blocks of a list.
+
+        Args:
+            entries: The rank and block of every block, in list order
+
+        Returns:
+            The index
+        """
+        return cls(
+            Postings.build((block.id, cls.document(block)) for _, block in entries)
+        )
+
+    def update(
+        self, removed: Optional[Entry], added: Optional[Entry]
+    ) -> "PostingIndex[K, V]":
+        """Get the index of the next version of the list.
+
+        Args:
+            removed: The rank and block that left the list
+            added: The rank and block that entered the list
+
+        Returns:
+            The updated index
+        """
+        if removed is not None and added is not None and removed[1] is added[1]:
+            # Moves do not change the documents
+            return self
+        postings = self._postings
+        if removed is not None:
+            postings = postings.with_doc(removed[1].id, None)
+        if added is not None:
+            postings = postings.with_doc(added[1].id, self.document(added[1]))
+        return type(self)(postings)
@@ -0,0 +1,202 @@
+"""A merged glossary of all glossary blocks of a block list."""
+
+from itertools import islice
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.index.base import BlockIndex, Entry, Postings
+from corelab_blockkit.list import Rank
+from corelab_blockkit.persistent import PersistentTrie
+
+# A definition in the postings: the rank of its glossary, the term as written
+# and the definition
+Definition = Tuple[Rank, str, str]
+
+
+class GlossaryEntry(NamedTuple):
+    """A term defined in a glossary block.
+
+    Attributes:
+        term: The term as written in the glossary
+        definition: The definition of the term
+        block_id: The ID of the glossary block
+    """
+
+    term: str
+    definition: str
+    block_id: UUID
+
+
+def _fold(term: str) -> str:
+    """Normalize a term for case-insensitive lookups.
+
+    Args:
+        term: The term
+
+    Returns:
+        The case-folded term without surrounding whitespace
+    """
+    return term.strip().casefold()
+
+
+class GlossaryIndex(BlockIndex):
+    """The terms of all glossary blocks of a list, merged.
+
+    Lookups ignore case. When several glossaries define a term, the one that
+    comes first in the list wins. A trie of the terms serves prefix queries
+    for autocompletion.
+    """
+
+    def __init__(
+        self, postings: Postings[str, Definition], trie: PersistentTrie
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            postings: The definitions of each case-folded term, by block ID
+            trie: The case-folded terms
+        """
+        self._postings = postings
+        self._trie = trie
+
+    @staticmethod
+    def document(rank: Rank, block: BaseBlock) -> Dict[str, Definition]:
+        """Get the definitions of a glossary block.
+
+        Args:
+            rank: The rank of the block
+            block: The block
+
+        Returns:
+            The first definition of each case-folded term in the block (empty
+            for other kinds of blocks)
+        """
+        doc: Dict[str, Definition] = {}
+        if block.kind != "glossary":
+            return doc
+        for term_dict in block.payload.get("terms", ()):
+            term = term_dict.get("term")
+            definition = term_dict.get("definition")
+            if isinstance(term, str) and isinstance(definition, str):
+                doc.setdefault(_fold(term), (rank, term, definition))
+        return doc
+
+    @classmethod
+    def build(cls, entries: Iterable[Entry]) -> "GlossaryIndex":
+        """Build the index for the blocks of a list.
+
+        Args:
+            entries: The rank and block of every block, in list order
+
+        Returns:
+            The index
+        """
+        postings = Postings.build(
+            (block.id, cls.document(rank, block)) for rank, block in entries
+        )
+        return cls(postings, PersistentTrie.from_keys(postings.keys()))
+
+    def update(
+        self, removed: Optional[Entry], added: Optional[Entry]
+    ) -> "GlossaryIndex":
+        """Get the index of the next version of the list.
+
+        Moved glossaries are indexed again, since their rank decides which
+        definition wins.
+
+        Args:
+            removed: The rank and block that left the list
+            added: The rank and block that entered the list
+
+        Returns:
+            The updated index
+        """
+        postings = self._postings
+        trie = self._trie
+        old: Dict[str, Definition] = {}
+        new: Dict[str, Definition] = {}
+        if removed is not None:
+            old = postings.doc(removed[1].id) or {}
+            if old:
+                postings = postings.with_doc(removed[1].id, None)
+        if added is not None:
+            new = self.document(*added)
+            if new:
+                postings = postings.with_doc(added[1].id, new)
+        if postings is self._postings:
+            return self
+
+        for term in new:
+            trie = trie.add(term)
+        for term in old:
+            if term not in new and not postings.get(term):
+                trie = trie.discard(term)
+        return GlossaryIndex(postings, trie)
+
+    def _entries(self, folded: str) -> List[GlossaryEntry]:
+        """Get the definitions of a case-folded term, in list order.
+
+        Args:
+            folded: The case-folded term
+
+        Returns:
+            The definitions
+        """
+        definitions = sorted(
+            self._postings.get(folded).items(), key=lambda item: item[1][0]
+        )
+        return [
+            GlossaryEntry(term, definition, block_id)
+            for block_id, (_, term, definition) in definitions
+        ]
+
+    def lookup(self, term: str) -> Optional[GlossaryEntry]:
+        """Look up a term, ignoring case.
+
+        Args:
+            term: The term
+
+        Returns:
+            The definition from the first glossary that defines the term, or
+            None if no glossary does
+        """
+        entries = self._entries(_fold(term))
+        return entries[0] if entries else None
+
+    def definitions(self, term: str) -> List[GlossaryEntry]:
+        """Look up every definition of a term, ignoring case.
+
+        Args:
+            term: The term
+
+        Returns:
+            The definitions from all glossaries, in list order
+        """
+        return self._entries(_fold(term))
+
+    def complete(self, prefix: str, limit: Optional[int] = 10) -> List[GlossaryEntry]:
+        """Find the terms that start with a prefix, ignoring case.
+
+        Args:
+            prefix: The prefix
+            limit: The maximum number of terms (None for all)
+
+        Returns:
+            The winning definition of each matching term, in alphabetical
+            order of the case-folded terms
+        """
+        terms = islice(self._trie.keys(_fold(prefix)), limit)
+        return [self._entries(folded)[0] for folded in terms]
+
+    def __contains__(self, term: object) -> bool:
+        """Check whether any glossary defines a term, ignoring case."""
+        return isinstance(term, str) and _fold(term) in self._trie
+
+    def __len__(self) -> int:
+        """Get the number of distinct terms.
+
+        Returns:
+            The number of case-folded terms
+        """
+        return len(self._trie)
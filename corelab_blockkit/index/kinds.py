@@ -0,0 +1,172 @@
+"""Per-kind views of the blocks of a block list."""
+
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.index.base import BlockIndex, Entry
+from corelab_blockkit.persistent import PersistentSortedMap
+
+T = TypeVar("T", bound=BaseBlock)
+
+_EMPTY_SEQ: PersistentSortedMap = PersistentSortedMap()
+
+
+class KindView(Generic[T]):
+    """A read-only sequence of the blocks of one kind, in list order.
+
+    The view shares the rank-ordered map of its kind with the index, so
+    creating it copies nothing, and its length is known without iterating.
+    """
+
+    __slots__ = ("_blocks", "_seq")
+
+    def __init__(self, blocks: PersistentSortedMap, seq: PersistentSortedMap) -> None:
+        """Initialize the view.
+
+        Args:
+            blocks: The blocks of the kind, by rank
+            seq: All blocks of the list, by rank
+        """
+        self._blocks = blocks
+        self._seq = seq
+
+    def positions(self) -> Iterator[int]:
+        """Iterate over the positions of the blocks in the whole list.
+
+        Returns:
+            An iterator over the list indices of the blocks, in order
+        """
+        return (self._seq.index(rank) for rank in self._blocks.keys())
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the blocks in list order."""
+        return self._blocks.values()
+
+    def __reversed__(self) -> Iterator[T]:
+        """Iterate over the blocks in reverse list order."""
+        return (block for _, block in self._blocks.items(reverse=True))
+
+    def __len__(self) -> int:
+        """Get the number of blocks of the kind."""
+        return len(self._blocks)
+
+    def __bool__(self) -> bool:
+        """Check whether the list has blocks of the kind."""
+        return len(self._blocks) > 0
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        """Get a block, or a list of blocks, by position within the view.
+
+        Args:
+            index: The position or slice
+
+        Returns:
+            The block at the position, or a list of the blocks in the slice
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._blocks)))]
+        size = len(self._blocks)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Kind view index out of range")
+        return self._blocks.item_at(index)[1]
+
+    def __repr__(self) -> str:
+        """Get a debug representation of the view."""
+        return f"KindView({list(self._blocks.values())!r})"
+
+
+class KindIndex(BlockIndex):
+    """The blocks of a list grouped by kind, each group ordered by rank."""
+
+    def __init__(self, kinds: Dict[str, PersistentSortedMap]) -> None:
+        """Initialize the index.
+
+        Args:
+            kinds: The blocks of each kind in the list, by rank
+        """
+        self._kinds = kinds
+
+    @classmethod
+    def build(cls, entries: Iterable[Entry]) -> "KindIndex":
+        """Build the index for the blocks of a list.
+
+        Args:
+            entries: The rank and block of every block, in list order
+
+        Returns:
+            The index
+        """
+        groups: Dict[str, List[Entry]] = {}
+        for entry in entries:
+            groups.setdefault(entry[1].kind, []).append(entry)
+        return cls(
+            {
+                kind: PersistentSortedMap.from_sorted_items(group)
+                for kind, group in groups.items()
+            }
+        )
+
+    def update(self, removed: Optional[Entry], added: Optional[Entry]) -> "KindIndex":
+        """Get the index of the next version of the list.
+
+        Args:
+            removed: The rank and block that left the list
+            added: The rank and block that entered the list
+
+        Returns:
+            The updated index
+        """
+        # Copying the dict costs one entry per kind, of which there are few
+        kinds = dict(self._kinds)
+        if removed is not None:
+            rank, block = removed
+            blocks = kinds[block.kind].delete(rank)
+            if blocks:
+                kinds[block.kind] = blocks
+            else:
+                del kinds[block.kind]
+        if added is not None:
+            rank, block = added
+            kinds[block.kind] = kinds.get(block.kind, _EMPTY_SEQ).set(rank, block)
+        return KindIndex(kinds)
+
+    def view(self, kind: str, seq: PersistentSortedMap) -> KindView:
+        """Get a view of the blocks of a kind.
+
+        Args:
+            kind: The kind
+            seq: All blocks of the list, by rank
+
+        Returns:
+            The view (empty if the list has no blocks of the kind)
+        """
+        return KindView(self._kinds.get(kind, _EMPTY_SEQ), seq)
+
+    def counts(self) -> Dict[str, int]:
+        """Count the blocks of every kind.
+
+        Returns:
+            The number of blocks per kind, for the kinds in the list
+        """
+        return {kind: len(blocks) for kind, blocks in self._kinds.items()}
@@ -0,0 +1,213 @@
+"""Full-text search over the text-bearing blocks of a block list."""
+
+import heapq
+import math
+import re
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.index.base import Entry, PostingIndex, Postings
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# BM25 parameters: term frequency saturation and length normalization
+_K1 = 1.2
+_B = 0.75
+
+# Payload fields with searchable text, by block kind
+_TEXT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "text": ("text",),
+    "quote": ("text", "source"),
+    "supplement": ("title", "content"),
+    "glossary": ("title",),
+}
+
+# A term's posting value: its frequency in the block and the block's length
+Posting = Tuple[int, int]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms.
+
+    Args:
+        text: The text to split
+
+    Returns:
+        The words of the text, case-folded, in order
+    """
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+def searchable_text(block: BaseBlock) -> Iterator[str]:
+    """Get the searchable text of a block.
+
+    That is the text of text and quote blocks (and a quote's source), the
+    title and content of supplements, and the title, terms and definitions
+    of glossaries. Other blocks have no searchable text.
+
+    Args:
+        block: The block
+
+    Returns:
+        An iterator over the text fields of the block
+    """
+    payload = block.payload
+    for field in _TEXT_FIELDS.get(block.kind, ()):
+        value = payload.get(field)
+        if isinstance(value, str):
+            yield value
+    if block.kind == "glossary":
+        for term in payload.get("terms", ()):
+            for field in ("term", "definition"):
+                value = term.get(field)
+                if isinstance(value, str):
+                    yield value
+
+
+def _length(doc: Optional[Dict[str, Posting]]) -> int:
+    """Get the number of terms of a block from its document.
+
+    Args:
+        doc: The document of the block
+
+    Returns:
+        The number of terms
+    """
+    if not doc:
+        return 0
+    return next(iter(doc.values()))[1]
+
+
+class SearchIndex(PostingIndex[str, Posting]):
+    """An inverted index of the words in the text-bearing blocks of a list.
+
+    Queries are ranked with BM25, so blocks that contain rare query terms,
+    or contain the terms often relative to their length, come first.
+    """
+
+    def __init__(self, postings: Postings[str, Posting], total_length: int) -> None:
+        """Initialize the index.
+
+        Args:
+            postings: The postings of the indexed blocks
+            total_length: The number of terms in all indexed blocks
+        """
+        super().__init__(postings)
+        self._total_length = total_length
+
+    @classmethod
+    def document(cls, block: BaseBlock) -> Dict[str, Posting]:
+        """Count the terms of a block.
+
+        Args:
+            block: The block
+
+        Returns:
+            The frequency of every term in the block, paired with the
+            number of terms in the block
+        """
+        counts: Counter = Counter()
+        for text in searchable_text(block):
+            counts.update(tokenize(text))
+        length = sum(counts.values())
+        return {term: (count, length) for term, count in counts.items()}
+
+    @classmethod
+    def build(cls, entries: Iterable[Entry]) -> "SearchIndex":
+        """Build the index for the blocks of a list.
+
+        Args:
+            entries: The rank and block of every block, in list order
+
+        Returns:
+            The index
+        """
+        docs = [(block.id, cls.document(block)) for _, block in entries]
+        total = sum(_length(doc) for _, doc in docs)
+        return cls(Postings.build(docs), total)
+
+    def update(self, removed: Optional[Entry], added: Optional[Entry]) -> "SearchIndex":
+        """Get the index of the next version of the list.
+
+        Args:
+            removed: The rank and block that left the list
+            added: The rank and block that entered the list
+
+        Returns:
+            The updated index
+        """
+        if removed is not None and added is not None and removed[1] is added[1]:
+            # Moves do not change the text
+            return self
+        postings = self._postings
+        total = self._total_length
+        if removed is not None:
+            total -= _length(postings.doc(removed[1].id))
+            postings = postings.with_doc(removed[1].id, None)
+        if added is not None:
+            doc = self.document(added[1])
+            total += _length(doc)
+            postings = postings.with_doc(added[1].id, doc)
+        return SearchIndex(postings, total)
+
+    def search(
+        self, query: str, limit: Optional[int] = 10, require_all: bool = False
+    ) -> List[UUID]:
+        """Find the blocks that best match a query.
+
+        Args:
+            query: The words to search for
+            limit: The maximum number of results (None for all matches)
+            require_all: Only match blocks that contain every query term,
+                instead of any of them
+
+        Returns:
+            The IDs of the matching blocks, best match first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        count = len(self._postings)
+        if not terms or not count:
+            return []
+
+        postings = [self._postings.get(term) for term in terms]
+        candidates: Optional[Set[UUID]] = None
+        if require_all:
+            if not all(postings):
+                return []
+            smallest, *others = sorted(postings, key=len)
+            candidates = {
+                block_id
+                for block_id in smallest
+                if all(block_id in posting for posting in others)
+            }
+
+        average = self._total_length / count
+        scores: Dict[UUID, float] = {}
+        for posting in postings:
+            frequency = len(posting)
+            if not frequency:
+                continue
+            idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            for block_id, (tf, length) in posting.items():
+                if candidates is not None and block_id not in candidates:
+                    continue
+                norm = _K1 * (1 - _B + _B * length / average)
+                score = idf * tf * (_K1 + 1) / (tf + norm)
+                scores[block_id] = scores.get(block_id, 0.0) + score
+
+        if limit is None:
+            ranked = sorted(scores.items(), key=itemgetter(1), reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [block_id for block_id, _ in ranked]
+
+    def __len__(self) -> int:
+        """Get the number of indexed blocks.
+
+        Returns:
+            The number of blocks with searchable text
+        """
+        return len(self._postings)
@@ -0,0 +1,115 @@
+"""Tag and favorite filtering over the blocks of a block list."""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+from uuid import UUID
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.index.base import PostingIndex
+
+# The key of favorite blocks in the postings; tags are always strings
+_FAVORITE = None
+
+
+def block_tags(block: BaseBlock) -> List[str]:
+    """Get the tags of a block.
+
+    That is the tags in the block's metadata and, for supplements, the tags
+    in the payload.
+
+    Args:
+        block: The block
+
+    Returns:
+        The tags of the block, without duplicates
+    """
+    tags = list(block.meta.tags)
+    if block.kind == "supplement":
+        payload_tags = block.payload.get("tags")
+        if isinstance(payload_tags, list):
+            tags.extend(payload_tags)
+    return list(dict.fromkeys(tags))
+
+
+class TagIndex(PostingIndex[Hashable, bool]):
+    """An index of the tagged and favorite blocks of a list."""
+
+    @classmethod
+    def document(cls, block: BaseBlock) -> Dict[Hashable, bool]:
+        """Get the tags of a block, and whether it is a favorite.
+
+        Args:
+            block: The block
+
+        Returns:
+            A dict with the tags of the block as keys
+        """
+        doc: Dict[Hashable, bool] = dict.fromkeys(block_tags(block), True)
+        if block.meta.is_favorite:
+            doc[_FAVORITE] = True
+        return doc
+
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        favorite: Optional[bool] = None,
+        universe: Optional[Iterable[UUID]] = None,
+    ) -> Set[UUID]:
+        """Find the blocks that match a combination of tags.
+
+        Args:
+            all_of: Tags that a block must all have
+            any_of: Tags of which a block must have at least one
+            none_of: Tags that a block must not have
+            favorite: Only match favorite (True) or other (False) blocks
+            universe: The IDs of all blocks of the list, which a query that
+                only excludes blocks starts from
+
+        Returns:
+            The IDs of the matching blocks
+
+        Raises:
+            ValueError: If the query only excludes blocks and no universe is
+                given
+        """
+        required = [self._postings.get(tag) for tag in all_of]
+        if favorite:
+            required.append(self._postings.get(_FAVORITE))
+        any_of = list(any_of)
+
+        matches: Optional[Set[UUID]] = None
+        if required:
+            smallest, *others = sorted(required, key=len)
+            matches = {
+                block_id
+                for block_id in smallest
+                if all(block_id in posting for posting in others)
+            }
+        if any_of:
+            alternatives: Set[UUID] = set()
+            for tag in any_of:
+                alternatives.update(self._postings.get(tag))
+            matches = alternatives if matches is None else matches & alternatives
+        if matches is None:
+            if universe is None:
+                raise ValueError("A query without tags to match needs a universe")
+            matches = set(universe)
+
+        for tag in none_of:
+            matches.difference_update(self._postings.get(tag))
+        if favorite is False:
+            matches.difference_update(self._postings.get(_FAVORITE))
+        return matches
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Count the blocks that have each tag.
+
+        Returns:
+            The number of blocks per tag, for every tag in use
+        """
+        return {
+            tag: len(self._postings.get(tag))
+            for tag in self._postings.keys()
+            if tag is not _FAVORITE
+        }
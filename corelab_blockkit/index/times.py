@@ -0,0 +1,152 @@
+"""Time-range queries over the metadata timestamps of a block list."""
+
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.index.base import BlockIndex, Entry
+from corelab_blockkit.list import Rank
+from corelab_blockkit.persistent import PersistentSortedMap
+
+# The timestamp fields of BlockMeta that are indexed
+FIELDS = ("created_at", "updated_at")
+
+# A key in the sorted maps: the timestamp as seconds since the epoch, and the
+# rank of the block to keep keys unique and ties in list order
+TimeKey = Tuple[float, Rank]
+
+
+def timestamp_key(value: datetime) -> float:
+    """Get a sort key for a timestamp that orders naive and aware ones alike.
+
+    Naive timestamps are taken as local time, like ``datetime.now()`` (the
+    default of BlockMeta) returns them.
+
+    Args:
+        value: The timestamp
+
+    Returns:
+        The timestamp as seconds since the epoch
+    """
+    return value.timestamp()
+
+
+class TimeIndex(BlockIndex):
+    """The blocks of a list sorted by creation time and by update time."""
+
+    def __init__(
+        self, created: PersistentSortedMap, updated: PersistentSortedMap
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            created: The blocks by creation time key
+            updated: The blocks by update time key
+        """
+        self._maps = {"created_at": created, "updated_at": updated}
+
+    @staticmethod
+    def _key(field: str, rank: Rank, block: BaseBlock) -> TimeKey:
+        """Get the key of a block in the map of a field.
+
+        Args:
+            field: "created_at" or "updated_at"
+            rank: The rank of the block
+            block: The block
+
+        Returns:
+            The key
+        """
+        return timestamp_key(getattr(block.meta, field)), rank
+
+    @classmethod
+    def build(cls, entries: Iterable[Entry]) -> "TimeIndex":
+        """Build the index for the blocks of a list.
+
+        Args:
+            entries: The rank and block of every block, in list order
+
+        Returns:
+            The index
+        """
+        entries = list(entries)
+        maps = [
+            PersistentSortedMap.from_sorted_items(
+                sorted((cls._key(field, rank, block), block) for rank, block in entries)
+            )
+            for field in FIELDS
+        ]
+        return cls(*maps)
+
+    def update(self, removed: Optional[Entry], added: Optional[Entry]) -> "TimeIndex":
+        """Get the index of the next version of the list.
+
+        Args:
+            removed: The rank and block that left the list
+            added: The rank and block that entered the list
+
+        Returns:
+            The updated index
+        """
+        maps = []
+        for field in FIELDS:
+            blocks = self._maps[field]
+            if removed is not None:
+                blocks = blocks.delete(self._key(field, *removed))
+            if added is not None:
+                blocks = blocks.set(self._key(field, *added), added[1])
+            maps.append(blocks)
+        return TimeIndex(*maps)
+
+    def _blocks(self, field: str) -> PersistentSortedMap:
+        """Get the sorted map of a field.
+
+        Args:
+            field: "created_at" or "updated_at"
+
+        Returns:
+            The map
+
+        Raises:
+            ValueError: If the field is not a timestamp field
+        """
+        blocks = self._maps.get(field)
+        if blocks is None:
+            raise ValueError(f"Unknown timestamp field: {field!r}")
+        return blocks
+
+    def between(
+        self,
+        field: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[BaseBlock]:
+        """Iterate over the blocks with a timestamp in ``[start, end)``.
+
+        Args:
+            field: "created_at" or "updated_at"
+            start: Inclusive lower bound (unbounded if None)
+            end: Exclusive upper bound (unbounded if None)
+
+        Returns:
+            An iterator over the blocks, oldest first, with equal timestamps
+            in list order
+        """
+        minimum = (timestamp_key(start),) if start is not None else None
+        maximum = (timestamp_key(end),) if end is not None else None
+        items = self._blocks(field).irange(minimum, maximum)
+        return (block for _, block in items)
+
+    def latest(self, field: str, count: int) -> List[BaseBlock]:
+        """Get the blocks with the latest timestamps.
+
+        Args:
+            field: "created_at" or "updated_at"
+            count: The maximum number of blocks
+
+        Returns:
+            The blocks, newest first
+        """
+        items = self._blocks(field).items(reverse=True)
+        return [block for _, block in islice(items, max(count, 0))]
@@ -0,0 +1,220 @@
+"""Lazily validated block lists for the blockkit package."""
+
+from typing import Any, Dict, Iterator, List, Optional, Union
+from uuid import UUID
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.exceptions import (
+    BlockDuplicateError,
+    BlockNotFoundError,
+    SerializationError,
+)
+from corelab_blockkit.list import BlockList
+from corelab_blockkit.registry import registry
+
+
+class LazyBlockList:
+    """A read-only block list that validates its blocks on first access.
+
+    The list keeps the raw dictionaries of a decoded document and only turns
+    a dictionary into a block when that block is read, so reading a few
+    blocks of a large document does not pay for validating all of them. Each
+    block is validated at most once.
+
+    Use ``to_block_list`` to get a regular BlockList for editing.
+    """
+
+    def __init__(self, blocks_data: List[Any], trusted: bool = False) -> None:
+        """Initialize a lazy block list.
+
+        Args:
+            blocks_data: The dictionary forms of the blocks
+            trusted: Construct blocks without validating them (only for
+                output of blockkit's own serializers)
+
+        Raises:
+            SerializationError: If a block has no kind
+        """
+        for block_data in blocks_data:
+            if not isinstance(block_data, dict) or "kind" not in block_data:
+                raise SerializationError("Invalid block data: missing 'kind' field")
+
+        self._raw: List[Optional[Dict[str, Any]]] = list(blocks_data)
+        self._blocks: List[Optional[BaseBlock]] = [None] * len(self._raw)
+        self._trusted = trusted
+        self._positions: Optional[Dict[UUID, int]] = None
+
+    def _load(self, index: int) -> BaseBlock:
+        """Get the block at a position, validating it on first access.
+
+        Args:
+            index: The non-negative position of the block
+
+        Returns:
+            The block
+
+        Raises:
+            SerializationError: If the block cannot be created
+        """
+        block = self._blocks[index]
+        if block is not None:
+            return block
+
+        block_data: Dict[str, Any] = self._raw[index]  # type: ignore[assignment]
+        kind = block_data["kind"]
+        try:
+            block = registry.get(kind).from_dict(block_data, self._trusted)
+        except Exception as e:
+            raise SerializationError(
+                f"Failed to deserialize block of kind '{kind}': {e}"
+            ) from e
+
+        self._blocks[index] = block
+        # The block replaces its raw form
+        self._raw[index] = None
+        return block
+
+    def _position_map(self) -> Dict[UUID, int]:
+        """Get the positions of the blocks by ID.
+
+        IDs are read from the raw dictionaries without validating the blocks.
+        Only blocks without a usable ID string are validated here.
+
+        Returns:
+            A dictionary mapping block IDs to positions
+
+        Raises:
+            BlockDuplicateError: If two blocks have the same ID
+            SerializationError: If a block without an ID string cannot be
+                created
+        """
+        if self._positions is None:
+            positions: Dict[UUID, int] = {}
+            for index, block_data in enumerate(self._raw):
+                block_id = None
+                if block_data is not None and isinstance(block_data.get("id"), str):
+                    try:
+                        block_id = UUID(block_data["id"])
+                    except ValueError:
+                        pass
+                if block_id is None:
+                    block_id = self._load(index).id
+
+                if block_id in positions:
+                    raise BlockDuplicateError(f"Duplicate block ID: {block_id}")
+                positions[block_id] = index
+            self._positions = positions
+        return self._positions
+
+    def ids(self) -> List[UUID]:
+        """Get the IDs of the blocks without validating the blocks.
+
+        Returns:
+            The block IDs in list order
+        """
+        return list(self._position_map())
+
+    def find_by_id(self, block_id: UUID) -> BaseBlock:
+        """Find a block by its ID.
+
+        Args:
+            block_id: The ID of the block to find
+
+        Returns:
+            The block with the specified ID
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+        """
+        return self._load(self.index_of(block_id))
+
+    def index_of(self, block_id: UUID) -> int:
+        """Get the position of a block by its ID.
+
+        Args:
+            block_id: The ID of the block to look up
+
+        Returns:
+            The index of the block in the list
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+        """
+        index = self._position_map().get(block_id)
+        if index is None:
+            raise BlockNotFoundError(f"Block with ID {block_id} not found")
+        return index
+
+    def to_block_list(self) -> BlockList:
+        """Validate all remaining blocks and build a regular block list.
+
+        Returns:
+            A BlockList with the same blocks
+        """
+        return BlockList.model_construct(blocks=list(self))
+
+    @property
+    def loaded(self) -> int:
+        """Get the number of blocks that have been validated so far.
+
+        Returns:
+            The number of validated blocks
+        """
+        return sum(block is not None for block in self._blocks)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with another block list block by block.
+
+        Args:
+            other: The object to compare with
+
+        Returns:
+            True if both lists hold equal blocks in the same order
+        """
+        if not isinstance(other, (BlockList, LazyBlockList)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __iter__(self) -> Iterator[BaseBlock]:
+        """Iterate over the blocks in the list.
+
+        Returns:
+            An iterator over the blocks
+        """
+        return (self._load(index) for index in range(len(self._blocks)))
+
+    def __len__(self) -> int:
+        """Get the number of blocks in the list.
+
+        Returns:
+            The number of blocks
+        """
+        return len(self._blocks)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Get a block by index.
+
+        Args:
+            index: The index of the block to get (or a slice of indices)
+
+        Returns:
+            The block at the specified index (or a list of blocks for a slice)
+        """
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self._blocks)))]
+        size = len(self._blocks)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("LazyBlockList index out of range")
+        return self._load(index)
+
+    def __repr__(self) -> str:
+        """Get a short description of the list.
+
+        Returns:
+            The number of blocks and how many of them are validated
+        """
+        return f"LazyBlockList(len={len(self)}, loaded={self.loaded})"
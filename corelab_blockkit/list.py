@@ -1,14 +1,183 @@
 """Block list implementation for the blockkit package."""
 
-from typing import Any, Dict, Iterator, List, Optional, TypeVar, cast
+import hashlib
+from concurrent.futures import Executor
+from datetime import datetime
+from functools import cached_property
+from operator import itemgetter
+from types import TracebackType
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, computed_field
 
 from corelab_blockkit.blocks.base import BaseBlock
 from corelab_blockkit.exceptions import BlockDuplicateError, BlockNotFoundError
+from corelab_blockkit.ops import AddOp, BlockOp, MoveOp, RemoveOp, ReplaceOp
+from corelab_blockkit.persistent import PersistentHashMap, PersistentSortedMap
+
+if TYPE_CHECKING:
+    from corelab_blockkit.index.base import BlockIndex
+    from corelab_blockkit.index.glossary import GlossaryIndex
+    from corelab_blockkit.index.kinds import KindView
+    from corelab_blockkit.lazy import LazyBlockList
 
 T = TypeVar("T", bound=BaseBlock)
+I = TypeVar("I", bound="BlockIndex")
+
+# Ranks are tuples of ints compared lexicographically. There is always room
+# for another rank between two neighbours, so inserts never renumber the list.
+Rank = Tuple[int, ...]
+
+# Distance between the ranks of neighbouring blocks in a freshly built list
+_RANK_GAP = 1 << 32
+
+# Relabel the whole list once ranks get this long (only after pathological
+# edit patterns that keep squeezing blocks between the same two neighbours)
+_MAX_RANK_DEPTH = 8
+
+_block_adapter = TypeAdapter(BaseBlock)
+_blocks_adapter = TypeAdapter(List[BaseBlock])
+
+
+def _initial_rank(position: int) -> Rank:
+    """Get the rank of a position in a freshly built list.
+
+    Args:
+        position: The position of the block
+
+    Returns:
+        An evenly spaced rank
+    """
+    return (position * _RANK_GAP,)
+
+
+def _rank_between(low: Optional[Rank], high: Optional[Rank]) -> Rank:
+    """Pick a rank strictly between two ranks.
+
+    Args:
+        low: The rank of the previous block (None at the start of the list)
+        high: The rank of the next block (None at the end of the list)
+
+    Returns:
+        A rank greater than ``low`` and less than ``high``
+    """
+    if low is None:
+        return (0,) if high is None else (high[0] - _RANK_GAP,)
+    if high is None:
+        return (low[0] + _RANK_GAP,)
+
+    i = 0
+    while low[i] == high[i]:
+        i += 1
+        if i == len(low):
+            # low is a prefix of high, so extend it with a digit below high's
+            return high[:i] + (high[i] - _RANK_GAP,)
+
+    if high[i] - low[i] >= 2:
+        return low[:i] + ((low[i] + high[i]) // 2,)
+    if i + 1 < len(low):
+        return low[: i + 1] + (low[i + 1] + _RANK_GAP,)
+    return low + (0,)
+
+
+def _build_seq(blocks: List[BaseBlock]) -> PersistentSortedMap:
+    """Build the rank-ordered block map for a list of blocks.
+
+    Args:
+        blocks: The blocks in list order
+
+    Returns:
+        A map from evenly spaced ranks to blocks
+    """
+    return PersistentSortedMap.from_sorted_items(
+        (_initial_rank(i), block) for i, block in enumerate(blocks)
+    )
+
+
+def _index_blocks(
+    blocks: List[BaseBlock],
+) -> Tuple[PersistentSortedMap, Dict[UUID, Tuple[Rank, BaseBlock]]]:
+    """Build the rank-ordered block map and ID index for a list of blocks.
+
+    Args:
+        blocks: The blocks in list order
+
+    Returns:
+        The rank-ordered block map and a dict from block IDs to (rank, block)
+
+    Raises:
+        BlockDuplicateError: If two blocks have the same ID
+    """
+    ids: Dict[UUID, Tuple[Rank, BaseBlock]] = {}
+    for i, block in enumerate(blocks):
+        if block.id in ids:
+            raise BlockDuplicateError(f"Duplicate block ID: {block.id}")
+        ids[block.id] = (_initial_rank(i), block)
+
+    return PersistentSortedMap.from_sorted_items(ids.values()), ids
+
+
+def _build_ids(seq: PersistentSortedMap) -> PersistentHashMap:
+    """Build the ID index for a rank-ordered block map.
+
+    Args:
+        seq: The rank-ordered block map
+
+    Returns:
+        A map from block IDs to (rank, block) pairs
+    """
+    return PersistentHashMap.from_dict(
+        {block.id: (rank, block) for rank, block in seq.items()}
+    )
+
+
+def _insert_at(
+    seq: PersistentSortedMap,
+    ids: PersistentHashMap,
+    index: int,
+    block: BaseBlock,
+) -> Tuple[PersistentSortedMap, PersistentHashMap, bool]:
+    """Insert a block at a position of a rank-ordered block map.
+
+    The new block gets a rank between the ranks of its neighbours, so no
+    other block changes its rank, unless the ranks have grown too long and
+    the whole map is relabelled.
+
+    Args:
+        seq: The rank-ordered block map
+        ids: The ID index for ``seq``
+        index: The position to insert at (0 <= index <= len(seq))
+        block: The block to insert
+
+    Returns:
+        The new block map and ID index with the block inserted, and whether
+        the map was relabelled
+    """
+    low = seq.item_at(index - 1)[0] if index > 0 else None
+    high = seq.item_at(index)[0] if index < len(seq) else None
+    rank = _rank_between(low, high)
+    if len(rank) > _MAX_RANK_DEPTH:
+        seq = _build_seq(list(seq.values()))
+        seq, ids, _ = _insert_at(seq, _build_ids(seq), index, block)
+        return seq, ids, True
+    return seq.set(rank, block), ids.set(block.id, (rank, block)), False
 
 
 class BlockList(BaseModel):
@@ -16,28 +185,176 @@ class BlockList(BaseModel):
 
     This class provides methods for adding, removing, moving, and finding blocks.
     It also provides methods for serialization and deserialization.
-    """
 
-    blocks: List[BaseBlock] = Field(default_factory=list)
+    Blocks are stored in a persistent sorted map keyed by an order rank, so
+    ``add``, ``remove`` and ``move`` share structure with the previous version
+    and only do O(log n) work instead of copying and revalidating the list.
+    An ID index maps each block ID to its rank, which makes ``find_by_id``
+    and duplicate checks constant-time. A freshly constructed list keeps the
+    plain dict it built for the duplicate check and only converts it to a
+    persistent hash map when the first new version is derived from it.
+    """
 
     model_config = {
         "frozen": True,  # Make the model immutable (PEP 681)
     }
 
+    _seq: PersistentSortedMap = PrivateAttr(default_factory=PersistentSortedMap)
+    _ids: Union[Dict[UUID, Tuple[Rank, BaseBlock]], PersistentHashMap] = PrivateAttr(
+        default_factory=PersistentHashMap
+    )
+
     def __init__(self, blocks: Optional[List[BaseBlock]] = None) -> None:
         """Initialize a block list.
 
         Args:
             blocks: Optional list of blocks to initialize with
         """
-        super().__init__(blocks=blocks or [])
+        super().__init__()
+        validated = _blocks_adapter.validate_python(blocks or [])
+
+        self._seq, self._ids = _index_blocks(validated)
+
+    @classmethod
+    def _from_seq(
+        cls,
+        seq: PersistentSortedMap,
+        ids: Union[Dict[UUID, Tuple[Rank, BaseBlock]], PersistentHashMap],
+    ) -> "BlockList":
+        """Create a block list from an already checked rank-ordered block map.
 
-        # Verify that all block IDs are unique
-        id_set: Dict[UUID, bool] = {}
-        for block in self.blocks:
-            if block.id in id_set:
-                raise BlockDuplicateError(f"Duplicate block ID: {block.id}")
-            id_set[block.id] = True
+        Args:
+            seq: The rank-ordered block map
+            ids: The ID index for ``seq``
+
+        Returns:
+            A new BlockList sharing the given map and index
+        """
+        block_list = BlockList.model_construct()
+        block_list._seq = seq
+        block_list._ids = ids
+        return block_list
+
+    @classmethod
+    def model_construct(
+        cls, _fields_set: Optional[set] = None, **values: Any
+    ) -> "BlockList":
+        """Create a block list from trusted blocks without validating them.
+
+        Unlike the constructor, the blocks are not checked to be BaseBlock
+        instances. Use this for blocks that were just validated, for example
+        by a codec or by another BlockList. Block IDs are still checked for
+        uniqueness, since the ID index depends on it.
+
+        Args:
+            _fields_set: Ignored, accepted for compatibility with pydantic
+            **values: Optional ``blocks`` to initialize with
+
+        Returns:
+            A new BlockList
+
+        Raises:
+            BlockDuplicateError: If two blocks have the same ID
+        """
+        block_list = super().model_construct()
+        blocks = values.get("blocks")
+        if blocks:
+            block_list._seq, block_list._ids = _index_blocks(list(blocks))
+        return block_list
+
+    def _derive(
+        self,
+        seq: PersistentSortedMap,
+        ids: PersistentHashMap,
+        removed: Optional[Tuple[Rank, BaseBlock]] = None,
+        added: Optional[Tuple[Rank, BaseBlock]] = None,
+        relabelled: bool = False,
+    ) -> "BlockList":
+        """Create the next version of this list after a single edit.
+
+        The secondary indexes built on this list are updated for the edit
+        and carried over, unless the edit relabelled the ranks of all blocks.
+
+        Args:
+            seq: The rank-ordered block map of the new version
+            ids: The ID index for ``seq``
+            removed: The rank and block that left the list
+            added: The rank and block that entered the list
+            relabelled: Whether the ranks of all blocks changed
+
+        Returns:
+            The new BlockList
+        """
+        block_list = BlockList._from_seq(seq, ids)
+        indexes = self.__dict__.get("_indexes")
+        if indexes and not relabelled:
+            block_list.__dict__["_indexes"] = {
+                index_type: index.update(removed, added)
+                for index_type, index in indexes.items()
+            }
+        return block_list
+
+    def _index(self, index_type: Type[I]) -> I:
+        """Get a secondary index of this version, building it on first use.
+
+        Built indexes live in the instance ``__dict__``, which pydantic
+        leaves out of comparisons and serialization.
+
+        Args:
+            index_type: The class of the index
+
+        Returns:
+            The index
+        """
+        indexes = self.__dict__.setdefault("_indexes", {})
+        index = indexes.get(index_type)
+        if index is None:
+            index = indexes[index_type] = index_type.build(self._seq.items())
+        return cast(I, index)
+
+    def _persistent_ids(self) -> PersistentHashMap:
+        """Get the ID index as a persistent hash map.
+
+        The conversion from the constructor's dict happens once per list and
+        is then shared by every version derived from it.
+
+        Returns:
+            The ID index
+        """
+        ids = self._ids
+        if isinstance(ids, dict):
+            ids = PersistentHashMap.from_dict(ids)
+            self._ids = ids
+        return ids
+
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> "BlockList":
+        """Validate and create a block list from a dictionary.
+
+        Args:
+            obj: A BlockList or a dictionary with a "blocks" key
+            **kwargs: Ignored, accepted for compatibility with pydantic
+
+        Returns:
+            A BlockList instance
+        """
+        if isinstance(obj, BlockList):
+            return obj
+        if not isinstance(obj, dict):
+            raise ValueError(f"Expected dict, got {type(obj)}")
+        return cls(blocks=obj.get("blocks"))
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def blocks(self) -> List[BaseBlock]:
+        """Get the blocks as a plain list.
+
+        The list is built on first access and cached on this version.
+
+        Returns:
+            The blocks in list order
+        """
+        return list(self._seq.values())
 
     def add(self, block: BaseBlock, index: Optional[int] = None) -> "BlockList":
         """Add a block to the list.
@@ -53,22 +370,25 @@ class BlockList(BaseModel):
             BlockDuplicateError: If a block with the same ID already exists
             ValueError: If the index is out of range
         """
+        block = _block_adapter.validate_python(block)
+
         # Check for duplicate ID
-        if any(b.id == block.id for b in self.blocks):
+        if block.id in self._ids:
             raise BlockDuplicateError(f"Block with ID {block.id} already exists")
 
-        # Create a new list of blocks
-        new_blocks = list(self.blocks)
-
-        # Insert or append the block
+        size = len(self._seq)
         if index is not None:
-            if index < 0 or index > len(new_blocks):
-                raise ValueError(f"Index {index} out of range (0-{len(new_blocks)})")
-            new_blocks.insert(index, block)
+            if index < 0 or index > size:
+                raise ValueError(f"Index {index} out of range (0-{size})")
         else:
-            new_blocks.append(block)
+            index = size
 
-        return BlockList(blocks=new_blocks)
+        seq, ids, relabelled = _insert_at(
+            self._seq, self._persistent_ids(), index, block
+        )
+        return self._derive(
+            seq, ids, added=ids.get(block.id), relabelled=relabelled
+        )
 
     def remove(self, block_id: UUID) -> "BlockList":
         """Remove a block from the list.
@@ -82,13 +402,15 @@ class BlockList(BaseModel):
         Raises:
             BlockNotFoundError: If the block is not found
         """
-        for i, block in enumerate(self.blocks):
-            if block.id == block_id:
-                new_blocks = list(self.blocks)
-                new_blocks.pop(i)
-                return BlockList(blocks=new_blocks)
+        entry = self._ids.get(block_id)
+        if entry is None:
+            raise BlockNotFoundError(f"Block with ID {block_id} not found")
 
-        raise BlockNotFoundError(f"Block with ID {block_id} not found")
+        return self._derive(
+            self._seq.delete(entry[0]),
+            self._persistent_ids().delete(block_id),
+            removed=entry,
+        )
 
     def move(self, block_id: UUID, new_index: int) -> "BlockList":
         """Move a block to a new position in the list.
@@ -105,35 +427,323 @@ class BlockList(BaseModel):
             ValueError: If the new index is out of range
         """
         # Find the block
-        block_index = None
-        for i, block in enumerate(self.blocks):
-            if block.id == block_id:
-                block_index = i
-                break
-
-        if block_index is None:
+        entry = self._ids.get(block_id)
+        if entry is None:
             raise BlockNotFoundError(f"Block with ID {block_id} not found")
+        rank, block = entry
+        block_index = self._seq.index(rank)
 
         # Check if the new index is valid
-        if new_index < 0 or new_index >= len(self.blocks):
-            raise ValueError(
-                f"Index {new_index} out of range (0-{len(self.blocks) - 1})"
-            )
+        size = len(self._seq)
+        if new_index < 0 or new_index >= size:
+            raise ValueError(f"Index {new_index} out of range (0-{size - 1})")
 
         # If the block is already at the desired index, return the same list
         if block_index == new_index:
             return self
 
-        # Create a new list of blocks
-        new_blocks = list(self.blocks)
+        # Remove the block from its current position and insert it at the new one
+        seq, ids, relabelled = _insert_at(
+            self._seq.delete(rank), self._persistent_ids(), new_index, block
+        )
+        return self._derive(
+            seq, ids, removed=entry, added=ids.get(block_id), relabelled=relabelled
+        )
+
+    def replace(self, block: BaseBlock) -> "BlockList":
+        """Replace a block with a new version that has the same ID.
+
+        Args:
+            block: The new version of the block
+
+        Returns:
+            A new BlockList with the block replaced in place
+
+        Raises:
+            BlockNotFoundError: If no block with the same ID exists
+        """
+        block = _block_adapter.validate_python(block)
+
+        entry = self._ids.get(block.id)
+        if entry is None:
+            raise BlockNotFoundError(f"Block with ID {block.id} not found")
+
+        rank = entry[0]
+        return self._derive(
+            self._seq.set(rank, block),
+            self._persistent_ids().set(block.id, (rank, block)),
+            removed=entry,
+            added=(rank, block),
+        )
+
+    def transaction(self) -> "BlockListTransaction":
+        """Start a batch of edits on this list.
+
+        The edits are applied to a scratch copy of the ID index and to the
+        persistent block map, and the new list is built once on commit, so k
+        edits on a list of n blocks cost O(n + k log n) instead of producing
+        k intermediate lists. Used as a
+        context manager, the transaction commits when the block exits without
+        an error and the new list is available as ``result``.
+
+        Returns:
+            A new transaction based on this list
+        """
+        return BlockListTransaction(self)
+
+    def apply_ops(self, ops: Iterable[BlockOp]) -> "BlockList":
+        """Apply a batch of edit operations.
+
+        The batch is atomic: if any operation fails, the error is raised and
+        no new list is produced.
+
+        Args:
+            ops: The operations to apply, in order
+
+        Returns:
+            A new BlockList with all operations applied
+
+        Raises:
+            BlockDuplicateError: If an added block's ID already exists
+            BlockNotFoundError: If a block to remove, move or replace is not found
+            ValueError: If an index is out of range
+        """
+        tx = self.transaction()
+        for op in ops:
+            tx.apply(op)
+        return tx.commit()
+
+    def diff(self, other: "BlockList") -> List[BlockOp]:
+        """Compute the operations that turn this list into another one.
+
+        Blocks are matched by ID, so the result only mentions the blocks
+        that were removed, moved, added or changed. Moves are minimal.
+
+        Args:
+            other: The list to turn this list into
+
+        Returns:
+            The operations, such that ``self.apply_patch(self.diff(other))``
+            equals ``other``
+        """
+        from corelab_blockkit.diff import diff_block_lists
+
+        return diff_block_lists(self, other)
+
+    def apply_patch(self, ops: Iterable[BlockOp]) -> "BlockList":
+        """Apply a patch produced by ``diff``.
+
+        This is ``apply_ops`` under the name that pairs with ``diff``.
+
+        Args:
+            ops: The operations of the patch, in order
+
+        Returns:
+            A new BlockList with the patch applied
+
+        Raises:
+            BlockDuplicateError: If an added block's ID already exists
+            BlockNotFoundError: If a block to remove, move or replace is not found
+            ValueError: If an index is out of range
+        """
+        return self.apply_ops(ops)
+
+    def search(
+        self, query: str, limit: Optional[int] = 10, require_all: bool = False
+    ) -> List[UUID]:
+        """Search the text of text, quote, supplement and glossary blocks.
+
+        The words of all blocks are indexed on the first search. Versions
+        derived with ``add``, ``remove``, ``replace`` or ``move`` update the
+        index for the changed block instead of rebuilding it.
+
+        Args:
+            query: The words to search for
+            limit: The maximum number of results (None for all matches)
+            require_all: Only match blocks that contain every query term
+
+        Returns:
+            The IDs of the matching blocks, best match first (ranked by BM25)
+        """
+        from corelab_blockkit.index.search import SearchIndex
+
+        return self._index(SearchIndex).search(
+            query, limit=limit, require_all=require_all
+        )
+
+    def tagged(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        favorite: Optional[bool] = None,
+    ) -> List[BaseBlock]:
+        """Find blocks by their tags and favorite flag.
+
+        Tags come from ``meta.tags`` and, for supplements, from the payload.
+        The tags of all blocks are indexed on the first query, and versions
+        derived with ``add``, ``remove``, ``replace`` or ``move`` update the
+        index for the changed block instead of rebuilding it.
+
+        Args:
+            all_of: Tags that a block must all have
+            any_of: Tags of which a block must have at least one
+            none_of: Tags that a block must not have
+            favorite: Only match favorite (True) or other (False) blocks
+
+        Returns:
+            The matching blocks, in list order
+        """
+        from corelab_blockkit.index.tags import TagIndex
+
+        ids = self._ids
+        matches = self._index(TagIndex).query(
+            all_of, any_of, none_of, favorite, universe=ids.keys()
+        )
+        entries = [ids.get(block_id) for block_id in matches]
+        return [block for _, block in sorted(entries, key=itemgetter(0))]
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Count the blocks that have each tag.
+
+        Returns:
+            The number of blocks per tag, for every tag in use
+        """
+        from corelab_blockkit.index.tags import TagIndex
+
+        return self._index(TagIndex).tag_counts()
+
+    def glossary(self) -> "GlossaryIndex":
+        """Get the merged glossary of all glossary blocks in the list.
+
+        The glossary supports case-insensitive lookups and prefix completion.
+        It is built on first use, and versions derived with ``add``,
+        ``remove``, ``replace`` or ``move`` update it for the changed block.
+
+        Returns:
+            The glossary index of this version
+        """
+        from corelab_blockkit.index.glossary import GlossaryIndex
+
+        return self._index(GlossaryIndex)
+
+    @overload
+    def of_kind(self, kind: Type[T]) -> "KindView[T]": ...
+
+    @overload
+    def of_kind(self, kind: str) -> "KindView[BaseBlock]": ...
+
+    def of_kind(self, kind: Union[Type[BaseBlock], str]) -> "KindView[Any]":
+        """Get a read-only view of the blocks of one kind, in list order.
+
+        The blocks are grouped by kind once per version (and the groups are
+        updated, not rebuilt, by ``add``, ``remove``, ``replace`` and
+        ``move``), so the view iterates only the matching blocks and its
+        length is known in O(1).
+
+        Args:
+            kind: A block class, such as VideoBlock, or a kind string
+
+        Returns:
+            The view
+
+        Raises:
+            TypeError: If the block class has no KIND
+        """
+        from corelab_blockkit.index.kinds import KindIndex
+
+        if not isinstance(kind, str):
+            if not kind.KIND:
+                raise TypeError(f"Block class {kind.__name__} has no KIND defined")
+            kind = kind.KIND
+        return self._index(KindIndex).view(kind, self._seq)
+
+    def kind_counts(self) -> Dict[str, int]:
+        """Count the blocks of every kind.
+
+        Returns:
+            The number of blocks per kind, for the kinds in the list
+        """
+        from corelab_blockkit.index.kinds import KindIndex
+
+        return self._index(KindIndex).counts()
+
+    def updated_since(self, since: datetime) -> List[BaseBlock]:
+        """Find the blocks updated at or after a time.
+
+        The blocks are sorted by their timestamps once per version (and the
+        order is updated, not rebuilt, by ``add``, ``remove``, ``replace``
+        and ``move``), so this costs O(log n + k) for k results. Naive
+        timestamps are taken as local time when compared with aware ones.
+
+        Args:
+            since: The earliest update time
+
+        Returns:
+            The blocks with ``meta.updated_at >= since``, least recently
+            updated first
+        """
+        from corelab_blockkit.index.times import TimeIndex
+
+        return list(self._index(TimeIndex).between("updated_at", start=since))
+
+    def created_between(self, start: datetime, end: datetime) -> List[BaseBlock]:
+        """Find the blocks created in a time range.
+
+        Args:
+            start: The earliest creation time (inclusive)
+            end: The latest creation time (exclusive)
+
+        Returns:
+            The blocks with ``start <= meta.created_at < end``, oldest first
+        """
+        from corelab_blockkit.index.times import TimeIndex
+
+        return list(self._index(TimeIndex).between("created_at", start, end))
+
+    def most_recent(
+        self, count: int = 10, field: str = "updated_at"
+    ) -> List[BaseBlock]:
+        """Get the most recently updated or created blocks.
+
+        Args:
+            count: The maximum number of blocks
+            field: "updated_at" or "created_at"
+
+        Returns:
+            The blocks, newest first
+
+        Raises:
+            ValueError: If the field is not a timestamp field of BlockMeta
+        """
+        from corelab_blockkit.index.times import TimeIndex
+
+        return self._index(TimeIndex).latest(field, count)
+
+    def fingerprint(self) -> str:
+        """Get a stable hash of the list's contents.
 
-        # Remove the block from its current position
-        block = new_blocks.pop(block_index)
+        The hash is built from the fingerprints of the blocks in order. Block
+        fingerprints are cached on the blocks, so a new version of a list
+        only hashes the blocks that changed plus 16 bytes per block. The
+        result is cached on the list.
+
+        Returns:
+            The fingerprint as a hex string
+        """
+        return self._fingerprint_digest.hex()
 
-        # Insert the block at the new position
-        new_blocks.insert(new_index, block)
+    @cached_property
+    def _fingerprint_digest(self) -> bytes:
+        """Get the raw digest behind ``fingerprint``.
 
-        return BlockList(blocks=new_blocks)
+        Returns:
+            The 16-byte digest of the block digests
+        """
+        digest = hashlib.blake2b(digest_size=16, person=b"BlockList")
+        for block in self:
+            digest.update(block._fingerprint_digest)
+        return digest.digest()
 
     def find_by_id(self, block_id: UUID) -> BaseBlock:
         """Find a block by its ID.
@@ -147,11 +757,52 @@ class BlockList(BaseModel):
         Raises:
             BlockNotFoundError: If the block is not found
         """
-        for block in self.blocks:
-            if block.id == block_id:
-                return block
+        entry = self._ids.get(block_id)
+        if entry is None:
+            raise BlockNotFoundError(f"Block with ID {block_id} not found")
+
+        return entry[1]
+
+    def index_of(self, block_id: UUID) -> int:
+        """Get the position of a block by its ID.
+
+        Args:
+            block_id: The ID of the block to look up
+
+        Returns:
+            The index of the block in the list
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+        """
+        entry = self._ids.get(block_id)
+        if entry is None:
+            raise BlockNotFoundError(f"Block with ID {block_id} not found")
+
+        return self._seq.index(entry[0])
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare two block lists block by block.
+
+        Args:
+            other: The object to compare with
+
+        Returns:
+            True if both lists hold equal blocks in the same order
+        """
+        if not isinstance(other, BlockList):
+            return NotImplemented
+        if self._seq is other._seq:
+            return True
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
 
-        raise BlockNotFoundError(f"Block with ID {block_id} not found")
+    def __hash__(self) -> int:
+        """Hash the block list by its blocks.
+
+        Returns:
+            The hash of the blocks in order
+        """
+        return hash(tuple(self))
 
     def __iter__(self) -> Iterator[BaseBlock]:
         """Iterate over the blocks in the list.
@@ -159,7 +810,7 @@ class BlockList(BaseModel):
         Returns:
             An iterator over the blocks
         """
-        return iter(self.blocks)
+        return self._seq.values()
 
     def __len__(self) -> int:
         """Get the number of blocks in the list.
@@ -167,22 +818,31 @@ class BlockList(BaseModel):
         Returns:
             The number of blocks
         """
-        return len(self.blocks)
+        return len(self._seq)
 
-    def __getitem__(self, index: int) -> BaseBlock:
+    def __getitem__(self, index: Union[int, slice]) -> Any:
         """Get a block by index.
 
         Args:
-            index: The index of the block to get
+            index: The index of the block to get (or a slice of indices)
 
         Returns:
-            The block at the specified index
+            The block at the specified index (or a list of blocks for a slice)
         """
-        return self.blocks[index]
+        if isinstance(index, slice):
+            return self.blocks[index]
+        try:
+            return self._seq.item_at(index)[1]
+        except IndexError:
+            raise IndexError("BlockList index out of range") from None
 
     def to_json(self, **kwargs: Any) -> str:
         """Serialize the block list to JSON.
 
+        Pass ``compiled=True`` to encode with pydantic's compiled serializer,
+        which is much faster but only supports ``indent``, ``ensure_ascii``
+        and ``separators``.
+
         Args:
             **kwargs: Additional arguments to pass to json.dumps
 
@@ -193,19 +853,145 @@ class BlockList(BaseModel):
 
         return serialize_to_json(self, **kwargs)
 
+    @overload
+    @classmethod
+    def from_json(
+        cls, json_str: str, trusted: bool = ..., lazy: Literal[False] = ...
+    ) -> "BlockList": ...
+
+    @overload
     @classmethod
-    def from_json(cls, json_str: str) -> "BlockList":
+    def from_json(
+        cls, json_str: str, trusted: bool = ..., *, lazy: Literal[True]
+    ) -> "LazyBlockList": ...
+
+    @overload
+    @classmethod
+    def from_json(
+        cls, json_str: str, trusted: bool = ..., lazy: bool = ...
+    ) -> Union["BlockList", "LazyBlockList"]: ...
+
+    @classmethod
+    def from_json(
+        cls, json_str: str, trusted: bool = False, lazy: bool = False
+    ) -> Union["BlockList", "LazyBlockList"]:
         """Deserialize a JSON string to a block list.
 
         Args:
             json_str: The JSON string to deserialize
+            trusted: Skip block validation (only for output of ``to_json``)
+            lazy: Return a LazyBlockList that validates each block on first
+                access, for reading only a few blocks of a large document
 
         Returns:
             The deserialized block list
         """
         from corelab_blockkit.ser.json_codec import deserialize_from_json
 
-        return deserialize_from_json(json_str, target_type=cls)
+        return deserialize_from_json(
+            json_str, target_type=cls, trusted=trusted, lazy=lazy
+        )
+
+    def write_json(self, fp: IO[Any], **kwargs: Any) -> None:
+        """Serialize the block list to a text or binary stream of JSON.
+
+        Each block is written as soon as it has been encoded, so the whole
+        document is never held in memory.
+
+        Args:
+            fp: The stream to write to
+            **kwargs: Additional arguments to pass to json.dumps
+        """
+        from corelab_blockkit.ser.json_codec import dump_to_json
+
+        dump_to_json(self, fp, **kwargs)
+
+    @classmethod
+    def read_json(cls, fp: IO[Any], trusted: bool = False) -> "BlockList":
+        """Deserialize a block list from a text or binary stream of JSON.
+
+        The document is parsed incrementally instead of being read into a
+        string first.
+
+        Args:
+            fp: The stream to read from
+            trusted: Skip block validation (only for output of ``to_json``)
+
+        Returns:
+            The deserialized block list
+        """
+        from corelab_blockkit.ser.json_codec import load_from_json
+
+        return load_from_json(fp, trusted=trusted)
+
+    async def asave(
+        self, target: Any, executor: Optional[Executor] = None, **kwargs: Any
+    ) -> None:
+        """Serialize the block list to a JSON file or asyncio stream.
+
+        Encoding runs in an executor, so the event loop is not blocked.
+
+        Args:
+            target: The path of a file, or an asyncio stream such as
+                ``asyncio.StreamWriter``
+            executor: The executor to encode in (defaults to the event loop's
+                default executor)
+            **kwargs: Additional arguments to pass to json.dumps
+        """
+        from corelab_blockkit.ser.aio import asave_to_json
+
+        await asave_to_json(self, target, executor=executor, **kwargs)
+
+    @classmethod
+    async def aload(
+        cls,
+        source: Any,
+        trusted: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> "BlockList":
+        """Deserialize a block list from a JSON file or asyncio stream.
+
+        Decoding runs in an executor, so the event loop is not blocked and
+        several loads can overlap.
+
+        Args:
+            source: The path of a file, or an asyncio stream such as
+                ``asyncio.StreamReader``
+            trusted: Skip block validation (only for output of ``to_json``)
+            executor: The executor to decode in (defaults to the event loop's
+                default executor)
+
+        Returns:
+            The deserialized block list
+        """
+        from corelab_blockkit.ser.aio import aload_from_json
+
+        return await aload_from_json(source, trusted=trusted, executor=executor)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the block list to the compact binary form.
+
+        Returns:
+            The encoded bytes
+        """
+        from corelab_blockkit.ser.binary_codec import serialize_to_binary
+
+        return serialize_to_binary(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, trusted: bool = False) -> "BlockList":
+        """Deserialize a block list from the compact binary form.
+
+        Args:
+            data: The encoded bytes
+            trusted: Skip block validation (only for output of ``to_bytes``)
+
+        Returns:
+            The deserialized block list
+        """
+        from corelab_blockkit.ser.binary_codec import deserialize_from_binary
+
+        return deserialize_from_binary(data, target_type=cls, trusted=trusted)
 
     def to_yaml(self, **kwargs: Any) -> str:
         """Serialize the block list to YAML.
@@ -220,16 +1006,254 @@ class BlockList(BaseModel):
 
         return serialize_to_yaml(self, **kwargs)
 
+    @overload
+    @classmethod
+    def from_yaml(
+        cls, yaml_str: str, trusted: bool = ..., lazy: Literal[False] = ...
+    ) -> "BlockList": ...
+
+    @overload
+    @classmethod
+    def from_yaml(
+        cls, yaml_str: str, trusted: bool = ..., *, lazy: Literal[True]
+    ) -> "LazyBlockList": ...
+
+    @overload
     @classmethod
-    def from_yaml(cls, yaml_str: str) -> "BlockList":
+    def from_yaml(
+        cls, yaml_str: str, trusted: bool = ..., lazy: bool = ...
+    ) -> Union["BlockList", "LazyBlockList"]: ...
+
+    @classmethod
+    def from_yaml(
+        cls, yaml_str: str, trusted: bool = False, lazy: bool = False
+    ) -> Union["BlockList", "LazyBlockList"]:
         """Deserialize a YAML string to a block list.
 
         Args:
             yaml_str: The YAML string to deserialize
+            trusted: Skip block validation (only for output of ``to_yaml``)
+            lazy: Return a LazyBlockList that validates each block on first
+                access, for reading only a few blocks of a large document
 
         Returns:
             The deserialized block list
         """
         from corelab_blockkit.ser.yaml_codec import deserialize_from_yaml
 
-        return deserialize_from_yaml(yaml_str, target_type=cls)
+        return deserialize_from_yaml(
+            yaml_str, target_type=cls, trusted=trusted, lazy=lazy
+        )
+
+
+class BlockListTransaction:
+    """A batch of edits on a block list.
+
+    The transaction starts from the rank-ordered block map of its base list
+    and a mutable copy of its ID index. Every edit finds its block through
+    the index and changes the map in O(log n), and the commit wraps the map
+    in a single new BlockList. The base list is never modified.
+    """
+
+    def __init__(self, base: BlockList) -> None:
+        """Initialize a transaction.
+
+        Args:
+            base: The list the edits are applied to
+        """
+        self._base = base
+        self._seq = base._seq
+        ids = base._ids
+        self._ids: Dict[UUID, Tuple[Rank, BaseBlock]] = (
+            dict(ids) if isinstance(ids, dict) else dict(ids.items())
+        )
+        # Whether _ids is shared with a committed list and must be copied
+        self._shared = False
+        self._changed = False
+        self.result: Optional[BlockList] = None
+
+    def _entry(self, block_id: UUID) -> Tuple[Rank, BaseBlock]:
+        """Get the rank and block for a block ID.
+
+        Args:
+            block_id: The ID of the block
+
+        Returns:
+            The rank and the block
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+        """
+        entry = self._ids.get(block_id)
+        if entry is None:
+            raise BlockNotFoundError(f"Block with ID {block_id} not found")
+        return entry
+
+    def _writable_ids(self) -> Dict[UUID, Tuple[Rank, BaseBlock]]:
+        """Get the ID index for an edit, copying it if a commit shares it.
+
+        Returns:
+            The ID index
+        """
+        if self._shared:
+            self._ids = dict(self._ids)
+            self._shared = False
+        self._changed = True
+        return self._ids
+
+    def _insert(self, index: int, block: BaseBlock) -> None:
+        """Insert a block at a position of the buffer.
+
+        Like ``BlockList.add``, the block gets a rank between its
+        neighbours, and the ranks are only renumbered when they grow too
+        long.
+
+        Args:
+            index: The position to insert at
+            block: The block to insert
+        """
+        ids = self._writable_ids()
+        seq = self._seq
+        low = seq.item_at(index - 1)[0] if index > 0 else None
+        high = seq.item_at(index)[0] if index < len(seq) else None
+        rank = _rank_between(low, high)
+        if len(rank) > _MAX_RANK_DEPTH:
+            seq = _build_seq(list(seq.values()))
+            for entry in seq.items():
+                ids[entry[1].id] = entry
+            self._seq = seq
+            self._insert(index, block)
+            return
+        self._seq = seq.set(rank, block)
+        ids[block.id] = (rank, block)
+
+    def add(self, block: BaseBlock, index: Optional[int] = None) -> None:
+        """Add a block.
+
+        Args:
+            block: The block to add
+            index: Optional index to insert at (appends if None)
+
+        Raises:
+            BlockDuplicateError: If a block with the same ID already exists
+            ValueError: If the index is out of range
+        """
+        block = _block_adapter.validate_python(block)
+        if block.id in self._ids:
+            raise BlockDuplicateError(f"Block with ID {block.id} already exists")
+
+        size = len(self._seq)
+        if index is None:
+            index = size
+        elif index < 0 or index > size:
+            raise ValueError(f"Index {index} out of range (0-{size})")
+        self._insert(index, block)
+
+    def remove(self, block_id: UUID) -> None:
+        """Remove a block.
+
+        Args:
+            block_id: The ID of the block to remove
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+        """
+        rank, _ = self._entry(block_id)
+        del self._writable_ids()[block_id]
+        self._seq = self._seq.delete(rank)
+
+    def move(self, block_id: UUID, new_index: int) -> None:
+        """Move a block to a new position.
+
+        Args:
+            block_id: The ID of the block to move
+            new_index: The new index for the block
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+            ValueError: If the new index is out of range
+        """
+        rank, block = self._entry(block_id)
+        size = len(self._seq)
+        if new_index < 0 or new_index >= size:
+            raise ValueError(f"Index {new_index} out of range (0-{size - 1})")
+        if self._seq.index(rank) == new_index:
+            return
+
+        self._seq = self._seq.delete(rank)
+        self._insert(new_index, block)
+
+    def replace(self, block: BaseBlock) -> None:
+        """Replace a block with a new version that has the same ID.
+
+        Args:
+            block: The new version of the block
+
+        Raises:
+            BlockNotFoundError: If no block with the same ID exists
+        """
+        block = _block_adapter.validate_python(block)
+        rank, _ = self._entry(block.id)
+        self._writable_ids()[block.id] = (rank, block)
+        self._seq = self._seq.set(rank, block)
+
+    def apply(self, op: BlockOp) -> None:
+        """Apply an edit operation.
+
+        Args:
+            op: The operation to apply
+
+        Raises:
+            TypeError: If the operation type is not supported
+        """
+        if isinstance(op, AddOp):
+            self.add(op.block, op.index)
+        elif isinstance(op, RemoveOp):
+            self.remove(op.block_id)
+        elif isinstance(op, MoveOp):
+            self.move(op.block_id, op.new_index)
+        elif isinstance(op, ReplaceOp):
+            self.replace(op.block)
+        else:
+            raise TypeError(f"Unsupported operation: {type(op)}")
+
+    def commit(self) -> BlockList:
+        """Build the new block list.
+
+        Returns:
+            A new BlockList with all edits applied (the base list itself if
+            nothing changed)
+        """
+        if not self._changed:
+            self.result = self._base
+        else:
+            # The new list owns the ID index from now on
+            self.result = BlockList._from_seq(self._seq, self._ids)
+            self._shared = True
+        return self.result
+
+    def __len__(self) -> int:
+        """Get the number of blocks in the buffer.
+
+        Returns:
+            The number of blocks
+        """
+        return len(self._seq)
+
+    def __enter__(self) -> "BlockListTransaction":
+        """Enter the transaction context.
+
+        Returns:
+            The transaction
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Commit the transaction unless the block raised an error."""
+        if exc_type is None:
+            self.commit()
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class BlockMeta(BaseModel):
@@ -28,6 +28,40 @@ class BlockMeta(BaseModel):
         "frozen": True,  # Make the model immutable (PEP 681)
     }
 
+    @field_serializer("created_at", "updated_at", when_used="json")
+    def _serialize_timestamp(self, value: datetime) -> str:
+        """Write timestamps in JSON mode the same way as the JSON codec.
+
+        Pydantic would otherwise write UTC offsets as "Z" instead of "+00:00".
+
+        Args:
+            value: The timestamp
+
+        Returns:
+            The timestamp in ISO 8601 format
+        """
+        return value.isoformat()
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "BlockMeta":
+        """Create metadata from trusted serialized data without validating it.
+
+        ISO 8601 timestamps are parsed, everything else is used as is. Only
+        use this for data produced by blockkit's own serializers.
+
+        Args:
+            data: The dictionary form of the metadata
+
+        Returns:
+            A BlockMeta instance
+        """
+        values = dict(data)
+        for key in ("created_at", "updated_at"):
+            value = values.get(key)
+            if isinstance(value, str):
+                values[key] = datetime.fromisoformat(value)
+        return cls.model_construct(**values)
+
 
 def toggle_favorite(meta: BlockMeta) -> BlockMeta:
     """Toggle the is_favorite flag on a BlockMeta instance.
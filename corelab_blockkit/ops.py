@@ -0,0 +1,77 @@
+"""Edit operations for block lists in the blockkit package."""
+
+from typing import Annotated, Literal, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from corelab_blockkit.blocks.base import BaseBlock
+
+
+class AddOp(BaseModel):
+    """Add a block to a list.
+
+    Attributes:
+        block: The block to add
+        index: Optional index to insert at (appends if None)
+    """
+
+    op: Literal["add"] = "add"
+    block: BaseBlock
+    index: Optional[int] = None
+
+    model_config = {
+        "frozen": True,  # Make the model immutable (PEP 681)
+    }
+
+
+class RemoveOp(BaseModel):
+    """Remove a block from a list.
+
+    Attributes:
+        block_id: The ID of the block to remove
+    """
+
+    op: Literal["remove"] = "remove"
+    block_id: UUID
+
+    model_config = {
+        "frozen": True,  # Make the model immutable (PEP 681)
+    }
+
+
+class MoveOp(BaseModel):
+    """Move a block to a new position in a list.
+
+    Attributes:
+        block_id: The ID of the block to move
+        new_index: The new index for the block
+    """
+
+    op: Literal["move"] = "move"
+    block_id: UUID
+    new_index: int
+
+    model_config = {
+        "frozen": True,  # Make the model immutable (PEP 681)
+    }
+
+
+class ReplaceOp(BaseModel):
+    """Replace a block with a new block that has the same ID.
+
+    Attributes:
+        block: The new version of the block
+    """
+
+    op: Literal["replace"] = "replace"
+    block: BaseBlock
+
+    model_config = {
+        "frozen": True,  # Make the model immutable (PEP 681)
+    }
+
+
+BlockOp = Annotated[
+    Union[AddOp, RemoveOp, MoveOp, ReplaceOp], Field(discriminator="op")
+]
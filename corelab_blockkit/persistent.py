@@ -0,0 +1,878 @@
+"""Persistent (structurally shared) collections for the blockkit package.
+
+The collections in this module never change once created. Every "modifying"
+operation returns a new collection that shares all untouched nodes with the
+original one, so deriving a new version costs O(log n) instead of a full copy.
+They back the immutable :class:`~corelab_blockkit.list.BlockList`.
+"""
+
+import random
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_MISSING = object()
+
+# Priorities only need to be independent and uniformly distributed
+_random = random.Random()
+
+
+class _TreapNode:
+    """A node of a persistent treap.
+
+    Nodes are treated as immutable once they are reachable from a map.
+    """
+
+    __slots__ = ("key", "value", "priority", "left", "right", "size")
+
+    def __init__(
+        self,
+        key: Any,
+        value: Any,
+        priority: float,
+        left: Optional["_TreapNode"],
+        right: Optional["_TreapNode"],
+    ) -> None:
+        self.key = key
+        self.value = value
+        self.priority = priority
+        self.left = left
+        self.right = right
+        self.size = (
+            1
+            + (left.size if left is not None else 0)
+            + (right.size if right is not None else 0)
+        )
+
+
+def _insert(
+    node: Optional[_TreapNode], key: Any, value: Any, priority: float
+) -> _TreapNode:
+    """Insert or replace a key, copying only the nodes on the search path."""
+    if node is None:
+        return _TreapNode(key, value, priority, None, None)
+
+    if key < node.key:
+        left = _insert(node.left, key, value, priority)
+        if left.priority > node.priority:
+            # Rotate right so that the heap order on priorities is kept
+            return _TreapNode(
+                left.key,
+                left.value,
+                left.priority,
+                left.left,
+                _TreapNode(node.key, node.value, node.priority, left.right, node.right),
+            )
+        return _TreapNode(node.key, node.value, node.priority, left, node.right)
+
+    if node.key < key:
+        right = _insert(node.right, key, value, priority)
+        if right.priority > node.priority:
+            # Rotate left so that the heap order on priorities is kept
+            return _TreapNode(
+                right.key,
+                right.value,
+                right.priority,
+                _TreapNode(node.key, node.value, node.priority, node.left, right.left),
+                right.right,
+            )
+        return _TreapNode(node.key, node.value, node.priority, node.left, right)
+
+    # Same key: replace the value and keep the shape of the tree
+    return _TreapNode(key, value, node.priority, node.left, node.right)
+
+
+def _merge(
+    left: Optional[_TreapNode], right: Optional[_TreapNode]
+) -> Optional[_TreapNode]:
+    """Merge two treaps where every key in ``left`` is less than every key in ``right``."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        return _TreapNode(
+            left.key, left.value, left.priority, left.left, _merge(left.right, right)
+        )
+    return _TreapNode(
+        right.key, right.value, right.priority, _merge(left, right.left), right.right
+    )
+
+
+def _delete(node: Optional[_TreapNode], key: Any) -> Optional[_TreapNode]:
+    """Delete a key, copying only the nodes on the search path."""
+    if node is None:
+        raise KeyError(key)
+    if key < node.key:
+        return _TreapNode(
+            node.key, node.value, node.priority, _delete(node.left, key), node.right
+        )
+    if node.key < key:
+        return _TreapNode(
+            node.key, node.value, node.priority, node.left, _delete(node.right, key)
+        )
+    return _merge(node.left, node.right)
+
+
+class PersistentSortedMap(Generic[K, V]):
+    """An immutable sorted map with positional access.
+
+    The map is a treap with path copying: ``set`` and ``delete`` return a new
+    map in O(log n) expected time and share every other node with the original.
+    Every node also tracks the size of its subtree, so the position of a key
+    and the item at a position can be found in O(log n) as well.
+
+    Keys must be mutually comparable with ``<``.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, _root: Optional[_TreapNode] = None) -> None:
+        """Initialize a sorted map.
+
+        Args:
+            _root: Root node of an existing treap (internal use only)
+        """
+        self._root = _root
+
+    @classmethod
+    def from_sorted_items(
+        cls, items: Iterable[Tuple[K, V]]
+    ) -> "PersistentSortedMap[K, V]":
+        """Build a map from items whose keys are strictly increasing.
+
+        This runs in O(n), which is much cheaper than n calls to ``set``.
+
+        Args:
+            items: The (key, value) pairs, sorted by key
+
+        Returns:
+            A new map with the given items
+
+        Raises:
+            ValueError: If the keys are not strictly increasing
+        """
+        rand = _random.random
+        stack: List[_TreapNode] = []
+        for key, value in items:
+            if stack and not stack[-1].key < key:
+                raise ValueError("Keys must be strictly increasing")
+            priority = rand()
+            last = None
+            while stack and stack[-1].priority < priority:
+                last = stack.pop()
+            node = _TreapNode(key, value, priority, last, None)
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+
+        if not stack:
+            return cls()
+
+        # The nodes were linked after creation, so recompute the subtree sizes
+        root = stack[0]
+        pending: List[Tuple[_TreapNode, bool]] = [(root, False)]
+        while pending:
+            node, children_done = pending.pop()
+            if children_done:
+                node.size = (
+                    1
+                    + (node.left.size if node.left is not None else 0)
+                    + (node.right.size if node.right is not None else 0)
+                )
+                continue
+            pending.append((node, True))
+            if node.left is not None:
+                pending.append((node.left, False))
+            if node.right is not None:
+                pending.append((node.right, False))
+
+        return cls(root)
+
+    def set(self, key: K, value: V) -> "PersistentSortedMap[K, V]":
+        """Return a new map with ``key`` set to ``value``.
+
+        Args:
+            key: The key to set
+            value: The value to associate with the key
+
+        Returns:
+            A new map
+        """
+        return PersistentSortedMap(_insert(self._root, key, value, _random.random()))
+
+    def delete(self, key: K) -> "PersistentSortedMap[K, V]":
+        """Return a new map without ``key``.
+
+        Args:
+            key: The key to delete
+
+        Returns:
+            A new map
+
+        Raises:
+            KeyError: If the key is not in the map
+        """
+        return PersistentSortedMap(_delete(self._root, key))
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Get the value for a key.
+
+        Args:
+            key: The key to look up
+            default: The value to return if the key is missing
+
+        Returns:
+            The value, or ``default`` if the key is missing
+        """
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node.value
+        return default
+
+    def index(self, key: K) -> int:
+        """Get the position of a key in sorted order.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            The zero-based position of the key
+
+        Raises:
+            KeyError: If the key is not in the map
+        """
+        node = self._root
+        position = 0
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                position += 1 + (node.left.size if node.left is not None else 0)
+                node = node.right
+            else:
+                return position + (node.left.size if node.left is not None else 0)
+        raise KeyError(key)
+
+    def bisect_left(self, key: Any) -> int:
+        """Count the keys that are less than ``key``.
+
+        Args:
+            key: The key to compare against (it does not need to be in the map)
+
+        Returns:
+            The number of keys less than ``key``
+        """
+        node = self._root
+        position = 0
+        while node is not None:
+            if node.key < key:
+                position += 1 + (node.left.size if node.left is not None else 0)
+                node = node.right
+            else:
+                node = node.left
+        return position
+
+    def item_at(self, index: int) -> Tuple[K, V]:
+        """Get the item at a position in sorted order.
+
+        Args:
+            index: The position (negative values count from the end)
+
+        Returns:
+            The (key, value) pair at the position
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("PersistentSortedMap index out of range")
+
+        node = self._root
+        while node is not None:
+            left_size = node.left.size if node.left is not None else 0
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node.key, node.value
+        raise IndexError("PersistentSortedMap index out of range")  # pragma: no cover
+
+    def items(self, reverse: bool = False) -> Iterator[Tuple[K, V]]:
+        """Iterate over the (key, value) pairs in key order.
+
+        Args:
+            reverse: Iterate from the largest key to the smallest
+
+        Returns:
+            An iterator over the items
+        """
+        return self.irange(reverse=reverse)
+
+    def keys(self) -> Iterator[K]:
+        """Iterate over the keys in order.
+
+        Returns:
+            An iterator over the keys
+        """
+        return (key for key, _ in self.irange())
+
+    def values(self) -> Iterator[V]:
+        """Iterate over the values in key order.
+
+        Returns:
+            An iterator over the values
+        """
+        stack: List[_TreapNode] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def irange(
+        self,
+        minimum: Any = None,
+        maximum: Any = None,
+        reverse: bool = False,
+    ) -> Iterator[Tuple[K, V]]:
+        """Iterate over the items whose keys lie in ``[minimum, maximum)``.
+
+        Subtrees outside of the range are never visited, so the cost is
+        O(log n + k) for k returned items.
+
+        Args:
+            minimum: Inclusive lower bound (unbounded if None)
+            maximum: Exclusive upper bound (unbounded if None)
+            reverse: Iterate from the largest key to the smallest
+
+        Returns:
+            An iterator over the matching items
+        """
+        stack: List[_TreapNode] = []
+        node = self._root
+        if not reverse:
+            while stack or node is not None:
+                while node is not None:
+                    if minimum is not None and node.key < minimum:
+                        node = node.right
+                    else:
+                        stack.append(node)
+                        node = node.left
+                if not stack:
+                    return
+                node = stack.pop()
+                if maximum is not None and not node.key < maximum:
+                    return
+                yield node.key, node.value
+                node = node.right
+        else:
+            while stack or node is not None:
+                while node is not None:
+                    if maximum is not None and not node.key < maximum:
+                        node = node.left
+                    else:
+                        stack.append(node)
+                        node = node.right
+                if not stack:
+                    return
+                node = stack.pop()
+                if minimum is not None and node.key < minimum:
+                    return
+                yield node.key, node.value
+                node = node.left
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is in the map."""
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys in order."""
+        return self.keys()
+
+    def __len__(self) -> int:
+        """Get the number of items in the map."""
+        return self._root.size if self._root is not None else 0
+
+    def __repr__(self) -> str:
+        """Get a debug representation of the map."""
+        return f"PersistentSortedMap({list(self.items())!r})"
+
+
+# Hash array mapped trie parameters: 5 hash bits per level, 32-way branching
+_HAMT_BITS = 5
+_HAMT_MASK = (1 << _HAMT_BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+
+class _HashNode:
+    """A bitmap-indexed node of a hash array mapped trie.
+
+    Each slot holds either a child node or a ``(hash, key, value)`` entry.
+    """
+
+    __slots__ = ("bitmap", "slots")
+
+    def __init__(self, bitmap: int, slots: Tuple[Any, ...]) -> None:
+        self.bitmap = bitmap
+        self.slots = slots
+
+
+class _CollisionNode:
+    """A node holding entries whose full hashes are equal."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: Tuple[Tuple[int, Any, Any], ...]) -> None:
+        self.entries = entries
+
+
+def _hamt_pair(
+    shift: int, first: Tuple[int, Any, Any], second: Tuple[int, Any, Any]
+) -> Any:
+    """Create the smallest subtree holding two entries with different keys."""
+    if shift >= _HASH_BITS:
+        return _CollisionNode((first, second))
+    first_bit = (first[0] >> shift) & _HAMT_MASK
+    second_bit = (second[0] >> shift) & _HAMT_MASK
+    if first_bit == second_bit:
+        return _HashNode(
+            1 << first_bit, (_hamt_pair(shift + _HAMT_BITS, first, second),)
+        )
+    if first_bit < second_bit:
+        return _HashNode((1 << first_bit) | (1 << second_bit), (first, second))
+    return _HashNode((1 << first_bit) | (1 << second_bit), (second, first))
+
+
+def _hamt_set(node: Any, shift: int, entry: Tuple[int, Any, Any]) -> Tuple[Any, bool]:
+    """Set an entry, copying only the nodes on the hash path.
+
+    Returns:
+        The new node and whether a new key was added
+    """
+    if isinstance(node, _CollisionNode):
+        entries = node.entries
+        for i, existing in enumerate(entries):
+            if existing[1] == entry[1]:
+                return _CollisionNode(entries[:i] + (entry,) + entries[i + 1 :]), False
+        return _CollisionNode(entries + (entry,)), True
+
+    bit = 1 << ((entry[0] >> shift) & _HAMT_MASK)
+    position = (node.bitmap & (bit - 1)).bit_count()
+    slots = node.slots
+    if not node.bitmap & bit:
+        return (
+            _HashNode(node.bitmap | bit, slots[:position] + (entry,) + slots[position:]),
+            True,
+        )
+
+    slot = slots[position]
+    if type(slot) is tuple:
+        if slot[1] == entry[1]:
+            child, added = entry, False
+        else:
+            child, added = _hamt_pair(shift + _HAMT_BITS, slot, entry), True
+    else:
+        child, added = _hamt_set(slot, shift + _HAMT_BITS, entry)
+    return (
+        _HashNode(node.bitmap, slots[:position] + (child,) + slots[position + 1 :]),
+        added,
+    )
+
+
+def _hamt_delete(node: Any, shift: int, key_hash: int, key: Any) -> Any:
+    """Delete a key, copying only the nodes on the hash path.
+
+    Returns:
+        The new node, a lone entry that should replace the node in its
+        parent, or None if the node became empty
+
+    Raises:
+        KeyError: If the key is not present
+    """
+    if isinstance(node, _CollisionNode):
+        for i, existing in enumerate(node.entries):
+            if existing[1] == key:
+                entries = node.entries[:i] + node.entries[i + 1 :]
+                return entries[0] if len(entries) == 1 else _CollisionNode(entries)
+        raise KeyError(key)
+
+    bit = 1 << ((key_hash >> shift) & _HAMT_MASK)
+    if not node.bitmap & bit:
+        raise KeyError(key)
+    position = (node.bitmap & (bit - 1)).bit_count()
+    slots = node.slots
+    slot = slots[position]
+    if type(slot) is tuple:
+        if slot[1] != key:
+            raise KeyError(key)
+        child = None
+    else:
+        child = _hamt_delete(slot, shift + _HAMT_BITS, key_hash, key)
+
+    if child is None:
+        if len(slots) == 1:
+            return None
+        remaining = slots[:position] + slots[position + 1 :]
+        if len(remaining) == 1 and type(remaining[0]) is tuple and shift > 0:
+            # Let the parent hold the last entry directly
+            return remaining[0]
+        return _HashNode(node.bitmap & ~bit, remaining)
+
+    if len(slots) == 1 and type(child) is tuple and shift > 0:
+        return child
+    return _HashNode(node.bitmap, slots[:position] + (child,) + slots[position + 1 :])
+
+
+def _hamt_build(entries: List[Tuple[int, Any, Any]], shift: int) -> Any:
+    """Build a subtree for entries with distinct keys in a single pass."""
+    if shift >= _HASH_BITS:
+        return _CollisionNode(tuple(entries))
+
+    buckets: dict = {}
+    for entry in entries:
+        buckets.setdefault((entry[0] >> shift) & _HAMT_MASK, []).append(entry)
+
+    bitmap = 0
+    slots = []
+    for bit in sorted(buckets):
+        bucket = buckets[bit]
+        bitmap |= 1 << bit
+        slots.append(
+            bucket[0] if len(bucket) == 1 else _hamt_build(bucket, shift + _HAMT_BITS)
+        )
+    return _HashNode(bitmap, tuple(slots))
+
+
+class PersistentHashMap(Generic[K, V]):
+    """An immutable hash map.
+
+    The map is a hash array mapped trie (HAMT) with 32-way branching. Lookups
+    visit at most a handful of nodes for any realistic size, and ``set`` and
+    ``delete`` return a new map that shares everything but the nodes on a
+    single hash path with the original.
+
+    Keys must be hashable.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, _root: Optional[_HashNode] = None, _size: int = 0) -> None:
+        """Initialize a hash map.
+
+        Args:
+            _root: Root node of an existing trie (internal use only)
+            _size: Number of entries in the trie (internal use only)
+        """
+        self._root = _root
+        self._size = _size
+
+    @classmethod
+    def from_dict(cls, data: "dict[K, V]") -> "PersistentHashMap[K, V]":
+        """Build a map from a dictionary.
+
+        This runs in O(n), which is much cheaper than n calls to ``set``.
+
+        Args:
+            data: The entries of the new map
+
+        Returns:
+            A new map with the same entries
+        """
+        if not data:
+            return cls()
+        entries = [(hash(key) & _HASH_MASK, key, value) for key, value in data.items()]
+        return cls(_hamt_build(entries, 0), len(entries))
+
+    def set(self, key: K, value: V) -> "PersistentHashMap[K, V]":
+        """Return a new map with ``key`` set to ``value``.
+
+        Args:
+            key: The key to set
+            value: The value to associate with the key
+
+        Returns:
+            A new map
+        """
+        entry = (hash(key) & _HASH_MASK, key, value)
+        root = self._root if self._root is not None else _HashNode(0, ())
+        root, added = _hamt_set(root, 0, entry)
+        return PersistentHashMap(root, self._size + 1 if added else self._size)
+
+    def delete(self, key: K) -> "PersistentHashMap[K, V]":
+        """Return a new map without ``key``.
+
+        Args:
+            key: The key to delete
+
+        Returns:
+            A new map
+
+        Raises:
+            KeyError: If the key is not in the map
+        """
+        if self._root is None:
+            raise KeyError(key)
+        root = _hamt_delete(self._root, 0, hash(key) & _HASH_MASK, key)
+        return PersistentHashMap(root, self._size - 1)
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Get the value for a key.
+
+        Args:
+            key: The key to look up
+            default: The value to return if the key is missing
+
+        Returns:
+            The value, or ``default`` if the key is missing
+        """
+        node: Any = self._root
+        key_hash = hash(key) & _HASH_MASK
+        shift = 0
+        while node is not None:
+            if isinstance(node, _CollisionNode):
+                for entry in node.entries:
+                    if entry[1] == key:
+                        return entry[2]
+                return default
+            bit = 1 << ((key_hash >> shift) & _HAMT_MASK)
+            if not node.bitmap & bit:
+                return default
+            node = node.slots[(node.bitmap & (bit - 1)).bit_count()]
+            if type(node) is tuple:
+                return node[2] if node[1] == key else default
+            shift += _HAMT_BITS
+        return default
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        """Iterate over the (key, value) pairs in no particular order.
+
+        Returns:
+            An iterator over the items
+        """
+        stack: List[Any] = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _CollisionNode):
+                for _, key, value in node.entries:
+                    yield key, value
+                continue
+            for slot in node.slots:
+                if type(slot) is tuple:
+                    yield slot[1], slot[2]
+                else:
+                    stack.append(slot)
+
+    def keys(self) -> Iterator[K]:
+        """Iterate over the keys in no particular order.
+
+        Returns:
+            An iterator over the keys
+        """
+        return (key for key, _ in self.items())
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is in the map."""
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys in no particular order."""
+        return self.keys()
+
+    def __len__(self) -> int:
+        """Get the number of items in the map."""
+        return self._size
+
+    def __repr__(self) -> str:
+        """Get a debug representation of the map."""
+        return f"PersistentHashMap({dict(self.items())!r})"
+
+
+class _TrieNode:
+    """A node of a persistent trie.
+
+    Nodes are treated as immutable once they are reachable from a trie.
+    """
+
+    __slots__ = ("children", "terminal")
+
+    def __init__(self, children: "dict[str, _TrieNode]", terminal: bool) -> None:
+        self.children = children
+        self.terminal = terminal
+
+
+def _trie_path(root: _TrieNode, key: str) -> List[Optional[_TrieNode]]:
+    """Get the nodes on the path of a key.
+
+    Args:
+        root: The root of the trie
+        key: The key
+
+    Returns:
+        The node for every prefix of the key, from the root to the key
+        itself, or None for the prefixes that have no node
+    """
+    nodes: List[Optional[_TrieNode]] = [root]
+    node: Optional[_TrieNode] = root
+    for char in key:
+        node = node.children.get(char) if node is not None else None
+        nodes.append(node)
+    return nodes
+
+
+class PersistentTrie:
+    """An immutable set of strings that can be iterated by prefix.
+
+    ``add`` and ``discard`` copy only the nodes on the path of the key (and
+    their child dicts), so a new version costs O(len(key)) and shares the
+    rest of the trie with the original.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, _root: Optional[_TrieNode] = None, _size: int = 0) -> None:
+        """Initialize a trie.
+
+        Args:
+            _root: Root node of an existing trie (internal use only)
+            _size: Number of keys in the trie (internal use only)
+        """
+        self._root = _root if _root is not None else _TrieNode({}, False)
+        self._size = _size
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str]) -> "PersistentTrie":
+        """Build a trie from keys.
+
+        This builds the nodes in place, which is much cheaper than calling
+        ``add`` for every key.
+
+        Args:
+            keys: The keys of the new trie (duplicates are ignored)
+
+        Returns:
+            A new trie with the keys
+        """
+        root = _TrieNode({}, False)
+        size = 0
+        for key in keys:
+            node = root
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _TrieNode({}, False)
+                node = child
+            if not node.terminal:
+                node.terminal = True
+                size += 1
+        return cls(root, size)
+
+    def add(self, key: str) -> "PersistentTrie":
+        """Return a new trie with ``key`` added.
+
+        Args:
+            key: The key to add
+
+        Returns:
+            A new trie, or this trie if it already has the key
+        """
+        nodes = _trie_path(self._root, key)
+        last = nodes[-1]
+        if last is not None and last.terminal:
+            return self
+        node = _TrieNode(last.children if last is not None else {}, True)
+        for depth in range(len(key) - 1, -1, -1):
+            parent = nodes[depth]
+            children = dict(parent.children) if parent is not None else {}
+            children[key[depth]] = node
+            node = _TrieNode(children, parent is not None and parent.terminal)
+        return PersistentTrie(node, self._size + 1)
+
+    def discard(self, key: str) -> "PersistentTrie":
+        """Return a new trie without ``key``.
+
+        Args:
+            key: The key to remove
+
+        Returns:
+            A new trie, or this trie if it does not have the key
+        """
+        nodes = _trie_path(self._root, key)
+        last = nodes[-1]
+        if last is None or not last.terminal:
+            return self
+        node = _TrieNode(last.children, False) if last.children else None
+        for depth in range(len(key) - 1, -1, -1):
+            parent = cast(_TrieNode, nodes[depth])
+            children = dict(parent.children)
+            if node is None:
+                del children[key[depth]]
+            else:
+                children[key[depth]] = node
+            if children or parent.terminal or depth == 0:
+                node = _TrieNode(children, parent.terminal)
+            else:
+                node = None
+        return PersistentTrie(node, self._size - 1)
+
+    def keys(self, prefix: str = "") -> Iterator[str]:
+        """Iterate over the keys that start with a prefix, in sorted order.
+
+        Args:
+            prefix: The prefix of the keys
+
+        Returns:
+            An iterator over the keys
+        """
+        node = _trie_path(self._root, prefix)[-1]
+        stack = [(prefix, node)] if node is not None else []
+        while stack:
+            key, node = stack.pop()
+            if node.terminal:
+                yield key
+            for char in sorted(node.children, reverse=True):
+                stack.append((key + char, node.children[char]))
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is in the trie."""
+        if not isinstance(key, str):
+            return False
+        node = _trie_path(self._root, key)[-1]
+        return node is not None and node.terminal
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys in sorted order."""
+        return self.keys()
+
+    def __len__(self) -> int:
+        """Get the number of keys in the trie."""
+        return self._size
+
+    def __repr__(self) -> str:
+        """Get a debug representation of the trie."""
+        return f"PersistentTrie({list(self.keys())!r})"
@@ -1,25 +1,156 @@
 """Registry for block types in the blockkit package."""
 
+import hashlib
 import importlib.metadata
+import json
 import logging
-from typing import Dict, List, Type
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Type, Union
 
-from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.blocks.base import BaseBlock, remember_kind
 from corelab_blockkit.exceptions import RegistryError
 
 logger = logging.getLogger(__name__)
 
+ENTRY_POINT_GROUP = "blockkit.blocks"
+
+# Version of the entry point cache file format
+_CACHE_VERSION = 1
+
+
+def default_entry_point_cache_path() -> Path:
+    """Get the default location of the entry point cache.
+
+    Returns:
+        ``corelab_blockkit/entry_points.json`` in ``$XDG_CACHE_HOME`` or
+        ``~/.cache``
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "corelab_blockkit" / "entry_points.json"
+
+
+def _distributions_fingerprint() -> str:
+    """Fingerprint the installed distributions without reading their metadata.
+
+    Entry points are declared in the ``.dist-info`` (or ``.egg-info``)
+    directories on ``sys.path``, and installing, upgrading or removing a
+    distribution creates or deletes such a directory. Their names and
+    modification times go into the fingerprint.
+
+    Returns:
+        A hex digest of the interpreter, ``sys.path`` and the metadata
+        directories on it
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(sys.executable.encode("utf-8", "surrogateescape"))
+    for entry in sys.path:
+        digest.update(b"\0" + entry.encode("utf-8", "surrogateescape"))
+        try:
+            if os.path.isfile(entry):
+                # Zipped entries change as a whole
+                digest.update(str(os.stat(entry).st_mtime_ns).encode())
+                continue
+            with os.scandir(entry or ".") as children:
+                names = sorted(
+                    (child.name, child.stat().st_mtime_ns)
+                    for child in children
+                    if child.name.endswith((".dist-info", ".egg-info"))
+                )
+        except OSError:
+            continue
+        for name, mtime in names:
+            digest.update(f"\0{name}:{mtime}".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _discover_entry_points(
+    cache_path: Optional[Union[str, "os.PathLike[str]"]],
+) -> List[importlib.metadata.EntryPoint]:
+    """Discover the block type entry points, using a cache file if given.
+
+    The cache maps entry point names to their ``module:attr`` values and is
+    only used while the fingerprint of the installed distributions matches
+    the one it was written with. Otherwise the distributions are scanned and
+    the cache is rewritten. Unreadable or unwritable cache files are ignored.
+
+    Args:
+        cache_path: The path of the cache file, or None to always scan
+
+    Returns:
+        The entry points of the block type group
+    """
+    if cache_path is None:
+        return list(importlib.metadata.entry_points(group=ENTRY_POINT_GROUP))
+
+    path = Path(cache_path)
+    fingerprint = _distributions_fingerprint()
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        if (
+            cached.get("version") == _CACHE_VERSION
+            and cached.get("fingerprint") == fingerprint
+        ):
+            return [
+                importlib.metadata.EntryPoint(
+                    name=name, value=value, group=ENTRY_POINT_GROUP
+                )
+                for name, value in cached["entry_points"]
+            ]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring invalid entry point cache {path}: {e}")
+
+    entry_points = list(importlib.metadata.entry_points(group=ENTRY_POINT_GROUP))
+    data = {
+        "version": _CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "entry_points": [[ep.name, ep.value] for ep in entry_points],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so readers never see a partial cache
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(data, fp)
+            os.replace(temp_name, path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write entry point cache {path}: {e}")
+    return entry_points
+
 
 class BlockTypeRegistry:
     """Registry for block types.
 
     This registry allows for registering block types and discovering them
-    through entry points.
+    through entry points. Entry points can be indexed without importing them,
+    in which case a plugin is only imported when its kind is first looked up.
+
+    The registry is safe to use from several threads, also without the GIL.
+    Its tables are copied on write: changes build a new dictionary under a
+    lock and then publish it with a single assignment, so lookups read a
+    consistent snapshot without taking the lock.
     """
 
     def __init__(self) -> None:
         """Initialize the registry."""
+        # Never mutated once published, only replaced
         self._types: Dict[str, Type[BaseBlock]] = {}
+        # Entry points that are indexed but not loaded yet, by kind
+        self._pending: Dict[str, importlib.metadata.EntryPoint] = {}
+        # Serializes changes to the tables
+        self._lock = threading.Lock()
+        # Serializes plugin imports, so that each plugin is loaded once. It is
+        # reentrant because plugins may look up kinds while they are imported
+        self._load_lock = threading.RLock()
 
     def register(self, block_class: Type[BaseBlock]) -> None:
         """Register a block type.
@@ -36,12 +167,22 @@ class BlockTypeRegistry:
                 f"Block class {block_class.__name__} has no KIND defined"
             )
 
-        if kind in self._types:
-            raise RegistryError(f"Block type '{kind}' is already registered")
+        with self._lock:
+            if kind in self._types:
+                raise RegistryError(f"Block type '{kind}' is already registered")
+            types = dict(self._types)
+            types[kind] = block_class
+            self._types = types
 
-        self._types[kind] = block_class
+        remember_kind(kind)
         logger.debug(f"Registered block type: {kind}")
 
+    def clear(self) -> None:
+        """Remove all registered block types and indexed entry points."""
+        with self._lock:
+            self._types = {}
+            self._pending = {}
+
     def get(self, kind: str) -> Type[BaseBlock]:
         """Get a block type by kind.
 
@@ -52,29 +193,107 @@ class BlockTypeRegistry:
             The block class
 
         Raises:
-            RegistryError: If the block type is not registered
+            RegistryError: If the block type is not registered, or its plugin
+                cannot be loaded
+        """
+        block_class = self._types.get(kind)
+        if block_class is None:
+            return self._load_pending(kind)
+        return block_class
+
+    def _load_pending(self, kind: str) -> Type[BaseBlock]:
+        """Load and register the indexed entry point of a kind.
+
+        Args:
+            kind: The kind of block to load
+
+        Returns:
+            The block class
+
+        Raises:
+            RegistryError: If no entry point is indexed for the kind, or it
+                cannot be loaded
         """
-        if kind not in self._types:
-            raise RegistryError(f"Block type '{kind}' is not registered")
+        with self._load_lock:
+            # Another thread may have loaded the kind in the meantime
+            block_class = self._types.get(kind)
+            if block_class is not None:
+                return block_class
+
+            with self._lock:
+                entry_point = self._pending.get(kind)
+                if entry_point is None:
+                    raise RegistryError(f"Block type '{kind}' is not registered")
+                pending = dict(self._pending)
+                del pending[kind]
+                self._pending = pending
 
-        return self._types[kind]
+            try:
+                block_class = entry_point.load()
+            except Exception as e:
+                raise RegistryError(
+                    f"Failed to load block type '{kind}' from entry point: {e}"
+                ) from e
+            # Reject a mismatched plugin before it can change the registry
+            if getattr(block_class, "KIND", None) != kind:
+                raise RegistryError(
+                    f"Entry point '{kind}' provides block type "
+                    f"'{getattr(block_class, 'KIND', None)}'"
+                )
+            try:
+                self.register(block_class)
+            except Exception as e:
+                raise RegistryError(
+                    f"Failed to load block type '{kind}' from entry point: {e}"
+                ) from e
+        logger.info(f"Loaded block type from entry point: {entry_point.name}")
+        return block_class
 
     def list_types(self) -> List[str]:
         """List all registered block types.
 
+        Kinds of indexed entry points that are not loaded yet are included.
+
         Returns:
             A list of block type kinds
         """
-        return list(self._types.keys())
+        types, pending = self._types, self._pending
+        return list(types) + [kind for kind in pending if kind not in types]
 
-    def load_entry_points(self) -> None:
+    def load_entry_points(
+        self,
+        lazy: bool = False,
+        cache_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ) -> None:
         """Load block types from entry points.
 
         This method discovers and loads block types from the 'blockkit.blocks'
         entry point group.
+
+        Args:
+            lazy: Only index the entry points by name, without importing them.
+                The name of an entry point must then be the kind of its block
+                type, and the plugin is imported by the first ``get`` of that
+                kind.
+            cache_path: A file to cache the discovered entry points in, e.g.
+                ``default_entry_point_cache_path()``. The cache is reused
+                until a distribution is installed, upgraded or removed, which
+                saves scanning the metadata of every installed distribution.
         """
         try:
-            for entry_point in importlib.metadata.entry_points(group="blockkit.blocks"):
+            entry_points = _discover_entry_points(cache_path)
+            with self._lock:
+                pending = dict(self._pending)
+                for entry_point in entry_points:
+                    if not lazy:
+                        pending.pop(entry_point.name, None)
+                    elif entry_point.name not in self._types:
+                        pending[entry_point.name] = entry_point
+                self._pending = pending
+            if lazy:
+                return
+
+            for entry_point in entry_points:
                 try:
                     block_class = entry_point.load()
                     self.register(block_class)
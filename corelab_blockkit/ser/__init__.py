@@ -1,9 +1,23 @@
 """Serialization and deserialization for blockkit."""
 
+from corelab_blockkit.ser.aio import aload_from_json, asave_to_json
+from corelab_blockkit.ser.archive import BlockArchive, open_archive, write_archive
+from corelab_blockkit.ser.binary_codec import (
+    deserialize_from_binary,
+    serialize_to_binary,
+)
+from corelab_blockkit.ser.bulk import load_many
+from corelab_blockkit.ser.fragments import FragmentCache, fragment_cache
 from corelab_blockkit.ser.json_codec import (
     deserialize_from_json,
+    dump_to_json,
+    iter_blocks_from_json,
+    iter_json_chunks,
+    load_from_json,
     serialize_to_json,
+    serialize_to_json_compiled,
 )
+from corelab_blockkit.ser.patch import deserialize_patch, serialize_patch
 from corelab_blockkit.ser.yaml_codec import (
     deserialize_from_yaml,
     serialize_to_yaml,
@@ -11,7 +25,24 @@ from corelab_blockkit.ser.yaml_codec import (
 
 __all__ = [
     "serialize_to_json",
+    "serialize_to_json_compiled",
+    "dump_to_json",
+    "iter_json_chunks",
     "deserialize_from_json",
+    "iter_blocks_from_json",
+    "load_from_json",
     "serialize_to_yaml",
     "deserialize_from_yaml",
+    "serialize_to_binary",
+    "deserialize_from_binary",
+    "write_archive",
+    "open_archive",
+    "BlockArchive",
+    "serialize_patch",
+    "deserialize_patch",
+    "FragmentCache",
+    "fragment_cache",
+    "load_many",
+    "aload_from_json",
+    "asave_to_json",
 ]
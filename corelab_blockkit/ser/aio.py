@@ -0,0 +1,241 @@
+"""asyncio counterparts of the JSON stream functions for blockkit.
+
+Reading and writing goes through asyncio streams (or, for paths, through
+the executor), and the CPU-heavy encoding and decoding runs in an executor,
+so that large documents do not block the event loop and many loads can
+overlap. Streams are decoded and encoded incrementally, like files, so
+memory does not grow with the size of the document.
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor
+from typing import Any, Iterator, Optional, Union
+
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.list import BlockList
+from corelab_blockkit.ser.json_codec import (
+    DEFAULT_CHUNK_SIZE,
+    dump_to_json,
+    iter_json_chunks,
+    load_from_json,
+    serialize_to_json,
+)
+
+
+def _load_path(path: Union[str, "os.PathLike[str]"], trusted: bool) -> BlockList:
+    """Load a block list from a JSON file.
+
+    Args:
+        path: The path of the file
+        trusted: Construct blocks without validating them
+
+    Returns:
+        The block list
+    """
+    with open(path, "rb") as fp:
+        return load_from_json(fp, trusted=trusted)
+
+
+def _save_path(
+    obj: BlockList,
+    path: Union[str, "os.PathLike[str]"],
+    compiled: bool,
+    kwargs: Any,
+) -> None:
+    """Save a block list to a JSON file.
+
+    Args:
+        obj: The block list
+        path: The path of the file
+        compiled: Encode with pydantic's compiled serializer
+        kwargs: Additional arguments to pass to json.dumps
+    """
+    with open(path, "w", encoding="utf-8") as fp:
+        if compiled:
+            fp.write(serialize_to_json(obj, compiled=True, **kwargs))
+        else:
+            dump_to_json(obj, fp, **kwargs)
+
+
+class _BlockingReader:
+    """A blocking file-like view of an asyncio stream for a worker thread.
+
+    Every ``read`` runs the stream's ``read`` on the event loop and waits
+    for it, so the decoder pulls data only as fast as it consumes it.
+    """
+
+    def __init__(self, source: Any, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialize the reader.
+
+        Args:
+            source: The asyncio stream
+            loop: The event loop that owns the stream
+        """
+        self._source = source
+        self._loop = loop
+        self.closed = False
+
+    async def _read(self, size: int) -> Any:
+        """Read from the stream on the event loop.
+
+        Args:
+            size: The maximum number of bytes to read
+
+        Returns:
+            The data read (empty at the end of the stream)
+        """
+        return await self._source.read(size)
+
+    def read(self, size: int = -1) -> Any:
+        """Read from the stream, blocking the calling thread.
+
+        Args:
+            size: The maximum number of bytes to read
+
+        Returns:
+            The data read (empty at the end of the stream)
+
+        Raises:
+            SerializationError: If the load was cancelled
+        """
+        if self.closed:
+            raise SerializationError("The load was cancelled")
+        return asyncio.run_coroutine_threadsafe(self._read(size), self._loop).result()
+
+
+def _fill(chunks: Iterator[str], buffer: bytearray, size: int) -> None:
+    """Encode JSON text until a buffer holds at least some number of bytes.
+
+    Args:
+        chunks: The remaining JSON text of the document
+        buffer: The buffer to append the UTF-8 encoded text to
+        size: The number of bytes to stop at
+    """
+    while len(buffer) < size:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        buffer += chunk.encode("utf-8")
+
+
+def _compiled_chunks(obj: BlockList, kwargs: Any) -> Iterator[str]:
+    """Encode a block list with the compiled serializer as a single chunk.
+
+    Args:
+        obj: The block list
+        kwargs: Additional arguments for the compiled serializer
+
+    Returns:
+        An iterator over the JSON text
+    """
+    yield serialize_to_json(obj, compiled=True, **kwargs)
+
+
+async def aload_from_json(
+    source: Any,
+    trusted: bool = False,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BlockList:
+    """Deserialize a block list from a JSON file or asyncio stream.
+
+    The document is decoded incrementally in the executor. For a stream,
+    the decoder asks the event loop for ``await source.read(chunk_size)``
+    whenever it needs more data, so only the unread tail of the document is
+    buffered and decoding overlaps with the transfer. Streams need a thread
+    executor, such as the default one.
+
+    Args:
+        source: The path of a file, or an asyncio stream such as
+            ``asyncio.StreamReader`` with an async ``read`` method
+        trusted: Construct blocks without validating them. Only use this for
+            JSON produced by blockkit itself.
+        executor: The executor to decode in (defaults to the event loop's
+            default executor)
+        chunk_size: Number of bytes to read from a stream at a time
+
+    Returns:
+        The deserialized block list
+
+    Raises:
+        SerializationError: If the document cannot be read or deserialized
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            return await loop.run_in_executor(executor, _load_path, source, trusted)
+
+        reader = _BlockingReader(source, loop)
+        try:
+            return await loop.run_in_executor(
+                executor, load_from_json, reader, trusted, chunk_size
+            )
+        finally:
+            # Stop a worker that is still reading after a cancellation
+            reader.closed = True
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to deserialize from JSON: {e}") from e
+
+
+async def asave_to_json(
+    obj: BlockList,
+    target: Any,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> None:
+    """Serialize a block list to a JSON file or asyncio stream.
+
+    The document is encoded in the executor. A path is also written there.
+    A stream receives the UTF-8 encoded document in pieces of
+    ``chunk_size`` bytes, with ``await target.drain()`` after each piece so
+    that slow readers apply backpressure. The blocks are encoded a piece at
+    a time, so the whole document is never held in memory. Streams need a
+    thread executor, such as the default one.
+
+    Args:
+        obj: The block list to serialize
+        target: The path of a file, or an asyncio stream such as
+            ``asyncio.StreamWriter`` with ``write`` and async ``drain``
+            methods
+        executor: The executor to encode in (defaults to the event loop's
+            default executor)
+        chunk_size: Number of bytes to write to a stream at a time
+        **kwargs: Additional arguments to pass to json.dumps, or
+            ``compiled=True`` to encode with pydantic's compiled serializer
+            (see ``serialize_to_json``)
+
+    Raises:
+        SerializationError: If the document cannot be serialized or written
+    """
+    loop = asyncio.get_running_loop()
+    compiled = kwargs.pop("compiled", False)
+    try:
+        if isinstance(target, (str, os.PathLike)):
+            await loop.run_in_executor(
+                executor, _save_path, obj, target, compiled, kwargs
+            )
+            return
+
+        if compiled:
+            chunks = _compiled_chunks(obj, kwargs)
+        else:
+            chunks = iter_json_chunks(obj, **kwargs)
+        buffer = bytearray()
+        while True:
+            if len(buffer) < chunk_size:
+                await loop.run_in_executor(
+                    executor, _fill, chunks, buffer, chunk_size
+                )
+            if not buffer:
+                break
+            target.write(bytes(buffer[:chunk_size]))
+            del buffer[:chunk_size]
+            await target.drain()
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize to JSON: {e}") from e
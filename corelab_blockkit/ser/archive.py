@@ -0,0 +1,358 @@
+"""Memory-mapped block archives for blockkit.
+
+An archive stores blocks one after another, each encoded on its own with the
+binary codec, together with an index. Opening an archive maps the file into
+memory and reads only the fixed-size header, so any single block can be
+fetched by position or ID without reading or parsing the rest of the file.
+
+Layout (all integers little-endian)::
+
+    header    := MAGIC version:u16 kind_count:u16 count:u64
+                 index_offset:u64 kinds_offset:u64
+    blocks    := encoded_block*
+    index     := position_entry[count] id_entry[count]
+    position_entry := id[16] offset:u64 length:u32 kind:u16
+    id_entry  := id[16] position:u32     (sorted by id)
+    kinds     := (length:u16 utf8_bytes)[kind_count]
+"""
+
+import mmap
+import os
+import struct
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple, Union
+from uuid import UUID
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.exceptions import BlockNotFoundError, SerializationError
+from corelab_blockkit.list import BlockList
+from corelab_blockkit.ser.binary_codec import (
+    deserialize_from_binary,
+    serialize_to_binary,
+)
+
+MAGIC = b"BKAR"
+VERSION = 1
+
+_header = struct.Struct("<4sHHQQQ")
+_position_entry = struct.Struct("<16sQIH")
+_id_entry = struct.Struct("<16sI")
+_length = struct.Struct("<H")
+
+
+def write_archive(
+    blocks: Iterable[BaseBlock], target: Union[str, "os.PathLike[str]", IO[bytes]]
+) -> int:
+    """Write blocks to an archive.
+
+    The blocks are encoded and written one at a time, so they can come from a
+    generator such as ``iter_blocks_from_json`` without being held in memory.
+
+    Args:
+        blocks: The blocks to write, e.g. a BlockList
+        target: The path of the archive, or a seekable binary stream at the
+            start of an empty file
+
+    Returns:
+        The number of blocks written
+
+    Raises:
+        SerializationError: If a block cannot be encoded or two blocks have
+            the same ID
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as fp:
+            return write_archive(blocks, fp)
+
+    try:
+        start = target.tell()
+        target.write(b"\0" * _header.size)
+
+        entries: List[Tuple[bytes, int, int, int]] = []
+        kinds: Dict[str, int] = {}
+        seen = set()
+        offset = _header.size
+        for block in blocks:
+            key = block.id.bytes
+            if key in seen:
+                raise SerializationError(f"Duplicate block ID: {block.id}")
+            seen.add(key)
+
+            kind = kinds.setdefault(block.kind, len(kinds))
+            data = serialize_to_binary(block)
+            target.write(data)
+            entries.append((key, offset, len(data), kind))
+            offset += len(data)
+
+        index_offset = offset
+        target.write(b"".join(_position_entry.pack(*entry) for entry in entries))
+        # The ID table is sorted by ID for binary searches
+        order = sorted(range(len(entries)), key=lambda position: entries[position][0])
+        target.write(b"".join(_id_entry.pack(entries[i][0], i) for i in order))
+
+        kinds_offset = index_offset + len(entries) * (
+            _position_entry.size + _id_entry.size
+        )
+        for kind in kinds:
+            encoded = kind.encode("utf-8")
+            target.write(_length.pack(len(encoded)) + encoded)
+
+        end = target.tell()
+        target.seek(start)
+        target.write(
+            _header.pack(
+                MAGIC, VERSION, len(kinds), len(entries), index_offset, kinds_offset
+            )
+        )
+        target.seek(end)
+        return len(entries)
+
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to write archive: {e}") from e
+
+
+class BlockArchive:
+    """Random access to the blocks of an archive file.
+
+    The file is memory-mapped, so only the pages of the blocks that are read
+    are loaded. Lookups by ID use a binary search over the sorted ID table
+    in the file and do not build any in-memory index.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], trusted: bool = False
+    ) -> None:
+        """Open an archive.
+
+        Args:
+            path: The path of the archive
+            trusted: Construct blocks without validating them (only for
+                archives written by ``write_archive``)
+
+        Raises:
+            SerializationError: If the file is not a valid archive
+        """
+        self._trusted = trusted
+        with open(path, "rb") as fp:
+            try:
+                self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SerializationError(f"Invalid archive: {e}") from e
+
+        try:
+            if len(self._mm) < _header.size:
+                raise SerializationError("Invalid archive: file is too short")
+            (
+                magic,
+                version,
+                kind_count,
+                self._count,
+                self._index_offset,
+                kinds_offset,
+            ) = _header.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise SerializationError("Invalid archive: bad magic number")
+            if version != VERSION:
+                raise SerializationError(f"Unsupported archive version: {version}")
+
+            self._ids_offset = self._index_offset + self._count * _position_entry.size
+            self._kinds: List[str] = []
+            position = kinds_offset
+            for _ in range(kind_count):
+                (length,) = _length.unpack_from(self._mm, position)
+                position += _length.size
+                self._kinds.append(
+                    self._mm[position : position + length].decode("utf-8")
+                )
+                position += length
+        except SerializationError:
+            self.close()
+            raise
+        except Exception as e:
+            self.close()
+            raise SerializationError(f"Invalid archive: {e}") from e
+
+    def _entry(self, index: int) -> Tuple[bytes, int, int, int]:
+        """Get the index entry of a block.
+
+        Args:
+            index: The position of the block (negative counts from the end)
+
+        Returns:
+            The ID bytes, offset, length and kind ordinal of the block
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("BlockArchive index out of range")
+        return _position_entry.unpack_from(
+            self._mm, self._index_offset + index * _position_entry.size
+        )
+
+    def _load(self, offset: int, length: int) -> BaseBlock:
+        """Decode the block stored at an offset.
+
+        Args:
+            offset: The offset of the encoded block
+            length: The length of the encoded block
+
+        Returns:
+            The block
+        """
+        return deserialize_from_binary(
+            self._mm[offset : offset + length], BaseBlock, trusted=self._trusted
+        )
+
+    def index_of(self, block_id: UUID) -> int:
+        """Get the position of a block by its ID.
+
+        Args:
+            block_id: The ID of the block to look up
+
+        Returns:
+            The index of the block in the archive
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+        """
+        key = block_id.bytes
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            start = self._ids_offset + middle * _id_entry.size
+            if self._mm[start : start + 16] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self._count:
+            found, position = _id_entry.unpack_from(
+                self._mm, self._ids_offset + low * _id_entry.size
+            )
+            if found == key:
+                return position
+        raise BlockNotFoundError(f"Block with ID {block_id} not found")
+
+    def find_by_id(self, block_id: UUID) -> BaseBlock:
+        """Find a block by its ID.
+
+        Args:
+            block_id: The ID of the block to find
+
+        Returns:
+            The block with the specified ID
+
+        Raises:
+            BlockNotFoundError: If the block is not found
+        """
+        return self[self.index_of(block_id)]
+
+    def kind_of(self, index: int) -> str:
+        """Get the kind of a block without decoding it.
+
+        Args:
+            index: The position of the block
+
+        Returns:
+            The kind of the block
+        """
+        return self._kinds[self._entry(index)[3]]
+
+    def raw(self, index: int) -> bytes:
+        """Get the encoded form of a block without decoding it.
+
+        The result can be decoded with ``deserialize_from_binary``.
+
+        Args:
+            index: The position of the block
+
+        Returns:
+            The encoded block
+        """
+        _, offset, length, _ = self._entry(index)
+        return self._mm[offset : offset + length]
+
+    def ids(self) -> Iterator[UUID]:
+        """Iterate over the block IDs in archive order.
+
+        Returns:
+            An iterator over the block IDs
+        """
+        for index in range(self._count):
+            yield UUID(bytes=self._entry(index)[0])
+
+    def to_block_list(self) -> BlockList:
+        """Decode all blocks into a block list.
+
+        Returns:
+            A BlockList with the blocks of the archive
+        """
+        return BlockList.model_construct(blocks=list(self))
+
+    def close(self) -> None:
+        """Close the memory map of the archive."""
+        self._mm.close()
+
+    def __enter__(self) -> "BlockArchive":
+        """Enter the archive context.
+
+        Returns:
+            The archive
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the archive."""
+        self.close()
+
+    def __iter__(self) -> Iterator[BaseBlock]:
+        """Iterate over the blocks in archive order.
+
+        Returns:
+            An iterator over the blocks
+        """
+        for index in range(self._count):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """Get the number of blocks in the archive.
+
+        Returns:
+            The number of blocks
+        """
+        return self._count
+
+    def __getitem__(self, index: int) -> BaseBlock:
+        """Get a block by position.
+
+        Args:
+            index: The position of the block (negative counts from the end)
+
+        Returns:
+            The block
+        """
+        _, offset, length, _ = self._entry(index)
+        return self._load(offset, length)
+
+
+def open_archive(
+    path: Union[str, "os.PathLike[str]"], trusted: bool = False
+) -> BlockArchive:
+    """Open an archive for random access.
+
+    Args:
+        path: The path of the archive
+        trusted: Construct blocks without validating them (only for archives
+            written by ``write_archive``)
+
+    Returns:
+        The opened archive
+
+    Raises:
+        SerializationError: If the file is not a valid archive
+    """
+    return BlockArchive(path, trusted=trusted)
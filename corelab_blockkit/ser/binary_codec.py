@@ -0,0 +1,441 @@
+"""Compact binary serialization and deserialization for blockkit.
+
+The binary form holds the same information as the JSON form and round-trips
+to exactly the same JSON, but it is smaller and faster to parse:
+
+- block IDs are stored as 16 raw bytes
+- timestamps are stored as integer microseconds since the epoch (plus the
+  UTC offset for timezone-aware values)
+- kinds, tags and dictionary keys are stored once in a per-document string
+  table and referenced by their small ordinal in that table
+- integers use variable-length encoding
+
+Layout (all integers are unsigned LEB128 varints unless noted)::
+
+    document := MAGIC string_count string* root
+    string   := length utf8_bytes
+    root     := ROOT_BLOCK block | (ROOT_BLOCK_LIST | ROOT_LIST) count block*
+    block    := id[16] kind_ref flags created updated tag_count tag_ref*
+                extra_value payload_value [fields_value]
+    created  := zigzag(microseconds) [zigzag(utc_offset_microseconds)]
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, FrozenSet, List, Type, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.list import BlockList
+from corelab_blockkit.registry import registry
+
+MAGIC = b"BKB\x01"
+
+# Kinds of document roots
+_ROOT_BLOCK = 1
+_ROOT_BLOCK_LIST = 2
+_ROOT_LIST = 3
+
+# Block flags
+_FLAG_FAVORITE = 1
+_FLAG_CREATED_AWARE = 2
+_FLAG_UPDATED_AWARE = 4
+_FLAG_FIELDS = 8
+
+# Value tags
+_TAG_NONE = 0
+_TAG_FALSE = 1
+_TAG_TRUE = 2
+_TAG_INT = 3
+_TAG_FLOAT = 4
+_TAG_STR = 5
+_TAG_LIST = 6
+_TAG_DICT = 7
+
+_STANDARD_FIELDS = frozenset({"id", "kind", "meta", "payload"})
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+_double = struct.Struct("<d")
+
+
+class _Writer:
+    """Accumulate the body of a binary document and its string table."""
+
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        self.out = bytearray()
+        self.strings: Dict[str, int] = {}
+
+    def varint(self, value: int) -> None:
+        """Write an unsigned integer as a LEB128 varint."""
+        out = self.out
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def zigzag(self, value: int) -> None:
+        """Write a signed integer as a zigzag-encoded varint."""
+        self.varint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def string_ref(self, value: str) -> None:
+        """Write a reference to a string in the string table."""
+        if type(value) is not str:
+            value = str.__str__(value)
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        self.varint(index)
+
+    def datetime(self, value: datetime) -> bool:
+        """Write a timestamp.
+
+        Returns:
+            True if the timestamp is timezone-aware
+        """
+        offset = value.utcoffset()
+        if offset is None:
+            self.zigzag((value - _EPOCH) // _MICROSECOND)
+            return False
+        self.zigzag((value - _EPOCH_UTC) // _MICROSECOND)
+        self.zigzag(offset // _MICROSECOND)
+        return True
+
+    def value(self, value: Any) -> None:
+        """Write a JSON-compatible value with a type tag."""
+        out = self.out
+        if value is None:
+            out.append(_TAG_NONE)
+        elif value is True:
+            out.append(_TAG_TRUE)
+        elif value is False:
+            out.append(_TAG_FALSE)
+        elif isinstance(value, int):
+            out.append(_TAG_INT)
+            self.zigzag(int(value))
+        elif isinstance(value, float):
+            out.append(_TAG_FLOAT)
+            out += _double.pack(value)
+        elif isinstance(value, str):
+            encoded = str.__str__(value).encode("utf-8")
+            out.append(_TAG_STR)
+            self.varint(len(encoded))
+            out += encoded
+        elif isinstance(value, dict):
+            out.append(_TAG_DICT)
+            self.varint(len(value))
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise SerializationError(
+                        f"Dictionary keys must be strings, got {type(key)}"
+                    )
+                self.string_ref(key)
+                self.value(item)
+        elif isinstance(value, (list, tuple)):
+            out.append(_TAG_LIST)
+            self.varint(len(value))
+            for item in value:
+                self.value(item)
+        # The same conversions as BlockJSONEncoder
+        elif isinstance(value, UUID):
+            self.value(str(value))
+        elif isinstance(value, datetime):
+            self.value(value.isoformat())
+        elif isinstance(value, BaseModel):
+            self.value(value.model_dump())
+        else:
+            raise SerializationError(f"Unsupported value type: {type(value)}")
+
+    def block(self, block: BaseBlock) -> None:
+        """Write a block."""
+        meta = block.meta
+        self.out += block.id.bytes
+        self.string_ref(block.kind)
+
+        flags_position = len(self.out)
+        self.out.append(0)
+        flags = _FLAG_FAVORITE if meta.is_favorite else 0
+        if self.datetime(meta.created_at):
+            flags |= _FLAG_CREATED_AWARE
+        if self.datetime(meta.updated_at):
+            flags |= _FLAG_UPDATED_AWARE
+
+        self.varint(len(meta.tags))
+        for tag in meta.tags:
+            self.string_ref(tag)
+        self.value(meta.extra)
+        self.value(block.payload)
+
+        fields = _extra_fields(type(block))
+        if fields:
+            flags |= _FLAG_FIELDS
+            self.value(block.model_dump(include=set(fields)))
+        self.out[flags_position] = flags
+
+    def document(self, root: int, body: bytes) -> bytes:
+        """Assemble a document from its root kind and encoded body."""
+        header = _Writer()
+        header.out += MAGIC
+        header.varint(len(self.strings))
+        for value in self.strings:
+            encoded = value.encode("utf-8")
+            header.varint(len(encoded))
+            header.out += encoded
+        header.out.append(root)
+        return bytes(header.out) + body
+
+
+_fields_cache: Dict[Type[BaseBlock], FrozenSet[str]] = {}
+
+
+def _extra_fields(block_class: Type[BaseBlock]) -> FrozenSet[str]:
+    """Get the model fields of a block class beyond the standard four.
+
+    Args:
+        block_class: The block class
+
+    Returns:
+        The names of the additional fields
+    """
+    fields = _fields_cache.get(block_class)
+    if fields is None:
+        fields = frozenset(block_class.model_fields) - _STANDARD_FIELDS
+        _fields_cache[block_class] = fields
+    return fields
+
+
+class _Reader:
+    """Decode a binary document."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize the reader.
+
+        Args:
+            data: The encoded document
+        """
+        self.data = data
+        self.pos = 0
+        self.strings: List[str] = []
+
+    def byte(self) -> int:
+        """Read a single byte."""
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+
+    def varint(self) -> int:
+        """Read an unsigned LEB128 varint."""
+        data = self.data
+        pos = self.pos
+        result = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self.pos = pos
+                return result
+            shift += 7
+
+    def zigzag(self) -> int:
+        """Read a signed zigzag-encoded varint."""
+        value = self.varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def raw(self, length: int) -> bytes:
+        """Read a number of raw bytes."""
+        end = self.pos + length
+        if end > len(self.data):
+            raise SerializationError("Unexpected end of binary data")
+        value = self.data[self.pos : end]
+        self.pos = end
+        return bytes(value)
+
+    def string_ref(self) -> str:
+        """Read a reference to a string in the string table."""
+        return self.strings[self.varint()]
+
+    def datetime(self, aware: bool) -> datetime:
+        """Read a timestamp."""
+        micros = self.zigzag()
+        if not aware:
+            return _EPOCH + timedelta(microseconds=micros)
+        offset = timezone(timedelta(microseconds=self.zigzag()))
+        return (_EPOCH_UTC + timedelta(microseconds=micros)).astimezone(offset)
+
+    def value(self) -> Any:
+        """Read a tagged value."""
+        tag = self.byte()
+        if tag == _TAG_STR:
+            return self.raw(self.varint()).decode("utf-8")
+        if tag == _TAG_DICT:
+            return {self.string_ref(): self.value() for _ in range(self.varint())}
+        if tag == _TAG_LIST:
+            return [self.value() for _ in range(self.varint())]
+        if tag == _TAG_INT:
+            return self.zigzag()
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_FLOAT:
+            return _double.unpack(self.raw(8))[0]
+        raise SerializationError(f"Invalid value tag: {tag}")
+
+    def block_data(self) -> Dict[str, Any]:
+        """Read a block in its dictionary form."""
+        block_id = UUID(bytes=self.raw(16))
+        kind = self.string_ref()
+        flags = self.byte()
+        created_at = self.datetime(bool(flags & _FLAG_CREATED_AWARE))
+        updated_at = self.datetime(bool(flags & _FLAG_UPDATED_AWARE))
+        tags = [self.string_ref() for _ in range(self.varint())]
+        extra = self.value()
+        payload = self.value()
+
+        data = {
+            "id": block_id,
+            "kind": kind,
+            "meta": {
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "is_favorite": bool(flags & _FLAG_FAVORITE),
+                "tags": tags,
+                "extra": extra,
+            },
+            "payload": payload,
+        }
+        if flags & _FLAG_FIELDS:
+            data.update(self.value())
+        return data
+
+    def header(self) -> int:
+        """Read the header and string table.
+
+        Returns:
+            The kind of document root
+        """
+        if self.raw(len(MAGIC)) != MAGIC:
+            raise SerializationError("Invalid binary data: bad magic number")
+        self.strings = [
+            self.raw(self.varint()).decode("utf-8") for _ in range(self.varint())
+        ]
+        return self.byte()
+
+
+def serialize_to_binary(obj: Union[BaseBlock, BlockList, List[BaseBlock]]) -> bytes:
+    """Serialize a block, block list, or list of blocks to the binary form.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        The encoded bytes
+
+    Raises:
+        SerializationError: If serialization fails
+    """
+    try:
+        writer = _Writer()
+        if isinstance(obj, BaseBlock):
+            root = _ROOT_BLOCK
+            writer.block(obj)
+        elif isinstance(obj, (BlockList, list)):
+            root = _ROOT_BLOCK_LIST if isinstance(obj, BlockList) else _ROOT_LIST
+            writer.varint(len(obj))
+            for block in obj:
+                if not isinstance(block, BaseBlock):
+                    raise SerializationError(f"Unsupported object type: {type(block)}")
+                writer.block(block)
+        else:
+            raise SerializationError(f"Unsupported object type: {type(obj)}")
+
+        return writer.document(root, bytes(writer.out))
+
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize to binary: {e}") from e
+
+
+def deserialize_from_binary(
+    data: bytes,
+    target_type: Type[Union[BaseBlock, BlockList]] = BlockList,
+    trusted: bool = False,
+) -> Union[BaseBlock, BlockList]:
+    """Deserialize the binary form to a block or block list.
+
+    Args:
+        data: The encoded bytes
+        target_type: The type to deserialize to (BaseBlock or BlockList)
+        trusted: Construct blocks without validating them. Only use this for
+            data produced by ``serialize_to_binary``.
+
+    Returns:
+        The deserialized object
+
+    Raises:
+        SerializationError: If deserialization fails
+    """
+    try:
+        reader = _Reader(memoryview(data))
+        root = reader.header()
+
+        if target_type == BlockList:
+            if root not in (_ROOT_BLOCK_LIST, _ROOT_LIST):
+                raise SerializationError("Invalid binary format for BlockList")
+            blocks = [
+                _load_block(reader.block_data(), trusted)
+                for _ in range(reader.varint())
+            ]
+            result: Union[BaseBlock, BlockList] = BlockList.model_construct(
+                blocks=blocks
+            )
+
+        elif isinstance(target_type, type) and issubclass(target_type, BaseBlock):
+            if root != _ROOT_BLOCK:
+                raise SerializationError("Invalid binary format for BaseBlock")
+            result = _load_block(reader.block_data(), trusted)
+
+        else:
+            raise SerializationError(f"Unsupported target type: {target_type}")
+
+        if reader.pos != len(data):
+            raise SerializationError("Invalid binary data: trailing bytes")
+        return result
+
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to deserialize from binary: {e}") from e
+
+
+def _load_block(block_data: Dict[str, Any], trusted: bool) -> BaseBlock:
+    """Create a block of a registered type from its dictionary form.
+
+    Args:
+        block_data: The dictionary form of the block
+        trusted: Construct the block without validating it
+
+    Returns:
+        The block
+
+    Raises:
+        SerializationError: If the block cannot be created
+    """
+    kind = block_data["kind"]
+    try:
+        return registry.get(kind).from_dict(block_data, trusted)
+    except Exception as e:
+        raise SerializationError(
+            f"Failed to deserialize block of kind '{kind}': {e}"
+        ) from e
@@ -0,0 +1,114 @@
+"""Loading many block list files in parallel for blockkit.
+
+Files are parsed and validated in worker processes. Each worker sends the
+block list back in the compact binary format instead of a pickled graph of
+pydantic models, and the parent rebuilds it without validating it again.
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.list import BlockList
+from corelab_blockkit.ser.binary_codec import (
+    deserialize_from_binary,
+    serialize_to_binary,
+)
+from corelab_blockkit.ser.json_codec import deserialize_from_json
+from corelab_blockkit.ser.yaml_codec import deserialize_from_yaml
+
+PathType = Union[str, "os.PathLike[str]"]
+
+_DESERIALIZERS: Dict[str, Callable[..., Any]] = {
+    ".json": deserialize_from_json,
+    ".yaml": deserialize_from_yaml,
+    ".yml": deserialize_from_yaml,
+}
+
+
+def _load_file(path: PathType, trusted: bool) -> Tuple[bool, Any]:
+    """Load a block list file and encode it for the parent process.
+
+    Args:
+        path: The path of a JSON or YAML block list
+        trusted: Construct blocks without validating them
+
+    Returns:
+        True and the binary encoding of the block list, or False and an
+        error message
+    """
+    try:
+        deserialize = _DESERIALIZERS.get(Path(path).suffix.lower())
+        if deserialize is None:
+            return False, f"Unsupported file type: {Path(path).suffix or path}"
+        with open(path, encoding="utf-8") as fp:
+            block_list = deserialize(fp.read(), BlockList, trusted=trusted)
+        return True, serialize_to_binary(block_list)
+    except Exception as e:
+        return False, str(e)
+
+
+def _result(path: PathType, future: Future) -> Union[BlockList, SerializationError]:
+    """Turn the outcome of a worker into a block list or an error.
+
+    Args:
+        path: The path of the file
+        future: The finished future of the worker
+
+    Returns:
+        The block list, or the error that prevented loading it
+    """
+    try:
+        ok, data = future.result()
+        if ok:
+            # The worker has validated the blocks already
+            return deserialize_from_binary(data, BlockList, trusted=True)
+    except Exception as e:
+        data = str(e) or type(e).__name__
+    return SerializationError(f"Failed to load {os.fspath(path)}: {data}")
+
+
+def load_many(
+    paths: Iterable[PathType],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    trusted: bool = False,
+    initializer: Optional[Callable[[], None]] = None,
+) -> Iterator[Tuple[PathType, Union[BlockList, SerializationError]]]:
+    """Load many JSON and YAML block list files in parallel.
+
+    The format of each file is chosen by its extension (``.json``,
+    ``.yaml`` or ``.yml``). A file that cannot be read or deserialized does
+    not stop the others; its result is a SerializationError instead of a
+    block list.
+
+    Workers only know the block types that are registered when
+    ``corelab_blockkit`` is imported. Pass an ``initializer`` to register
+    other types in every worker, e.g. by calling
+    ``registry.load_entry_points``.
+
+    Args:
+        paths: The paths of the files
+        workers: The number of worker processes (defaults to the number of
+            CPUs)
+        ordered: Yield the results in the order of ``paths``. Otherwise
+            they are yielded as soon as they are ready.
+        trusted: Construct blocks without validating them. Only use this for
+            files written by blockkit itself.
+        initializer: A function to call in every worker when it starts
+
+    Returns:
+        An iterator over pairs of each path and its block list or error
+    """
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+    try:
+        futures = {pool.submit(_load_file, path, trusted): path for path in paths}
+        finished = futures if ordered else as_completed(futures)
+        for future in finished:
+            path = futures[future]
+            yield path, _result(path, future)
+    finally:
+        # Skip the files that have not started when iteration stops early
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,116 @@
+"""A cache of encoded blocks shared by the blockkit codecs.
+
+Blocks are immutable, so the text a codec writes for a block with given
+options never changes. The codecs keep that text in a bounded LRU cache and
+splice it into the enclosing document, so re-serializing a block list only
+encodes the blocks that changed since the last time. Edited block lists
+share their unchanged block objects with earlier versions, which is what
+makes identity a good cache key.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from corelab_blockkit.blocks.base import BaseBlock
+
+# Enough for a few formats of a list with tens of thousands of blocks
+DEFAULT_FRAGMENT_CACHE_SIZE = 65_536
+
+
+class FragmentCache:
+    """A bounded LRU cache of encoded blocks, keyed by block identity.
+
+    Entries hold a weak reference to their block, so the cache never keeps a
+    block alive, and an entry is never returned for a different block that
+    happens to reuse the ``id`` of a collected one.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_FRAGMENT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: The maximum number of entries (0 disables the cache)
+        """
+        # (id(block), key) -> (weak reference to the block, encoded block)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """Get the maximum number of entries.
+
+        Returns:
+            The maximum number of entries
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        """Set the maximum number of entries, evicting entries if needed.
+
+        Args:
+            maxsize: The maximum number of entries (0 disables the cache)
+        """
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def get(self, block: BaseBlock, key: Hashable) -> Optional[str]:
+        """Get the cached encoding of a block.
+
+        Args:
+            block: The block
+            key: The format and options of the encoding
+
+        Returns:
+            The encoded block, or None if it is not cached
+        """
+        entry_key = (id(block), key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return None
+            if entry[0]() is not block:
+                # The block was collected and its id reused
+                del self._entries[entry_key]
+                return None
+            self._entries.move_to_end(entry_key)
+            return entry[1]
+
+    def put(self, block: BaseBlock, key: Hashable, fragment: str) -> None:
+        """Cache the encoding of a block.
+
+        Args:
+            block: The block
+            key: The format and options of the encoding
+            fragment: The encoded block
+        """
+        if self._maxsize <= 0:
+            return
+        entry_key = (id(block), key)
+        with self._lock:
+            self._entries[entry_key] = (weakref.ref(block), fragment)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Get the number of entries.
+
+        Returns:
+            The number of cached encodings
+        """
+        return len(self._entries)
+
+
+# The cache used by the JSON and YAML codecs
+fragment_cache = FragmentCache()
@@ -1,16 +1,32 @@
 """JSON serialization and deserialization for blockkit."""
 
+import codecs
+import inspect
+import io
 import json
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Type, Union
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from corelab_blockkit.blocks.base import BaseBlock
 from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.lazy import LazyBlockList
 from corelab_blockkit.list import BlockList
 from corelab_blockkit.registry import registry
+from corelab_blockkit.ser.fragments import fragment_cache
 
 
 class BlockJSONEncoder(json.JSONEncoder):
@@ -34,13 +50,50 @@ class BlockJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+_blocks_adapter = TypeAdapter(List[BaseBlock])
+_COMPILED_OPTIONS = frozenset({"indent", "ensure_ascii", "separators"})
+
+# pydantic only accepts ensure_ascii from 2.12 on; with older versions the
+# non-ASCII characters are escaped after encoding instead
+_COMPILED_ENSURE_ASCII = (
+    "ensure_ascii" in inspect.signature(BaseModel.model_dump_json).parameters
+)
+_NON_ASCII = re.compile(r"[^\x00-\x7f]+")
+
+# json.dumps options that encode a block the same way on its own as inside a
+# block list, so that cached blocks can be spliced into the document
+_FRAGMENT_OPTIONS = frozenset(
+    {
+        "indent",
+        "separators",
+        "ensure_ascii",
+        "sort_keys",
+        "allow_nan",
+        "skipkeys",
+        "check_circular",
+    }
+)
+
+
 def serialize_to_json(
-    obj: Union[BaseBlock, BlockList, List[BaseBlock]], **kwargs: Any
+    obj: Union[BaseBlock, BlockList, List[BaseBlock]],
+    compiled: bool = False,
+    **kwargs: Any,
 ) -> str:
     """Serialize a block, block list, or list of blocks to JSON.
 
+    Blocks of block lists and lists of blocks are encoded one at a time and
+    kept in ``fragment_cache``, so serializing a list again after a few edits
+    only encodes the blocks that changed. Options other than ``indent``,
+    ``separators``, ``ensure_ascii``, ``sort_keys``, ``allow_nan``,
+    ``skipkeys`` and ``check_circular`` bypass the cache.
+
     Args:
         obj: The object to serialize
+        compiled: Encode with pydantic's compiled serializer instead of
+            json.dumps. This is much faster and writes the same documents,
+            but only supports ``indent``, ``ensure_ascii`` and ``separators``
+            (see ``serialize_to_json_compiled``).
         **kwargs: Additional arguments to pass to json.dumps
 
     Returns:
@@ -49,20 +102,305 @@ def serialize_to_json(
     Raises:
         SerializationError: If serialization fails
     """
+    if compiled:
+        unsupported = set(kwargs) - _COMPILED_OPTIONS
+        if unsupported:
+            raise SerializationError(
+                "Unsupported arguments for compiled JSON serialization: "
+                + ", ".join(sorted(unsupported))
+            )
+        return serialize_to_json_compiled(obj, **kwargs)
+    if _fragment_key(obj, kwargs, 0) is not None:
+        return "".join(iter_json_chunks(obj, **kwargs))
     try:
         return json.dumps(obj, cls=BlockJSONEncoder, **kwargs)
     except Exception as e:
         raise SerializationError(f"Failed to serialize to JSON: {e}") from e
 
 
+def serialize_to_json_compiled(
+    obj: Union[BaseBlock, BlockList, List[BaseBlock]],
+    indent: Optional[int] = None,
+    ensure_ascii: bool = True,
+    separators: Optional[Tuple[str, str]] = None,
+) -> str:
+    """Serialize to JSON with pydantic's compiled serializer.
+
+    The whole document is encoded by pydantic-core without building an
+    intermediate dict tree or calling back into Python for every UUID,
+    timestamp and model. The result has the same structure and values as
+    ``serialize_to_json``. With an ``indent`` the text is identical except
+    that some floats are spelled differently (``0.00001`` instead of
+    ``1e-05``). Without an ``indent`` the output is compact, as with
+    ``separators=(",", ":")``.
+
+    Args:
+        obj: The object to serialize
+        indent: Number of spaces to indent nested values by
+        ensure_ascii: Escape all non-ASCII characters
+        separators: Item and key separators. Only the ones pydantic writes
+            are supported: ``(",", ": ")`` with an indent and
+            ``(",", ":")`` without one.
+
+    Returns:
+        The JSON string
+
+    Raises:
+        SerializationError: If serialization fails or an option is not
+            supported
+    """
+    if indent is not None and not isinstance(indent, int):
+        raise SerializationError(
+            "Compiled JSON serialization only supports integer indents"
+        )
+    if separators is not None:
+        expected = (",", ": ") if indent is not None else (",", ":")
+        if tuple(separators) != expected:
+            raise SerializationError(
+                f"Compiled JSON serialization only supports separators {expected}"
+            )
+
+    options: Dict[str, Any] = {"indent": indent, "serialize_as_any": True}
+    if _COMPILED_ENSURE_ASCII:
+        options["ensure_ascii"] = ensure_ascii
+    try:
+        if isinstance(obj, (BaseBlock, BlockList)):
+            text = obj.model_dump_json(**options)
+        elif isinstance(obj, list):
+            text = _blocks_adapter.dump_json(obj, **options).decode("utf-8")
+        else:
+            raise SerializationError(f"Unsupported object type: {type(obj)}")
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize to JSON: {e}") from e
+    if ensure_ascii and not _COMPILED_ENSURE_ASCII:
+        text = _escape_non_ascii(text)
+    return text
+
+
+def _escape_non_ascii(text: str) -> str:
+    """Escape the non-ASCII characters of a JSON document as json.dumps does.
+
+    Non-ASCII characters can only occur inside strings, so they can be
+    replaced in the encoded text.
+
+    Args:
+        text: The JSON text
+
+    Returns:
+        The JSON text with only ASCII characters
+    """
+    return _NON_ASCII.sub(
+        lambda match: json.encoder.encode_basestring_ascii(match.group())[1:-1],
+        text,
+    )
+
+
+def _fragment_key(obj: Any, kwargs: Dict[str, Any], level: int) -> Any:
+    """Get the fragment cache key for the blocks of a document.
+
+    Args:
+        obj: The object being serialized
+        kwargs: The json.dumps options
+        level: The nesting level of the blocks in the document
+
+    Returns:
+        The cache key, or None if the blocks cannot be cached
+    """
+    if isinstance(obj, list):
+        if not all(isinstance(item, BaseBlock) for item in obj):
+            return None
+    elif not isinstance(obj, BlockList):
+        return None
+    if not _FRAGMENT_OPTIONS.issuperset(kwargs):
+        return None
+    key = ("json", level, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def iter_json_chunks(
+    obj: Union[BaseBlock, BlockList, List[BaseBlock]], **kwargs: Any
+) -> Iterator[str]:
+    """Serialize a block, block list, or list of blocks to JSON piece by piece.
+
+    Every block is encoded and yielded on its own, so the full document is
+    never held in memory. Joining the chunks gives exactly the same string
+    as ``serialize_to_json`` with the same arguments. Blocks are taken from
+    and added to ``fragment_cache`` as in ``serialize_to_json``.
+
+    Args:
+        obj: The object to serialize
+        **kwargs: Additional arguments to pass to json.dumps
+
+    Returns:
+        An iterator over the JSON text
+
+    Raises:
+        SerializationError: If serialization fails
+    """
+    if isinstance(obj, BlockList):
+        blocks: Any = obj
+        envelope = True
+    elif isinstance(obj, list):
+        blocks = obj
+        envelope = False
+    else:
+        yield serialize_to_json(obj, **kwargs)
+        return
+
+    indent = kwargs.get("indent")
+    if isinstance(indent, int):
+        indent = " " * indent
+    separators = kwargs.get("separators")
+    if separators is not None:
+        item_separator, key_separator = separators
+    elif indent is not None:
+        item_separator, key_separator = ",", ": "
+    else:
+        item_separator, key_separator = ", ", ": "
+
+    # The blocks are nested one level deeper inside the {"blocks": ...} envelope
+    level = 2 if envelope else 1
+    if indent is not None:
+        newline = "\n" + indent * level
+        item_separator += newline
+        array_start = "[" + newline
+        array_end = "\n" + indent * (level - 1) + "]"
+    else:
+        newline = ""
+        array_start, array_end = "[", "]"
+
+    if envelope:
+        outer = "\n" + indent if indent is not None else ""
+        head = "{" + outer + '"blocks"' + key_separator
+        tail = "\n}" if indent is not None else "}"
+    else:
+        head = tail = ""
+
+    key = _fragment_key(obj, kwargs, level)
+    try:
+        first = True
+        for block in blocks:
+            encoded = None if key is None else fragment_cache.get(block, key)
+            if encoded is None:
+                encoded = json.dumps(
+                    block.model_dump(), cls=BlockJSONEncoder, **kwargs
+                )
+                if newline:
+                    encoded = encoded.replace("\n", newline)
+                if key is not None:
+                    fragment_cache.put(block, key, encoded)
+            if first:
+                yield head + array_start + encoded
+                first = False
+            else:
+                yield item_separator + encoded
+        yield head + "[]" + tail if first else array_end + tail
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize to JSON: {e}") from e
+
+
+def dump_to_json(
+    obj: Union[BaseBlock, BlockList, List[BaseBlock]],
+    fp: IO[Any],
+    encoding: str = "utf-8",
+    **kwargs: Any,
+) -> None:
+    """Serialize a block, block list, or list of blocks to JSON in a stream.
+
+    Each block is written as soon as it has been encoded.
+
+    Args:
+        obj: The object to serialize
+        fp: A text or binary stream to write to
+        encoding: The encoding used for binary streams
+        **kwargs: Additional arguments to pass to json.dumps
+
+    Raises:
+        SerializationError: If serialization fails
+    """
+    binary = _is_binary_stream(fp)
+    for chunk in iter_json_chunks(obj, **kwargs):
+        fp.write(chunk.encode(encoding) if binary else chunk)
+
+
+def _is_binary_stream(fp: Any) -> bool:
+    """Check whether a stream expects bytes rather than text.
+
+    Args:
+        fp: The stream to check
+
+    Returns:
+        True for binary streams
+    """
+    if isinstance(fp, io.TextIOBase):
+        return False
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(fp, "mode", "")
+
+
+def _load_blocks(blocks_data: List[Any], trusted: bool) -> List[BaseBlock]:
+    """Create the blocks of a block list from their dictionary forms.
+
+    The blocks are grouped by kind, so that every block class is looked up
+    once and validates all of its blocks in one ``validate_many`` call. The
+    blocks are returned in their original order.
+
+    Args:
+        blocks_data: The dictionary forms of the blocks
+        trusted: Construct the blocks without validating them
+
+    Returns:
+        The blocks
+
+    Raises:
+        SerializationError: If a block cannot be created
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, block_data in enumerate(blocks_data):
+        if not isinstance(block_data, dict) or "kind" not in block_data:
+            raise SerializationError("Invalid block data: missing 'kind' field")
+        groups.setdefault(block_data["kind"], []).append(index)
+
+    blocks: List[Any] = [None] * len(blocks_data)
+    for kind, indices in groups.items():
+        group = [blocks_data[index] for index in indices]
+        try:
+            block_class = registry.get(kind)
+            if trusted:
+                loaded = [block_class.from_trusted(block_data) for block_data in group]
+            else:
+                loaded = block_class.validate_many(group)
+        except Exception as e:
+            raise SerializationError(
+                f"Failed to deserialize block of kind '{kind}': {e}"
+            ) from e
+        for index, block in zip(indices, loaded):
+            blocks[index] = block
+    return blocks
+
+
 def deserialize_from_json(
-    json_str: str, target_type: Type[Union[BaseBlock, BlockList]] = BlockList
-) -> Union[BaseBlock, BlockList]:
+    json_str: str,
+    target_type: Type[Union[BaseBlock, BlockList]] = BlockList,
+    trusted: bool = False,
+    lazy: bool = False,
+) -> Union[BaseBlock, BlockList, LazyBlockList]:
     """Deserialize a JSON string to a block or block list.
 
     Args:
         json_str: The JSON string to deserialize
         target_type: The type to deserialize to (BaseBlock or BlockList)
+        trusted: Construct blocks without validating them. Only use this for
+            JSON produced by ``serialize_to_json``.
+        lazy: Return a LazyBlockList that validates each block on first
+            access instead of a BlockList (only for block lists)
 
     Returns:
         The deserialized object
@@ -78,21 +416,13 @@ def deserialize_from_json(
             if not isinstance(data, dict) or "blocks" not in data:
                 raise SerializationError("Invalid JSON format for BlockList")
 
-            blocks = []
-            for block_data in data["blocks"]:
-                if not isinstance(block_data, dict) or "kind" not in block_data:
-                    raise SerializationError("Invalid block data: missing 'kind' field")
+            if lazy:
+                return LazyBlockList(data["blocks"], trusted=trusted)
 
-                kind = block_data["kind"]
-                try:
-                    block_class = registry.get(kind)
-                    blocks.append(block_class.model_validate(block_data))
-                except Exception as e:
-                    raise SerializationError(
-                        f"Failed to deserialize block of kind '{kind}': {e}"
-                    ) from e
+            blocks = _load_blocks(data["blocks"], trusted)
 
-            return BlockList(blocks=blocks)
+            # The blocks are validated already, so don't validate them again
+            return BlockList.model_construct(blocks=blocks)
 
         elif issubclass(target_type, BaseBlock):
             # Deserialize a single block
@@ -102,7 +432,7 @@ def deserialize_from_json(
             kind = data["kind"]
             try:
                 block_class = registry.get(kind)
-                return block_class.model_validate(data)
+                return block_class.from_dict(data, trusted)
             except Exception as e:
                 raise SerializationError(
                     f"Failed to deserialize block of kind '{kind}': {e}"
@@ -115,3 +445,240 @@ def deserialize_from_json(
         raise
     except Exception as e:
         raise SerializationError(f"Failed to deserialize from JSON: {e}") from e
+
+
+# Default number of characters (or bytes) read from a stream at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JSONStreamReader:
+    """Incrementally read JSON values from a text or binary stream.
+
+    Only the unread tail of the stream is buffered, so memory stays bounded
+    by the chunk size plus the largest single value that is decoded.
+    """
+
+    def __init__(self, fp: IO[Any], chunk_size: int) -> None:
+        """Initialize the reader.
+
+        Args:
+            fp: The stream to read from
+            chunk_size: Number of characters (or bytes) to read at a time
+        """
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder: Optional[codecs.IncrementalDecoder] = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Read more data into the buffer.
+
+        Args:
+            size: Number of characters (or bytes) to read
+
+        Returns:
+            False if the stream is exhausted
+        """
+        if self._eof:
+            return False
+
+        # Drop the consumed part of the buffer
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+        chunk = self._fp.read(size)
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if self._text_decoder is None:
+                self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            text = self._text_decoder.decode(bytes(chunk), final=not chunk)
+        else:
+            text = chunk
+
+        if not chunk:
+            self._eof = True
+        self._buffer += text
+        return bool(text) or not self._eof
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it.
+
+        Returns:
+            The next character, or an empty string at the end of the stream
+        """
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``chars``.
+
+        Args:
+            chars: The allowed characters
+
+        Returns:
+            The consumed character
+
+        Raises:
+            SerializationError: If another character (or the end of the stream) follows
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of stream"
+            raise SerializationError(
+                f"Invalid JSON: expected one of {chars!r}, got {found}"
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next JSON value.
+
+        Returns:
+            The decoded value
+
+        Raises:
+            SerializationError: If the value is not valid JSON
+        """
+        self.peek()
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill(read_size):
+                    # Read twice as much next time, so that a value larger than
+                    # the chunk size is only re-parsed a logarithmic number of times
+                    read_size = max(read_size, len(self._buffer))
+                    continue
+                raise SerializationError(f"Invalid JSON: {e}") from e
+
+            if end == len(self._buffer) and self._fill(read_size):
+                # A number at the end of the buffer may continue in the next chunk
+                continue
+            self._pos = end
+            return value
+
+
+def iter_blocks_from_json(
+    fp: IO[Any], trusted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[BaseBlock]:
+    """Iterate over the blocks of a serialized block list in a stream.
+
+    The ``{"blocks": [...]}`` envelope is parsed incrementally and every block
+    is validated and yielded as soon as it has been read, so the whole
+    document is never held in memory.
+
+    Args:
+        fp: A text or binary stream containing a JSON block list
+        trusted: Construct blocks without validating them. Only use this for
+            JSON produced by blockkit itself.
+        chunk_size: Number of characters (or bytes) to read at a time
+
+    Returns:
+        An iterator over the blocks in document order
+
+    Raises:
+        SerializationError: If the stream is not a valid JSON block list
+    """
+    reader = _JSONStreamReader(fp, chunk_size)
+    reader.expect("{")
+    found_blocks = False
+
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == "blocks" and not found_blocks:
+                found_blocks = True
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        yield _load_streamed_block(reader.value(), trusted)
+                        if reader.expect(",]") == "]":
+                            break
+            else:
+                # Other keys of the envelope are read and ignored
+                reader.value()
+
+            if reader.expect(",}") == "}":
+                break
+
+    if not found_blocks:
+        raise SerializationError("Invalid JSON format for BlockList")
+    if reader.peek():
+        raise SerializationError("Invalid JSON: extra data after the block list")
+
+
+def _load_streamed_block(block_data: Any, trusted: bool) -> BaseBlock:
+    """Create a block from one decoded element of the "blocks" array.
+
+    Args:
+        block_data: The decoded block
+        trusted: Construct the block without validating it
+
+    Returns:
+        The block
+
+    Raises:
+        SerializationError: If the block is invalid
+    """
+    if not isinstance(block_data, dict) or "kind" not in block_data:
+        raise SerializationError("Invalid block data: missing 'kind' field")
+
+    kind = block_data["kind"]
+    try:
+        block_class = registry.get(kind)
+        return block_class.from_dict(block_data, trusted)
+    except Exception as e:
+        raise SerializationError(
+            f"Failed to deserialize block of kind '{kind}': {e}"
+        ) from e
+
+
+def load_from_json(
+    fp: IO[Any], trusted: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> BlockList:
+    """Deserialize a block list from a stream.
+
+    Unlike ``deserialize_from_json``, the JSON document is never read into
+    memory as a whole.
+
+    Args:
+        fp: A text or binary stream containing a JSON block list
+        trusted: Construct blocks without validating them. Only use this for
+            JSON produced by blockkit itself.
+        chunk_size: Number of characters (or bytes) to read at a time
+
+    Returns:
+        The deserialized block list
+
+    Raises:
+        SerializationError: If the stream is not a valid JSON block list
+    """
+    try:
+        blocks = list(
+            iter_blocks_from_json(fp, trusted=trusted, chunk_size=chunk_size)
+        )
+        # The blocks are validated already, so don't validate them again
+        return BlockList.model_construct(blocks=blocks)
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to deserialize from JSON: {e}") from e
@@ -0,0 +1,101 @@
+"""Serialization and deserialization of block list patches for blockkit.
+
+A patch is the list of operations returned by ``BlockList.diff``. Its JSON
+form is an object with an ``ops`` array, where every operation is tagged by
+its ``op`` field and added or replaced blocks use the same form as in a
+serialized block list::
+
+    {"ops": [{"op": "remove", "block_id": "..."},
+             {"op": "move", "block_id": "...", "new_index": 0},
+             {"op": "add", "block": {...}, "index": 3},
+             {"op": "replace", "block": {...}}]}
+"""
+
+import json
+from typing import Any, Dict, Iterable, List
+
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.ops import AddOp, BlockOp, MoveOp, RemoveOp, ReplaceOp
+from corelab_blockkit.registry import registry
+from corelab_blockkit.ser.json_codec import BlockJSONEncoder
+
+_OP_TYPES = {"add": AddOp, "remove": RemoveOp, "move": MoveOp, "replace": ReplaceOp}
+
+
+def serialize_patch(ops: Iterable[BlockOp], **kwargs: Any) -> str:
+    """Serialize the operations of a patch to JSON.
+
+    Args:
+        ops: The operations to serialize
+        **kwargs: Additional arguments to pass to json.dumps
+
+    Returns:
+        The JSON string
+
+    Raises:
+        SerializationError: If serialization fails
+    """
+    try:
+        data = {"ops": [op.model_dump(serialize_as_any=True) for op in ops]}
+        return json.dumps(data, cls=BlockJSONEncoder, **kwargs)
+    except Exception as e:
+        raise SerializationError(f"Failed to serialize patch: {e}") from e
+
+
+def deserialize_patch(json_str: str, trusted: bool = False) -> List[BlockOp]:
+    """Deserialize the operations of a patch from JSON.
+
+    Args:
+        json_str: The JSON string to deserialize
+        trusted: Construct blocks without validating them. Only use this for
+            JSON produced by ``serialize_patch``.
+
+    Returns:
+        The operations, in order
+
+    Raises:
+        SerializationError: If deserialization fails
+    """
+    try:
+        data = json.loads(json_str)
+        if not isinstance(data, dict) or not isinstance(data.get("ops"), list):
+            raise SerializationError("Invalid JSON format for patch")
+        return [_load_op(op_data, trusted) for op_data in data["ops"]]
+
+    except SerializationError:
+        raise
+    except Exception as e:
+        raise SerializationError(f"Failed to deserialize patch: {e}") from e
+
+
+def _load_op(op_data: Any, trusted: bool) -> BlockOp:
+    """Create an operation from its dictionary form.
+
+    Args:
+        op_data: The dictionary form of the operation
+        trusted: Construct blocks without validating them
+
+    Returns:
+        The operation
+
+    Raises:
+        SerializationError: If the operation is invalid
+    """
+    if not isinstance(op_data, dict) or op_data.get("op") not in _OP_TYPES:
+        raise SerializationError(f"Invalid patch operation: {op_data!r}")
+
+    values: Dict[str, Any] = dict(op_data)
+    block_data = values.get("block")
+    if block_data is not None:
+        # Blocks are created through the registry to get their own types
+        if not isinstance(block_data, dict) or "kind" not in block_data:
+            raise SerializationError("Invalid block data: missing 'kind' field")
+        kind = block_data["kind"]
+        try:
+            values["block"] = registry.get(kind).from_dict(block_data, trusted)
+        except Exception as e:
+            raise SerializationError(
+                f"Failed to deserialize block of kind '{kind}': {e}"
+            ) from e
+
+    return _OP_TYPES[values["op"]].model_validate(values)
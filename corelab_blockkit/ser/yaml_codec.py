@@ -1,7 +1,8 @@
 """YAML serialization and deserialization for blockkit."""
 
+import io
 from datetime import datetime
-from typing import Any, Dict, List, Type, Union
+from typing import Any, List, Type, Union
 from uuid import UUID
 
 import ruamel.yaml
@@ -9,19 +10,29 @@ from ruamel.yaml import YAML
 
 from corelab_blockkit.blocks.base import BaseBlock
 from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.lazy import LazyBlockList
 from corelab_blockkit.list import BlockList
 from corelab_blockkit.registry import registry
+from corelab_blockkit.ser.fragments import fragment_cache
 
 # Create a YAML instance with safe loading/dumping
 yaml = YAML(typ="safe")
 yaml.default_flow_style = False
 
+_FRAGMENT_KEY = ("yaml",)
+_FRAGMENT_PREFIX = "blocks:\n"
+
 
 def serialize_to_yaml(
     obj: Union[BaseBlock, BlockList, List[BaseBlock]], **kwargs: Any
 ) -> str:
     """Serialize a block, block list, or list of blocks to YAML.
 
+    The blocks of block lists and lists of blocks are dumped one at a time
+    and kept in ``fragment_cache``, so serializing a list again after a few
+    edits only dumps the blocks that changed. Passing ``kwargs`` bypasses
+    the cache.
+
     Args:
         obj: The object to serialize
         **kwargs: Additional arguments to pass to YAML.dump
@@ -33,6 +44,15 @@ def serialize_to_yaml(
         SerializationError: If serialization fails
     """
     try:
+        if not kwargs and (
+            isinstance(obj, BlockList)
+            or (
+                isinstance(obj, list)
+                and all(isinstance(item, BaseBlock) for item in obj)
+            )
+        ):
+            return _serialize_blocks(obj)
+
         # Convert to a dictionary first
         if isinstance(obj, BaseBlock):
             data = obj.model_dump()
@@ -47,8 +67,6 @@ def serialize_to_yaml(
         _convert_uuids_to_strings(data)
 
         # Dump to YAML
-        import io
-
         stream = io.StringIO()
         yaml.dump(data, stream, **kwargs)
         return stream.getvalue()
@@ -57,14 +75,50 @@ def serialize_to_yaml(
         raise SerializationError(f"Failed to serialize to YAML: {e}") from e
 
 
+def _serialize_blocks(blocks: Any) -> str:
+    """Serialize blocks as a YAML block list, splicing in cached blocks.
+
+    Every block is dumped as the only item of a ``blocks`` sequence, so the
+    dumper indents and wraps it exactly as in the whole list, and the result
+    is the same document that dumping the whole list at once writes.
+
+    Args:
+        blocks: A BlockList or a list of blocks
+
+    Returns:
+        The YAML string
+    """
+    parts = ["blocks:\n"]
+    for block in blocks:
+        fragment = fragment_cache.get(block, _FRAGMENT_KEY)
+        if fragment is None:
+            data = block.model_dump()
+            _convert_uuids_to_strings(data)
+            stream = io.StringIO()
+            yaml.dump({"blocks": [data]}, stream)
+            fragment = stream.getvalue()[len(_FRAGMENT_PREFIX) :]
+            fragment_cache.put(block, _FRAGMENT_KEY, fragment)
+        parts.append(fragment)
+    if len(parts) == 1:
+        return "blocks: []\n"
+    return "".join(parts)
+
+
 def deserialize_from_yaml(
-    yaml_str: str, target_type: Type[Union[BaseBlock, BlockList]] = BlockList
-) -> Union[BaseBlock, BlockList]:
+    yaml_str: str,
+    target_type: Type[Union[BaseBlock, BlockList]] = BlockList,
+    trusted: bool = False,
+    lazy: bool = False,
+) -> Union[BaseBlock, BlockList, LazyBlockList]:
     """Deserialize a YAML string to a block or block list.
 
     Args:
         yaml_str: The YAML string to deserialize
         target_type: The type to deserialize to (BaseBlock or BlockList)
+        trusted: Construct blocks without validating them. Only use this for
+            YAML produced by ``serialize_to_yaml``.
+        lazy: Return a LazyBlockList that validates each block on first
+            access instead of a BlockList (only for block lists)
 
     Returns:
         The deserialized object
@@ -73,8 +127,6 @@ def deserialize_from_yaml(
         SerializationError: If deserialization fails
     """
     try:
-        import io
-
         stream = io.StringIO(yaml_str)
         data = yaml.load(stream)
 
@@ -83,6 +135,9 @@ def deserialize_from_yaml(
             if not isinstance(data, dict) or "blocks" not in data:
                 raise SerializationError("Invalid YAML format for BlockList")
 
+            if lazy:
+                return LazyBlockList(data["blocks"], trusted=trusted)
+
             blocks = []
             for block_data in data["blocks"]:
                 if not isinstance(block_data, dict) or "kind" not in block_data:
@@ -91,13 +146,14 @@ def deserialize_from_yaml(
                 kind = block_data["kind"]
                 try:
                     block_class = registry.get(kind)
-                    blocks.append(block_class.model_validate(block_data))
+                    blocks.append(block_class.from_dict(block_data, trusted))
                 except Exception as e:
                     raise SerializationError(
                         f"Failed to deserialize block of kind '{kind}': {e}"
                     ) from e
 
-            return BlockList(blocks=blocks)
+            # The blocks are validated already, so don't validate them again
+            return BlockList.model_construct(blocks=blocks)
 
         elif issubclass(target_type, BaseBlock):
             # Deserialize a single block
@@ -107,7 +163,7 @@ def deserialize_from_yaml(
             kind = data["kind"]
             try:
                 block_class = registry.get(kind)
-                return block_class.model_validate(data)
+                return block_class.from_dict(data, trusted)
             except Exception as e:
                 raise SerializationError(
                     f"Failed to deserialize block of kind '{kind}': {e}"
@@ -0,0 +1,29 @@
+"""Shared fixtures for the blockkit tests."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from corelab_blockkit import BlockList, ImageBlock, TextBlock
+from corelab_blockkit.meta import BlockMeta
+
+
+@pytest.fixture
+def block_list():
+    """A block list with blocks of different kinds, metadata and long text."""
+    meta = BlockMeta(
+        created_at=datetime(2023, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=-5))),
+        updated_at=datetime(2023, 1, 2, 8, 0, 0, 123456),
+        is_favorite=True,
+        tags=["test", "ünïcode"],
+        extra={"author": "Test Author", "rating": 4.5, "views": -3, "draft": None},
+    )
+    return BlockList(
+        blocks=[TextBlock(text="Hello **world**!", format="markdown", meta=meta)]
+        + [
+            TextBlock(text=f"Block {i} – ünïcode " + "with a long line of text " * i)
+            for i in range(1, 30, 3)
+        ]
+        + [TextBlock(text=f"Block {i}") for i in range(20)]
+        + [ImageBlock(url="https://example.com/image.jpg", alt_text="Example")]
+    )
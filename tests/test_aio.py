@@ -0,0 +1,186 @@
+"""Tests for the asyncio load and save functions."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from corelab_blockkit import BlockList
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.ser import aio, json_codec
+from corelab_blockkit.ser.aio import aload_from_json, asave_to_json
+
+
+class _Writer:
+    """A minimal asyncio stream writer that collects what is written."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+
+class _QueueReader:
+    """An asyncio stream whose data is handed over piece by piece."""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.pending = b""
+        self.sizes = []
+
+    async def read(self, size):
+        self.sizes.append(size)
+        if not self.pending:
+            self.pending = await self.queue.get()
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+
+def _reader(data):
+    """Create an asyncio stream reader with all data already received."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class TestAsyncIO:
+    """Tests for aload_from_json and asave_to_json."""
+
+    def test_path_round_trip(self, block_list, tmp_path):
+        """Test saving to and loading from a path."""
+        path = tmp_path / "blocks.json"
+
+        async def main():
+            await block_list.asave(path, indent=2)
+            return await BlockList.aload(path)
+
+        assert asyncio.run(main()) == block_list
+        assert path.read_text(encoding="utf-8") == block_list.to_json(indent=2)
+
+    def test_stream_round_trip(self, block_list):
+        """Test saving to and loading from asyncio streams."""
+        writer = _Writer()
+
+        async def main():
+            await asave_to_json(block_list, writer, chunk_size=256)
+            return await aload_from_json(_reader(bytes(writer.data)), chunk_size=256)
+
+        assert asyncio.run(main()) == block_list
+        assert writer.data.decode("utf-8") == block_list.to_json()
+        assert writer.drains == -(-len(writer.data) // 256)
+
+    def test_custom_executor(self, block_list):
+        """Test that loads can overlap in a custom executor."""
+        data = block_list.to_json().encode("utf-8")
+
+        async def main(executor):
+            return await asyncio.gather(
+                *(
+                    BlockList.aload(_reader(data), trusted=True, executor=executor)
+                    for _ in range(4)
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = asyncio.run(main(executor))
+        assert results == [block_list] * 4
+
+    @pytest.mark.parametrize("data", [b'{"blocks": [', b""])
+    def test_invalid_stream(self, data):
+        """Test that invalid documents raise SerializationError."""
+
+        async def main():
+            return await aload_from_json(_reader(data))
+
+        with pytest.raises(SerializationError):
+            asyncio.run(main())
+
+    def test_missing_file(self, tmp_path):
+        """Test that missing files raise SerializationError."""
+        with pytest.raises(SerializationError):
+            asyncio.run(aload_from_json(tmp_path / "missing.json"))
+
+    def test_stream_decoded_while_reading(self, block_list, monkeypatch):
+        """Test that blocks are decoded before the stream ends."""
+        loaded = []
+        load_block = json_codec._load_streamed_block
+
+        def record(block_data, trusted):
+            loaded.append(block_data)
+            return load_block(block_data, trusted)
+
+        monkeypatch.setattr(json_codec, "_load_streamed_block", record)
+        data = block_list.to_json().encode("utf-8")
+        half = len(data) // 2
+
+        async def main():
+            source = _QueueReader()
+            task = asyncio.ensure_future(aload_from_json(source, chunk_size=64))
+            source.queue.put_nowait(data[:half])
+            while not loaded:
+                await asyncio.sleep(0.01)
+            decoded_early = len(loaded)
+            source.queue.put_nowait(data[half:])
+            source.queue.put_nowait(b"")
+            return decoded_early, source.sizes, await task
+
+        decoded_early, sizes, result = asyncio.run(main())
+        assert 0 < decoded_early < len(block_list)
+        assert all(0 < size < len(data) // 4 for size in sizes)
+        assert result == block_list
+
+    def test_stream_written_while_encoding(self, block_list, monkeypatch):
+        """Test that writing starts before the whole document is encoded."""
+        encoded = []
+
+        def counting_chunks(obj, **kwargs):
+            for chunk in json_codec.iter_json_chunks(obj, **kwargs):
+                encoded.append(chunk)
+                yield chunk
+
+        monkeypatch.setattr(aio, "iter_json_chunks", counting_chunks)
+        encoded_at_write = []
+
+        class RecordingWriter(_Writer):
+            def write(self, data):
+                encoded_at_write.append(len(encoded))
+                super().write(data)
+
+        writer = RecordingWriter()
+        asyncio.run(asave_to_json(block_list, writer, chunk_size=128))
+        assert encoded_at_write[0] < len(encoded)
+        assert writer.data.decode("utf-8") == block_list.to_json()
+
+    def test_stream_compiled(self, block_list):
+        """Test saving to a stream with the compiled serializer."""
+        writer = _Writer()
+        asyncio.run(asave_to_json(block_list, writer, compiled=True, indent=2))
+        assert writer.data.decode("utf-8") == block_list.to_json(indent=2)
+
+    def test_path_compiled(self, block_list, tmp_path):
+        """Test saving to a path with the compiled serializer."""
+        path = tmp_path / "blocks.json"
+        asyncio.run(asave_to_json(block_list, path, compiled=True, indent=2))
+        assert path.read_text(encoding="utf-8") == block_list.to_json(indent=2)
+
+    def test_stream_cancelled(self, block_list):
+        """Test that cancelling a load stops its worker."""
+        data = block_list.to_json().encode("utf-8")
+
+        async def main():
+            source = _QueueReader()
+            task = asyncio.ensure_future(aload_from_json(source, chunk_size=64))
+            source.queue.put_nowait(data[:100])
+            while not source.sizes:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
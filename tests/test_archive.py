@@ -0,0 +1,86 @@
+"""Tests for memory-mapped block archives."""
+
+import io
+import uuid
+
+import pytest
+
+from corelab_blockkit import BlockList, TextBlock
+from corelab_blockkit.exceptions import BlockNotFoundError, SerializationError
+from corelab_blockkit.ser.archive import BlockArchive, open_archive, write_archive
+from corelab_blockkit.ser.binary_codec import deserialize_from_binary
+
+
+@pytest.fixture
+def archive_path(tmp_path, block_list):
+    """The path of an archive with the blocks of block_list."""
+    path = tmp_path / "blocks.bka"
+    assert write_archive(block_list, path) == len(block_list)
+    return path
+
+
+class TestBlockArchive:
+    """Tests for write_archive and BlockArchive."""
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_round_trip(self, archive_path, block_list, trusted):
+        """Test reading all blocks back."""
+        with open_archive(archive_path, trusted=trusted) as archive:
+            assert len(archive) == len(block_list)
+            assert archive.to_block_list() == block_list
+            assert list(archive.ids()) == [block.id for block in block_list]
+
+    def test_random_access(self, archive_path, block_list):
+        """Test fetching single blocks by position and ID."""
+        with BlockArchive(archive_path) as archive:
+            assert archive[7] == block_list[7]
+            assert archive[-1] == block_list[-1]
+            assert archive.kind_of(-1) == "image"
+
+            for index, block in enumerate(block_list):
+                assert archive.index_of(block.id) == index
+                assert archive.find_by_id(block.id) == block
+
+            assert deserialize_from_binary(archive.raw(3), TextBlock) == block_list[3]
+
+    def test_lookup_errors(self, archive_path):
+        """Test looking up missing blocks."""
+        with BlockArchive(archive_path) as archive:
+            with pytest.raises(BlockNotFoundError):
+                archive.find_by_id(uuid.uuid4())
+            with pytest.raises(IndexError):
+                archive[len(archive)]
+
+    def test_empty_archive(self, tmp_path):
+        """Test an archive without blocks."""
+        path = tmp_path / "empty.bka"
+        write_archive([], path)
+
+        with BlockArchive(path) as archive:
+            assert len(archive) == 0
+            assert archive.to_block_list() == BlockList()
+            with pytest.raises(BlockNotFoundError):
+                archive.find_by_id(uuid.uuid4())
+
+    def test_write_to_stream(self, block_list, tmp_path):
+        """Test writing an archive to a binary stream."""
+        stream = io.BytesIO()
+        write_archive(iter(block_list), stream)
+
+        path = tmp_path / "stream.bka"
+        path.write_bytes(stream.getvalue())
+        with BlockArchive(path) as archive:
+            assert archive.to_block_list() == block_list
+
+    def test_duplicate_ids(self, block_list, tmp_path):
+        """Test that duplicate IDs are rejected on write."""
+        with pytest.raises(SerializationError):
+            write_archive([block_list[0], block_list[0]], tmp_path / "dup.bka")
+
+    @pytest.mark.parametrize("content", [b"", b"BKAR", b"NOPE" + b"\0" * 28])
+    def test_invalid_file(self, tmp_path, content):
+        """Test opening files that are not archives."""
+        path = tmp_path / "invalid.bka"
+        path.write_bytes(content)
+        with pytest.raises(SerializationError):
+            BlockArchive(path)
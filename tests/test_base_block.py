@@ -1,12 +1,13 @@
 """Tests for the BaseBlock class."""
 
+import json
 import re
 import uuid
 from typing import Any, ClassVar, Dict
 
 import pytest
 
-from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.blocks.base import BaseBlock, _known_kinds, remember_kind
 from corelab_blockkit.exceptions import BlockValidationError
 from corelab_blockkit.meta import BlockMeta
 
@@ -56,6 +57,21 @@ class TestBaseBlock:
             with pytest.raises(BlockValidationError):
                 BaseBlock(kind=kind)
 
+    def test_remember_kind(self):
+        """Test remembering valid kinds and rejecting invalid ones."""
+        assert remember_kind("remembered_kind") is True
+        assert "remembered_kind" in _known_kinds
+        assert BaseBlock(kind="remembered_kind").kind == "remembered_kind"
+
+        assert remember_kind("Not-Valid") is False
+        assert "Not-Valid" not in _known_kinds
+        with pytest.raises(BlockValidationError):
+            BaseBlock(kind="Not-Valid")
+
+    def test_registered_kinds_are_known(self):
+        """Test that the built-in block kinds are cached at registration."""
+        assert {"text", "image", "video", "glossary"} <= _known_kinds
+
     def test_model_validate_dict(self):
         """Test model_validate with a dictionary."""
         block_id = uuid.uuid4()
@@ -91,6 +107,86 @@ class TestBaseBlock:
         with pytest.raises(ValueError):
             BaseBlock.model_validate(data)
 
+    def test_validate_many(self):
+        """Test that validate_many matches model_validate for every block."""
+        from corelab_blockkit import TextBlock
+
+        blocks = [
+            TextBlock(text=f"Block {i}", meta=BlockMeta(tags=[str(i)]))
+            for i in range(5)
+        ]
+        data = [
+            json.loads(json.dumps(block.model_dump(mode="json"))) for block in blocks
+        ]
+        data.append({"kind": "text", "payload": {"text": "No ID or meta"}})
+
+        validated = TextBlock.validate_many(data)
+        assert validated[:5] == blocks
+        assert validated[5].text == "No ID or meta"
+        assert validated[5].payload == TextBlock(text="No ID or meta").payload
+
+    def test_validate_many_invalid(self):
+        """Test that validate_many rejects invalid data."""
+        with pytest.raises(ValueError):
+            BaseBlock.validate_many([{"kind": "test"}, "not a dict"])
+        with pytest.raises(ValueError):
+            BaseBlock.validate_many([{"kind": "test", "id": "not-a-uuid"}])
+
+    def test_from_trusted(self):
+        """Test creating a block from trusted data without validation."""
+        block = BaseBlock(
+            kind="test",
+            meta=BlockMeta(is_favorite=True, tags=["test"]),
+            payload={"text": "Hello world"},
+        )
+        data = json.loads(json.dumps(block.model_dump(mode="json")))
+
+        trusted = BaseBlock.from_trusted(data)
+        assert trusted == block
+        assert trusted.meta.created_at == block.meta.created_at
+
+    def test_from_trusted_skips_validation(self):
+        """Test that from_trusted does not validate the kind."""
+        block = BaseBlock.from_trusted({"kind": "Not Valid"})
+        assert block.kind == "Not Valid"
+        assert isinstance(block.id, uuid.UUID)
+
+    def test_from_dict(self):
+        """Test that from_dict validates unless the data is trusted."""
+        block = BaseBlock(kind="test", payload={"text": "Hello world"})
+        data = json.loads(json.dumps(block.model_dump(mode="json")))
+        assert BaseBlock.from_dict(data) == block
+        assert BaseBlock.from_dict(data, trusted=True) == block
+
+        with pytest.raises(BlockValidationError):
+            BaseBlock.from_dict({"kind": "Not Valid"})
+        assert BaseBlock.from_dict({"kind": "Not Valid"}, trusted=True).kind == (
+            "Not Valid"
+        )
+
+    def test_fingerprint(self):
+        """Test that fingerprints identify the contents of a block."""
+        block = BaseBlock(kind="test", payload={"b": 1, "a": [1, 2]})
+        fingerprint = block.fingerprint()
+
+        assert len(fingerprint) == 32
+        assert block.fingerprint() == fingerprint
+        assert BaseBlock.model_validate(block.model_dump()).fingerprint() == fingerprint
+        assert BaseBlock(kind="test").fingerprint() != fingerprint
+
+        # The cached fingerprint does not affect equality or serialization
+        assert block == BaseBlock.model_validate(block.model_dump())
+        assert set(block.model_dump()) == {"id", "kind", "meta", "payload"}
+
+    def test_fingerprint_model_copy(self):
+        """Test that copies with changed fields get a new fingerprint."""
+        block = BaseBlock(kind="test", payload={"value": 1})
+        fingerprint = block.fingerprint()
+
+        assert block.model_copy().fingerprint() == fingerprint
+        changed = block.model_copy(update={"payload": {"value": 2}})
+        assert changed.fingerprint() != fingerprint
+
     def test_subclass_kind_inheritance(self):
         """Test that subclasses inherit the KIND class variable."""
 
@@ -0,0 +1,104 @@
+"""Tests for the compact binary codec."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from hypothesis import given, strategies as st
+
+from corelab_blockkit import BlockList, TextBlock
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.meta import BlockMeta
+from corelab_blockkit.ser.binary_codec import (
+    deserialize_from_binary,
+    serialize_to_binary,
+)
+from corelab_blockkit.ser.json_codec import serialize_to_json
+
+json_values = st.recursive(
+    st.none()
+    | st.booleans()
+    | st.integers()
+    | st.floats(allow_nan=False)
+    | st.text(),
+    lambda children: st.lists(children, max_size=4)
+    | st.dictionaries(st.text(max_size=8), children, max_size=4),
+    max_leaves=20,
+)
+
+
+class TestBinaryCodec:
+    """Tests for serialize_to_binary and deserialize_from_binary."""
+
+    def test_round_trip_block_list(self, block_list):
+        """Test that a block list round-trips to exactly the same JSON."""
+        data = block_list.to_bytes()
+        restored = BlockList.from_bytes(data)
+
+        assert restored == block_list
+        assert restored.to_json() == block_list.to_json()
+
+    def test_round_trip_trusted(self, block_list):
+        """Test the trusted decoding path."""
+        restored = BlockList.from_bytes(block_list.to_bytes(), trusted=True)
+        assert restored.to_json() == block_list.to_json()
+
+    def test_round_trip_single_block(self, block_list):
+        """Test round-tripping a single block."""
+        block = block_list[0]
+        restored = deserialize_from_binary(serialize_to_binary(block), TextBlock)
+
+        assert isinstance(restored, TextBlock)
+        assert serialize_to_json(restored) == serialize_to_json(block)
+
+    def test_round_trip_plain_list(self, block_list):
+        """Test decoding a plain list of blocks as a block list."""
+        data = serialize_to_binary(list(block_list))
+        assert BlockList.from_bytes(data) == block_list
+
+    def test_smaller_than_json(self, block_list):
+        """Test that the binary form is more compact than JSON."""
+        assert len(block_list.to_bytes()) < len(block_list.to_json().encode()) / 2
+
+    def test_value_conversions(self):
+        """Test that UUIDs and datetimes in metadata match the JSON form."""
+        extra = {
+            "ref": uuid.uuid4(),
+            "at": datetime(2023, 1, 1, tzinfo=timezone.utc),
+            "pair": (1, 2),
+        }
+        block = TextBlock(text="Hello", meta=BlockMeta(extra=extra))
+        restored = deserialize_from_binary(serialize_to_binary(block), TextBlock)
+        assert serialize_to_json(restored) == serialize_to_json(block)
+
+    @given(json_values)
+    def test_extra_values(self, value):
+        """Test that arbitrary JSON values in meta.extra round-trip exactly."""
+        block = TextBlock(text="Hello", meta=BlockMeta(extra={"value": value}))
+        restored = deserialize_from_binary(serialize_to_binary(block), TextBlock)
+        assert serialize_to_json(restored) == serialize_to_json(block)
+
+    def test_unsupported_value(self):
+        """Test that unsupported payload values raise SerializationError."""
+        block = TextBlock(text="Hello", meta=BlockMeta(extra={"value": object()}))
+        with pytest.raises(SerializationError):
+            serialize_to_binary(block)
+
+    def test_invalid_data(self, block_list):
+        """Test that malformed input raises SerializationError."""
+        data = block_list.to_bytes()
+
+        with pytest.raises(SerializationError):
+            BlockList.from_bytes(b"not binary")
+        with pytest.raises(SerializationError):
+            BlockList.from_bytes(data[:-5])
+        with pytest.raises(SerializationError):
+            BlockList.from_bytes(data + b"\x00")
+        with pytest.raises(SerializationError):
+            deserialize_from_binary(data, TextBlock)
+
+    def test_unknown_kind(self):
+        """Test that an unregistered kind raises SerializationError."""
+        data = serialize_to_binary([TextBlock(text="Hello")])
+        with pytest.raises(SerializationError):
+            BlockList.from_bytes(data.replace(b"text", b"nope"))
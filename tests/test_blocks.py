@@ -186,6 +186,23 @@ class TestBlockTypes:
         assert deserialized.terms == block.terms
         assert deserialized.title == block.title
 
+    def test_glossary_term_cache(self):
+        """Test that cached definitions follow the block's terms."""
+        block = GlossaryBlock(
+            terms=[
+                {"term": "Cell", "definition": "First"},
+                {"term": "Cell", "definition": "Second"},
+            ]
+        )
+        assert block.get_term("Cell") == "First"
+        assert block == GlossaryBlock.model_validate(block.model_dump())
+
+        copied = block.model_copy(
+            update={"payload": {"terms": [{"term": "Cell", "definition": "New"}]}}
+        )
+        assert copied.get_term("Cell") == "New"
+        assert block.get_term("Cell") == "First"
+
     def test_quote_block(self):
         """Test QuoteBlock creation and properties."""
         block = QuoteBlock(
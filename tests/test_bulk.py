@@ -0,0 +1,70 @@
+"""Tests for loading many block list files in parallel."""
+
+import pytest
+
+from corelab_blockkit import BlockList, ImageBlock, TextBlock
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.ser.bulk import load_many
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Valid and invalid block list files, with their expected contents."""
+    expected = {}
+    for i in range(4):
+        block_list = BlockList(
+            blocks=[TextBlock(text=f"File {i}"), ImageBlock(url=f"https://x/{i}")]
+        )
+        path = tmp_path / f"course{i}.json"
+        path.write_text(block_list.to_json())
+        expected[path] = block_list
+
+    block_list = BlockList(blocks=[TextBlock(text="YAML")])
+    path = tmp_path / "course.yaml"
+    path.write_text(block_list.to_yaml())
+    expected[path] = block_list
+
+    (tmp_path / "broken.json").write_text('{"blocks": [{"kind": "text"')
+    (tmp_path / "invalid.yml").write_text("blocks:\n- kind: unknown_kind\n")
+    (tmp_path / "notes.txt").write_text("Not a block list")
+    for name in ("broken.json", "invalid.yml", "notes.txt", "missing.json"):
+        expected[tmp_path / name] = None
+    return expected
+
+
+class TestLoadMany:
+    """Tests for the load_many function."""
+
+    def test_ordered(self, files):
+        """Test that results come back in order, with errors as values."""
+        results = list(load_many(files, workers=2))
+
+        assert [path for path, _ in results] == list(files)
+        for path, result in results:
+            if files[path] is None:
+                assert isinstance(result, SerializationError)
+                assert str(path) in str(result)
+            else:
+                assert isinstance(result, BlockList)
+                assert result == files[path]
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_unordered(self, files, trusted):
+        """Test that unordered results cover every file."""
+        results = dict(load_many(files, workers=2, ordered=False, trusted=trusted))
+
+        assert results.keys() == files.keys()
+        for path, block_list in files.items():
+            if block_list is not None:
+                assert results[path] == block_list
+
+    def test_empty(self):
+        """Test loading no files."""
+        assert list(load_many([], workers=1)) == []
+
+    def test_stop_early(self, files):
+        """Test that the caller can stop before all files are loaded."""
+        results = load_many(list(files) * 10, workers=1)
+        path, block_list = next(results)
+        assert block_list == files[path]
+        results.close()
@@ -0,0 +1,142 @@
+"""Tests for diffs and patches between block lists."""
+
+import json
+from typing import List
+
+import pytest
+from hypothesis import given, strategies as st
+
+from corelab_blockkit import AddOp, BlockList, ImageBlock, MoveOp, RemoveOp, TextBlock
+from corelab_blockkit.diff import _longest_increasing_subsequence
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.ser.patch import deserialize_patch, serialize_patch
+
+
+def _blocks(count: int) -> List[TextBlock]:
+    """Create text blocks with distinct texts."""
+    return [TextBlock(text=f"Block {i}") for i in range(count)]
+
+
+class TestDiff:
+    """Tests for BlockList.diff and BlockList.apply_patch."""
+
+    def test_identical_lists(self):
+        """Test that equal lists have an empty diff."""
+        blocks = BlockList(blocks=_blocks(5))
+        assert blocks.diff(blocks) == []
+        assert blocks.diff(BlockList.from_json(blocks.to_json())) == []
+
+    def test_single_edits(self):
+        """Test that single edits produce single operations."""
+        blocks = BlockList(blocks=_blocks(10))
+        new_block = TextBlock(text="New")
+        changed = TextBlock(id=blocks[4].id, text="Changed")
+
+        assert blocks.diff(blocks.add(new_block, 3)) == [
+            AddOp(block=new_block, index=3)
+        ]
+        assert blocks.diff(blocks.remove(blocks[2].id)) == [
+            RemoveOp(block_id=blocks[2].id)
+        ]
+        assert blocks.diff(blocks.move(blocks[0].id, 9)) == [
+            MoveOp(block_id=blocks[0].id, new_index=9)
+        ]
+
+        ops = blocks.diff(blocks.replace(changed))
+        assert [op.op for op in ops] == ["replace"]
+        assert ops[0].block is changed
+
+    def test_minimal_moves(self):
+        """Test that a rotation needs a single move."""
+        old = _blocks(6)
+        new = old[1:] + old[:1]
+        ops = BlockList(blocks=old).diff(BlockList(blocks=new))
+        assert len(ops) == 1
+        assert BlockList(blocks=old).apply_patch(ops) == BlockList(blocks=new)
+
+    @given(
+        st.permutations(range(12)),
+        st.sets(st.integers(0, 11)),
+        st.sets(st.integers(0, 11)),
+        st.lists(st.integers(0, 12), max_size=4),
+    )
+    def test_property_patch_reaches_target(self, order, removed, changed, added):
+        """Property test: applying a diff to the old list gives the new list."""
+        old = _blocks(12)
+        new = [
+            TextBlock(id=old[i].id, text="Changed") if i in changed else old[i]
+            for i in order
+            if i not in removed
+        ]
+        for position in added:
+            new.insert(min(position, len(new)), TextBlock(text="Added"))
+
+        old_list, new_list = BlockList(blocks=old), BlockList(blocks=new)
+        ops = old_list.diff(new_list)
+        assert old_list.apply_patch(ops) == new_list
+
+        kept = [old[i].id for i in sorted(set(order) - removed)]
+        new_positions = {block.id: i for i, block in enumerate(new)}
+        stay = _longest_increasing_subsequence([new_positions[i] for i in kept])
+        assert sum(op.op == "move" for op in ops) == len(kept) - len(stay)
+
+    @given(st.lists(st.integers(0, 50)))
+    def test_property_lis(self, values):
+        """Property test: the subsequence is increasing and maximal."""
+        positions = sorted(_longest_increasing_subsequence(values))
+        chosen = [values[i] for i in positions]
+        assert chosen == sorted(set(chosen))
+
+        # Quadratic dynamic programming for comparison
+        best = [1] * len(values)
+        for i in range(len(values)):
+            for j in range(i):
+                if values[j] < values[i]:
+                    best[i] = max(best[i], best[j] + 1)
+        assert len(positions) == max(best, default=0)
+
+
+class TestPatchSerialization:
+    """Tests for serialize_patch and deserialize_patch."""
+
+    def test_round_trip(self):
+        """Test that a serialized patch applies like the original."""
+        old = BlockList(blocks=_blocks(5))
+        image = ImageBlock(url="https://example.com/image.jpg", alt_text="Example")
+        new = (
+            old.remove(old[0].id)
+            .move(old[4].id, 0)
+            .add(image, 2)
+            .replace(TextBlock(id=old[2].id, text="Changed"))
+        )
+
+        ops = old.diff(new)
+        patch = serialize_patch(ops)
+        for trusted in (False, True):
+            restored = deserialize_patch(patch, trusted=trusted)
+            assert restored == ops
+            assert isinstance(restored[2].block, ImageBlock)
+            assert old.apply_patch(restored) == new
+
+        assert len(patch) < len(new.to_json())
+
+    @pytest.mark.parametrize(
+        "patch",
+        [
+            "[]",
+            '{"ops": [{"op": "rename"}]}',
+            '{"ops": [{"op": "add", "block": {"payload": {}}}]}',
+            '{"ops": [{"op": "add", "block": {"kind": "unknown"}}]}',
+            '{"ops": [{"op": "move", "block_id": "not-a-uuid", "new_index": 0}]}',
+        ],
+    )
+    def test_invalid_patch(self, patch):
+        """Test that invalid patches raise SerializationError."""
+        with pytest.raises(SerializationError):
+            deserialize_patch(patch)
+
+    def test_json_form(self):
+        """Test the JSON form of a patch."""
+        blocks = BlockList(blocks=_blocks(2))
+        data = json.loads(serialize_patch(blocks.diff(blocks.remove(blocks[0].id))))
+        assert data == {"ops": [{"op": "remove", "block_id": str(blocks[0].id)}]}
@@ -0,0 +1,147 @@
+"""Tests for the cache of encoded blocks used by the codecs."""
+
+import gc
+import io
+import json
+
+import pytest
+
+from corelab_blockkit import BlockList, TextBlock
+from corelab_blockkit.ser.fragments import FragmentCache, fragment_cache
+from corelab_blockkit.ser.json_codec import (
+    BlockJSONEncoder,
+    iter_json_chunks,
+    serialize_to_json,
+)
+from corelab_blockkit.ser.yaml_codec import (
+    _convert_uuids_to_strings,
+    serialize_to_yaml,
+    yaml,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty fragment cache."""
+    fragment_cache.clear()
+    yield
+    fragment_cache.clear()
+
+
+def _dump_yaml(obj):
+    """Dump a whole block list at once, without the fragment cache."""
+    data = obj.model_dump()
+    _convert_uuids_to_strings(data)
+    stream = io.StringIO()
+    yaml.dump(data, stream)
+    return stream.getvalue()
+
+
+class TestFragmentCache:
+    """Tests for the FragmentCache class."""
+
+    def test_get_and_put(self):
+        """Test that fragments are cached per block and key."""
+        cache = FragmentCache()
+        block = TextBlock(text="Hello")
+
+        assert cache.get(block, "a") is None
+        cache.put(block, "a", "encoded")
+        assert cache.get(block, "a") == "encoded"
+        assert cache.get(block, "b") is None
+        assert cache.get(TextBlock(id=block.id, text="Hello"), "a") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used fragments are evicted."""
+        cache = FragmentCache(maxsize=2)
+        blocks = [TextBlock(text=f"Block {i}") for i in range(3)]
+
+        cache.put(blocks[0], "k", "0")
+        cache.put(blocks[1], "k", "1")
+        assert cache.get(blocks[0], "k") == "0"
+        cache.put(blocks[2], "k", "2")
+
+        assert len(cache) == 2
+        assert cache.get(blocks[1], "k") is None
+        assert cache.get(blocks[0], "k") == "0"
+
+        cache.maxsize = 1
+        assert len(cache) == 1
+        assert cache.get(blocks[2], "k") is None
+
+    def test_disabled(self):
+        """Test that a cache with no room stores nothing."""
+        cache = FragmentCache(maxsize=0)
+        block = TextBlock(text="Hello")
+        cache.put(block, "k", "encoded")
+        assert len(cache) == 0
+        assert cache.get(block, "k") is None
+
+    def test_does_not_keep_blocks_alive(self):
+        """Test that entries of collected blocks are never returned."""
+        cache = FragmentCache()
+        block = TextBlock(text="Hello")
+        cache.put(block, "k", "encoded")
+        entry = next(iter(cache._entries.values()))
+
+        del block
+        gc.collect()
+        assert entry[0]() is None
+
+
+class TestCachedSerialization:
+    """Tests for the codecs with the fragment cache."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"indent": 2},
+            {"indent": "\t", "sort_keys": True},
+            {"separators": (",", ":")},
+            {"ensure_ascii": False},
+        ],
+    )
+    def test_json_matches_json_dumps(self, block_list, kwargs):
+        """Test that spliced documents equal encoding the whole list at once."""
+        edited = block_list.replace(
+            TextBlock(id=block_list[3].id, text="Changed")
+        ).move(block_list[0].id, 5)
+
+        for obj in (block_list, edited, list(edited), BlockList(), []):
+            expected = json.dumps(obj, cls=BlockJSONEncoder, **kwargs)
+            assert serialize_to_json(obj, **kwargs) == expected
+            # The second time the blocks come from the cache
+            assert serialize_to_json(obj, **kwargs) == expected
+            assert "".join(iter_json_chunks(obj, **kwargs)) == expected
+
+    def test_json_reuses_unchanged_blocks(self, block_list):
+        """Test that only changed blocks are encoded again."""
+        serialize_to_json(block_list)
+        assert len(fragment_cache) == len(block_list)
+
+        edited = block_list.add(TextBlock(text="New"))
+        serialize_to_json(edited)
+        assert len(fragment_cache) == len(block_list) + 1
+
+        serialize_to_json(edited, indent=2)
+        assert len(fragment_cache) == 2 * len(edited)
+
+    def test_json_uncached_options(self, block_list):
+        """Test that other options and other objects bypass the cache."""
+        serialize_to_json(block_list, default=str)
+        serialize_to_json([{"text": "Not a block"}])
+        assert len(fragment_cache) == 0
+
+    def test_yaml_matches_full_dump(self, block_list):
+        """Test that spliced YAML equals dumping the whole list at once."""
+        # Long multi-line strings are wrapped with continuation lines that
+        # are indented relative to the block's position in the document
+        block_list = block_list.add(TextBlock(text="long " * 30 + "\n" + "more " * 30))
+        edited = block_list.remove(block_list[2].id)
+
+        for obj in (block_list, edited, BlockList()):
+            assert serialize_to_yaml(obj) == _dump_yaml(obj)
+            assert serialize_to_yaml(obj) == _dump_yaml(obj)
+        assert serialize_to_yaml(list(edited)) == _dump_yaml(edited)
+        assert BlockList.from_yaml(serialize_to_yaml(edited)) == edited
@@ -0,0 +1,485 @@
+"""Tests for the secondary indexes of block lists."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from corelab_blockkit import (
+    BlockList,
+    BlockMeta,
+    GlossaryBlock,
+    ImageBlock,
+    QuoteBlock,
+    SupplementBlock,
+    TextBlock,
+    VideoBlock,
+)
+from corelab_blockkit.index import (
+    GlossaryEntry,
+    GlossaryIndex,
+    KindIndex,
+    SearchIndex,
+    TagIndex,
+    TimeIndex,
+    tokenize,
+)
+from corelab_blockkit.index.base import Postings
+
+
+def _search_index(blocks: BlockList) -> SearchIndex:
+    """Get the search index of a list, building it if needed."""
+    return blocks._index(SearchIndex)
+
+
+def _assert_matches_rebuild(blocks: BlockList, queries: List[str]) -> None:
+    """Check that an incrementally updated index agrees with a fresh build.
+
+    Blocks with equal scores may come in any order, so results are compared
+    as sets.
+    """
+    fresh = SearchIndex.build(blocks._seq.items())
+    index = _search_index(blocks)
+    assert len(index) == len(fresh)
+    for query in queries:
+        for require_all in (False, True):
+            assert set(
+                index.search(query, limit=None, require_all=require_all)
+            ) == set(fresh.search(query, limit=None, require_all=require_all))
+
+
+class TestSearch:
+    """Tests for BlockList.search."""
+
+    def test_tokenize(self):
+        """Test that text is split into case-folded words."""
+        assert tokenize("Hello, World! It's 2024.") == [
+            "hello",
+            "world",
+            "it",
+            "s",
+            "2024",
+        ]
+
+    def test_ranking(self):
+        """Test that rarer and more frequent terms rank higher."""
+        apple = TextBlock(text="apple apple apple banana")
+        banana = TextBlock(text="banana cherry")
+        cherry = TextBlock(text="cherry cherry")
+        blocks = BlockList(blocks=[banana, apple, cherry])
+
+        assert blocks.search("apple") == [apple.id]
+        assert blocks.search("cherry") == [cherry.id, banana.id]
+        assert blocks.search("APPLE banana")[0] == apple.id
+        assert blocks.search("cherry", limit=1) == [cherry.id]
+        assert blocks.search("durian") == []
+        assert blocks.search("!!!") == []
+
+    def test_require_all(self):
+        """Test that require_all only matches blocks with every term."""
+        both = TextBlock(text="red green")
+        red = TextBlock(text="red red red")
+        blocks = BlockList(blocks=[both, red])
+
+        assert set(blocks.search("red green")) == {both.id, red.id}
+        assert blocks.search("red green", require_all=True) == [both.id]
+        assert blocks.search("red blue", require_all=True) == []
+
+    def test_searchable_blocks(self):
+        """Test that quotes, supplements and glossaries are searchable."""
+        quote = QuoteBlock(text="To be or not", source="Shakespeare")
+        supplement = SupplementBlock(title="Reading", content="Further material")
+        glossary = GlossaryBlock(
+            title="Terms",
+            terms=[{"term": "Osmosis", "definition": "Diffusion of water"}],
+        )
+        image = ImageBlock(
+            url="https://example.com/a.png", alt_text="water", caption="water"
+        )
+        blocks = BlockList(blocks=[quote, supplement, glossary, image])
+
+        assert blocks.search("shakespeare") == [quote.id]
+        assert blocks.search("further") == [supplement.id]
+        assert blocks.search("osmosis") == [glossary.id]
+        assert blocks.search("water") == [glossary.id]
+        assert len(_search_index(blocks)) == 3
+
+    def test_edits_update_index(self):
+        """Test that derived versions update the index instead of rebuilding."""
+        blocks = BlockList(
+            blocks=[TextBlock(text=f"word{i} common") for i in range(20)]
+        )
+        blocks.search("common")
+        queries = ["common", "word3", "fresh", "changed common", "word5 word7"]
+
+        added = TextBlock(text="fresh common fresh")
+        blocks = blocks.add(added, 4)
+        assert "_indexes" in blocks.__dict__
+        assert blocks.search("fresh") == [added.id]
+
+        blocks = blocks.remove(blocks[0].id)
+        blocks = blocks.replace(TextBlock(id=blocks[3].id, text="changed"))
+        blocks = blocks.move(blocks[5].id, 0)
+        _assert_matches_rebuild(blocks, queries)
+        assert blocks.search("word0") == []
+        assert blocks.search("changed") == [blocks[4].id]
+
+    def test_index_not_shared_across_equality(self):
+        """Test that cached indexes do not affect equality."""
+        blocks = BlockList(blocks=[TextBlock(text="hello")])
+        copy = BlockList.from_json(blocks.to_json())
+        blocks.search("hello")
+        assert blocks == copy
+
+    def test_transaction_rebuilds_index(self):
+        """Test that versions built by transactions index their own blocks."""
+        blocks = BlockList(blocks=[TextBlock(text="old")])
+        blocks.search("old")
+        new_block = TextBlock(text="new")
+        with blocks.transaction() as tx:
+            tx.add(new_block)
+        assert tx.result.search("new") == [new_block.id]
+
+    def test_compaction(self, monkeypatch):
+        """Test that the overlay is folded into the base once it is large."""
+        monkeypatch.setattr(Postings, "OVERLAY_LIMIT", 4)
+        blocks = BlockList(
+            blocks=[TextBlock(text=f"alpha t{i}") for i in range(10)]
+        )
+        blocks.search("alpha")
+        for i in range(10):
+            blocks = blocks.replace(
+                TextBlock(id=blocks[i].id, text=f"beta t{i} t{i + 1}")
+            )
+            _assert_matches_rebuild(blocks, ["alpha", "beta", "t3", "t4 t5"])
+        postings = _search_index(blocks)._postings
+        assert len(postings._overlay) + len(postings._hidden) <= 4
+        assert blocks.search("alpha") == []
+        assert len(blocks.search("beta", limit=None)) == 10
+
+    @pytest.mark.parametrize("count", [1, 50])
+    def test_relabel_rebuilds_index(self, count):
+        """Test that inserting many blocks at one position keeps the index right."""
+        blocks = BlockList(blocks=[TextBlock(text="start"), TextBlock(text="end")])
+        blocks.search("start")
+        for i in range(count):
+            blocks = blocks.add(TextBlock(text=f"middle{i}"), 1)
+        _assert_matches_rebuild(blocks, ["start", "middle0", "end"])
+
+
+def _tagged(text: str, *tags: str, favorite: bool = False) -> TextBlock:
+    """Create a text block with tags."""
+    return TextBlock(text=text, meta=BlockMeta(tags=list(tags), is_favorite=favorite))
+
+
+class TestTags:
+    """Tests for BlockList.tagged and BlockList.tag_counts."""
+
+    @pytest.fixture
+    def blocks(self):
+        """A list of blocks with different tags."""
+        return BlockList(
+            blocks=[
+                _tagged("a", "biology", "exam"),
+                _tagged("b", "biology", favorite=True),
+                _tagged("c"),
+                SupplementBlock(title="d", content="d", tags=["exam", "reading"]),
+                _tagged("e", "chemistry", "exam", favorite=True),
+            ]
+        )
+
+    @staticmethod
+    def _texts(blocks):
+        """Get the text or title of each block."""
+        return [b.payload.get("text", b.payload.get("title")) for b in blocks]
+
+    def test_queries(self, blocks):
+        """Test AND, OR and NOT queries, in list order."""
+        assert self._texts(blocks.tagged(all_of=["biology"])) == ["a", "b"]
+        assert self._texts(blocks.tagged(all_of=["biology", "exam"])) == ["a"]
+        assert self._texts(blocks.tagged(any_of=["reading", "chemistry"])) == [
+            "d",
+            "e",
+        ]
+        assert self._texts(blocks.tagged(any_of=["exam"], none_of=["biology"])) == [
+            "d",
+            "e",
+        ]
+        assert self._texts(blocks.tagged(none_of=["exam"])) == ["b", "c"]
+        assert blocks.tagged(all_of=["physics"]) == []
+        assert len(blocks.tagged()) == 5
+
+    def test_favorites(self, blocks):
+        """Test filtering by the favorite flag."""
+        assert self._texts(blocks.tagged(favorite=True)) == ["b", "e"]
+        assert self._texts(blocks.tagged(all_of=["exam"], favorite=True)) == ["e"]
+        assert self._texts(blocks.tagged(all_of=["exam"], favorite=False)) == [
+            "a",
+            "d",
+        ]
+
+    def test_tag_counts(self, blocks):
+        """Test that tag counts include supplement payload tags."""
+        assert blocks.tag_counts() == {
+            "biology": 2,
+            "exam": 3,
+            "reading": 1,
+            "chemistry": 1,
+        }
+
+    def test_edits_update_index(self, blocks):
+        """Test that derived versions update the tag index."""
+        blocks.tagged(favorite=True)
+        blocks = blocks.add(_tagged("f", "physics", favorite=True), 0)
+        blocks = blocks.remove(blocks[1].id)
+        blocks = blocks.replace(
+            TextBlock(id=blocks[1].id, text="b", meta=BlockMeta(tags=["physics"]))
+        )
+        blocks = blocks.move(blocks[0].id, 4)
+        assert "_indexes" in blocks.__dict__
+
+        assert self._texts(blocks.tagged(favorite=True)) == ["e", "f"]
+        assert self._texts(blocks.tagged(all_of=["physics"])) == ["b", "f"]
+        fresh = TagIndex.build(blocks._seq.items())
+        assert blocks._index(TagIndex).tag_counts() == fresh.tag_counts()
+
+    def test_query_without_universe(self):
+        """Test that exclusion-only index queries need the IDs of all blocks."""
+        index = TagIndex.build([])
+        with pytest.raises(ValueError):
+            index.query(none_of=["exam"])
+
+
+def _glossary(*terms: str, definition: str = "def") -> GlossaryBlock:
+    """Create a glossary block that defines terms."""
+    return GlossaryBlock(
+        terms=[{"term": term, "definition": f"{definition} {term}"} for term in terms]
+    )
+
+
+class TestGlossary:
+    """Tests for BlockList.glossary."""
+
+    def test_lookup(self):
+        """Test case-insensitive lookups, with the first glossary winning."""
+        first = _glossary("Osmosis", "Cell", definition="first")
+        second = _glossary("cell", "Membrane", definition="second")
+        blocks = BlockList(blocks=[TextBlock(text="intro"), first, second])
+        glossary = blocks.glossary()
+
+        assert glossary.lookup("OSMOSIS") == GlossaryEntry(
+            "Osmosis", "first Osmosis", first.id
+        )
+        assert glossary.lookup(" cell ").definition == "first Cell"
+        assert [e.block_id for e in glossary.definitions("CELL")] == [
+            first.id,
+            second.id,
+        ]
+        assert glossary.lookup("nucleus") is None
+        assert "membrane" in glossary and "nucleus" not in glossary
+        assert len(glossary) == 3
+
+    def test_complete(self):
+        """Test prefix completion in alphabetical order."""
+        blocks = BlockList(
+            blocks=[_glossary("Osmosis", "osmium", "Ozone", "os"), _glossary("Cell")]
+        )
+        glossary = blocks.glossary()
+        assert [e.term for e in glossary.complete("OS")] == [
+            "os",
+            "osmium",
+            "Osmosis",
+        ]
+        assert [e.term for e in glossary.complete("o", limit=2)] == ["os", "osmium"]
+        assert glossary.complete("x") == []
+        assert len(glossary.complete("", limit=None)) == 5
+
+    def test_edits_update_index(self):
+        """Test that derived versions update the glossary."""
+        first = _glossary("Cell", "Osmosis", definition="first")
+        second = _glossary("Cell", definition="second")
+        blocks = BlockList(blocks=[first, TextBlock(text="x"), second])
+        assert blocks.glossary().lookup("cell").block_id == first.id
+
+        moved = blocks.move(second.id, 0)
+        assert moved.glossary().lookup("cell").block_id == second.id
+
+        removed = blocks.remove(first.id)
+        assert "osmosis" not in removed.glossary()
+        assert removed.glossary().complete("o") == []
+        assert removed.glossary().lookup("cell").block_id == second.id
+
+        replaced = blocks.replace(
+            GlossaryBlock(id=first.id, terms=[{"term": "Ion", "definition": "d"}])
+        )
+        assert [e.term for e in replaced.glossary().complete("")] == [
+            "Cell",
+            "Ion",
+        ]
+        assert replaced.glossary().lookup("cell").block_id == second.id
+
+        added = blocks.add(_glossary("Nucleus"))
+        assert "nucleus" in added.glossary()
+        text_edit = blocks.remove(blocks[1].id)
+        assert text_edit.glossary() is blocks.glossary()
+
+        for derived in (moved, removed, replaced, added):
+            fresh = GlossaryIndex.build(derived._seq.items())
+            assert derived.glossary().complete("", limit=None) == fresh.complete(
+                "", limit=None
+            )
+
+
+def _image(i: int) -> ImageBlock:
+    """Create an image block."""
+    return ImageBlock(url=f"https://example.com/{i}.png", alt_text=f"Image {i}")
+
+
+def _video(i: int) -> VideoBlock:
+    """Create a video block."""
+    return VideoBlock(url=f"https://example.com/{i}.mp4", title=f"Video {i}")
+
+
+class TestKinds:
+    """Tests for BlockList.of_kind and BlockList.kind_counts."""
+
+    def test_views(self):
+        """Test that views hold the blocks of one kind, in list order."""
+        blocks = [_video(0), TextBlock(text="a"), _image(0), _video(1), _video(2)]
+        block_list = BlockList(blocks=blocks)
+        videos = block_list.of_kind(VideoBlock)
+
+        assert list(videos) == [blocks[0], blocks[3], blocks[4]]
+        assert len(videos) == 3
+        assert videos[0] is blocks[0] and videos[-1] is blocks[4]
+        assert videos[1:] == [blocks[3], blocks[4]]
+        assert list(reversed(videos)) == [blocks[4], blocks[3], blocks[0]]
+        assert list(videos.positions()) == [0, 3, 4]
+        assert list(block_list.of_kind("text")) == [blocks[1]]
+        assert not block_list.of_kind(GlossaryBlock)
+        with pytest.raises(IndexError):
+            videos[3]
+
+    def test_counts(self):
+        """Test counting the blocks of every kind."""
+        block_list = BlockList(blocks=[_video(0), _image(0), _video(1)])
+        assert block_list.kind_counts() == {"video": 2, "image": 1}
+        assert BlockList().kind_counts() == {}
+
+    def test_class_without_kind(self):
+        """Test that views need a block class with a KIND."""
+        from corelab_blockkit import BaseBlock
+
+        with pytest.raises(TypeError):
+            BlockList().of_kind(BaseBlock)
+
+    def test_edits_update_index(self):
+        """Test that derived versions update the kind groups."""
+        block_list = BlockList(blocks=[_video(0), TextBlock(text="a"), _image(0)])
+        block_list.of_kind(VideoBlock)
+
+        new_video = _video(1)
+        block_list = block_list.add(new_video, 1)
+        block_list = block_list.remove(block_list[3].id)
+        block_list = block_list.move(block_list[0].id, 2)
+        block_list = block_list.replace(
+            TextBlock(id=new_video.id, text="now text")
+        )
+        assert "_indexes" in block_list.__dict__
+
+        assert list(block_list.of_kind(VideoBlock)) == [block_list[2]]
+        assert list(block_list.of_kind(VideoBlock).positions()) == [2]
+        assert block_list.kind_counts() == {"video": 1, "text": 2}
+        fresh = KindIndex.build(block_list._seq.items())
+        assert block_list.kind_counts() == fresh.counts()
+
+
+_T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _dated(name: str, created: int, updated: int) -> TextBlock:
+    """Create a text block created and updated some hours after _T0."""
+    return TextBlock(
+        text=name,
+        meta=BlockMeta(
+            created_at=_T0 + timedelta(hours=created),
+            updated_at=_T0 + timedelta(hours=updated),
+        ),
+    )
+
+
+class TestTimes:
+    """Tests for the time-range queries of BlockList."""
+
+    @pytest.fixture
+    def blocks(self):
+        """A list of blocks with different timestamps."""
+        return BlockList(
+            blocks=[
+                _dated("a", 0, 5),
+                _dated("b", 1, 1),
+                _dated("c", 2, 8),
+                _dated("d", 2, 3),
+                _dated("e", 4, 4),
+            ]
+        )
+
+    @staticmethod
+    def _texts(blocks):
+        """Get the text of each block."""
+        return [b.payload["text"] for b in blocks]
+
+    def test_updated_since(self, blocks):
+        """Test finding the blocks updated since a time, oldest first."""
+        since = _T0 + timedelta(hours=4)
+        assert self._texts(blocks.updated_since(since)) == ["e", "a", "c"]
+        assert blocks.updated_since(_T0 + timedelta(hours=9)) == []
+        assert len(blocks.updated_since(_T0)) == 5
+
+    def test_created_between(self, blocks):
+        """Test the half-open creation time range, ties in list order."""
+        start = _T0 + timedelta(hours=1)
+        end = _T0 + timedelta(hours=4)
+        assert self._texts(blocks.created_between(start, end)) == ["b", "c", "d"]
+        assert blocks.created_between(end, start) == []
+
+    def test_most_recent(self, blocks):
+        """Test getting the newest blocks."""
+        assert self._texts(blocks.most_recent(2)) == ["c", "a"]
+        assert self._texts(blocks.most_recent(1, field="created_at")) == ["e"]
+        assert len(blocks.most_recent(100)) == 5
+        assert blocks.most_recent(0) == []
+        with pytest.raises(ValueError):
+            blocks.most_recent(field="deleted_at")
+
+    def test_naive_and_aware(self):
+        """Test that naive timestamps are compared as local time."""
+        aware = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+        naive = aware.astimezone().replace(tzinfo=None)
+        later = TextBlock(
+            text="later",
+            meta=BlockMeta(created_at=naive, updated_at=naive + timedelta(minutes=1)),
+        )
+        blocks = BlockList(blocks=[later, _dated("old", 0, 0)])
+        assert blocks.updated_since(aware) == [later]
+        assert blocks.updated_since(naive) == [later]
+
+    def test_edits_update_index(self, blocks):
+        """Test that derived versions update the time order."""
+        blocks.most_recent()
+        newest = _dated("f", 10, 10)
+        blocks = blocks.add(newest, 0)
+        blocks = blocks.remove(blocks[3].id)
+        blocks = blocks.replace(
+            TextBlock(id=blocks[1].id, text="a", meta=BlockMeta(updated_at=_T0))
+        )
+        blocks = blocks.move(blocks[4].id, 1)
+        assert "_indexes" in blocks.__dict__
+
+        assert self._texts(blocks.most_recent(2)) == ["f", "e"]
+        assert self._texts(blocks.updated_since(_T0)) == ["a", "b", "d", "e", "f"]
+        fresh = TimeIndex.build(blocks._seq.items())
+        for field in ("created_at", "updated_at"):
+            assert list(fresh.between(field)) == list(
+                blocks._index(TimeIndex).between(field)
+            )
@@ -0,0 +1,135 @@
+"""Tests for streaming JSON serialization and deserialization."""
+
+import io
+
+import pytest
+
+from corelab_blockkit import BlockList, TextBlock
+from corelab_blockkit.exceptions import SerializationError
+from corelab_blockkit.ser.json_codec import (
+    dump_to_json,
+    iter_blocks_from_json,
+    iter_json_chunks,
+    load_from_json,
+    serialize_to_json,
+)
+
+
+class TestJSONStreamDecoder:
+    """Tests for iter_blocks_from_json and load_from_json."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+    def test_text_stream(self, block_list, chunk_size):
+        """Test reading a block list from a text stream."""
+        stream = io.StringIO(block_list.to_json(indent=2))
+        assert load_from_json(stream, chunk_size=chunk_size) == block_list
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+    def test_binary_stream(self, block_list, chunk_size):
+        """Test reading a block list from a binary stream with multi-byte characters."""
+        stream = io.BytesIO(block_list.to_json(ensure_ascii=False).encode("utf-8"))
+        assert load_from_json(stream, chunk_size=chunk_size) == block_list
+
+    def test_iterates_lazily(self, block_list):
+        """Test that blocks are yielded before the whole stream is read."""
+        stream = io.StringIO(block_list.to_json())
+        blocks = iter_blocks_from_json(stream, chunk_size=16)
+        first = next(blocks)
+        assert first == block_list[0]
+        assert stream.tell() < len(stream.getvalue())
+
+    def test_read_json(self, block_list):
+        """Test BlockList.read_json."""
+        stream = io.BytesIO(block_list.to_json().encode("utf-8"))
+        assert BlockList.read_json(stream, trusted=True) == block_list
+
+    def test_other_envelope_keys(self):
+        """Test that other keys in the envelope are ignored."""
+        block = TextBlock(text="Hello")
+        document = (
+            '{"version": 2, "meta": {"a": [1, 2]}, "blocks": '
+            + BlockList(blocks=[block]).to_json()[len('{"blocks": ') : -1]
+            + ', "count": 1}'
+        )
+        assert list(iter_blocks_from_json(io.StringIO(document), chunk_size=4)) == [
+            block
+        ]
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            "",
+            "[]",
+            '{"not_blocks": []}',
+            '{"blocks": [1]}',
+            '{"blocks": [{"kind": "unknown_type"}]}',
+            '{"blocks": [}',
+            '{"blocks": []',
+            '{"blocks": []} extra',
+        ],
+    )
+    def test_invalid_documents(self, document):
+        """Test that invalid documents raise SerializationError."""
+        with pytest.raises(SerializationError):
+            load_from_json(io.StringIO(document))
+
+    def test_duplicate_ids(self):
+        """Test that duplicate block IDs raise SerializationError."""
+        block = TextBlock(text="Hello")
+        block_json = block.model_dump_json()
+        document = f'{{"blocks": [{block_json}, {block_json}]}}'
+        with pytest.raises(SerializationError):
+            load_from_json(io.StringIO(document))
+
+
+class TestJSONStreamEncoder:
+    """Tests for iter_json_chunks and dump_to_json."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"indent": 2},
+            {"indent": "\t"},
+            {"indent": 0},
+            {"separators": (",", ":")},
+            {"indent": 4, "sort_keys": True},
+            {"ensure_ascii": False},
+        ],
+    )
+    def test_matches_serialize_to_json(self, block_list, kwargs):
+        """Test that the chunks join to the same string as serialize_to_json."""
+        for obj in (block_list, list(block_list), BlockList(), [], block_list[0]):
+            chunks = list(iter_json_chunks(obj, **kwargs))
+            assert "".join(chunks) == serialize_to_json(obj, **kwargs)
+
+    def test_one_chunk_per_block(self, block_list):
+        """Test that every block is yielded separately."""
+        chunks = list(iter_json_chunks(block_list))
+        assert len(chunks) == len(block_list) + 1
+
+    def test_write_text_stream(self, block_list):
+        """Test writing to a text stream."""
+        stream = io.StringIO()
+        block_list.write_json(stream, indent=2)
+        assert stream.getvalue() == block_list.to_json(indent=2)
+
+    def test_write_binary_stream(self, block_list):
+        """Test writing to a binary stream."""
+        stream = io.BytesIO()
+        dump_to_json(block_list, stream, ensure_ascii=False)
+        assert stream.getvalue().decode("utf-8") == block_list.to_json(
+            ensure_ascii=False
+        )
+        stream.seek(0)
+        assert BlockList.read_json(stream) == block_list
+
+    def test_serialization_error(self):
+        """Test that encoding errors raise SerializationError."""
+
+        class UnserializableObject:
+            pass
+
+        block = TextBlock(text="Hello", meta={"extra": {"obj": UnserializableObject()}})
+        with pytest.raises(SerializationError):
+            list(iter_json_chunks([block]))
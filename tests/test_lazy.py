@@ -0,0 +1,91 @@
+"""Tests for the LazyBlockList class."""
+
+import json
+import uuid
+
+import pytest
+
+from corelab_blockkit import BlockList, LazyBlockList
+from corelab_blockkit.exceptions import (
+    BlockDuplicateError,
+    BlockNotFoundError,
+    SerializationError,
+)
+
+
+class TestLazyBlockList:
+    """Tests for the LazyBlockList class."""
+
+    @pytest.mark.parametrize("fmt", ["json", "yaml"])
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_from_documents(self, block_list, fmt, trusted):
+        """Test lazy deserialization from JSON and YAML."""
+        if fmt == "json":
+            lazy = BlockList.from_json(block_list.to_json(), trusted=trusted, lazy=True)
+        else:
+            lazy = BlockList.from_yaml(block_list.to_yaml(), trusted=trusted, lazy=True)
+
+        assert isinstance(lazy, LazyBlockList)
+        assert lazy.loaded == 0
+        assert len(lazy) == len(block_list)
+        assert lazy == block_list
+        assert lazy.loaded == len(block_list)
+
+    def test_validates_on_access(self, block_list):
+        """Test that blocks are only validated when they are read."""
+        lazy = BlockList.from_json(block_list.to_json(), lazy=True)
+
+        assert lazy.ids() == [block.id for block in block_list]
+        assert lazy.loaded == 0
+
+        assert lazy[-1] == block_list[-1]
+        assert lazy[-1] is lazy[len(block_list) - 1]
+        assert lazy.loaded == 1
+
+        assert lazy.find_by_id(block_list[2].id) == block_list[2]
+        assert lazy.index_of(block_list[3].id) == 3
+        assert lazy[1:3] == block_list[1:3]
+        assert lazy.loaded == 3
+
+    def test_to_block_list(self, block_list):
+        """Test converting to a regular block list."""
+        lazy = BlockList.from_json(block_list.to_json(), lazy=True)
+        lazy[0]
+
+        regular = lazy.to_block_list()
+        assert isinstance(regular, BlockList)
+        assert regular == block_list
+        assert regular[0] is lazy[0]
+
+    def test_errors(self, block_list):
+        """Test lookup errors and invalid blocks."""
+        data = json.loads(block_list.to_json())
+        data["blocks"].append(
+            {"id": str(uuid.uuid4()), "kind": "image", "payload": {}}
+        )
+        lazy = BlockList.from_json(json.dumps(data), lazy=True)
+
+        with pytest.raises(IndexError):
+            lazy[len(lazy)]
+        with pytest.raises(BlockNotFoundError):
+            lazy.find_by_id(uuid.uuid4())
+
+        # The invalid block only fails when it is read
+        assert lazy.find_by_id(block_list[0].id) == block_list[0]
+        with pytest.raises(SerializationError):
+            lazy[-1]
+
+    def test_missing_kind(self):
+        """Test that blocks without a kind are rejected up front."""
+        with pytest.raises(SerializationError):
+            LazyBlockList([{"payload": {}}])
+
+    def test_duplicate_ids(self, block_list):
+        """Test that duplicate IDs are reported when looking up IDs."""
+        data = json.loads(block_list.to_json())
+        data["blocks"].append(data["blocks"][0])
+        lazy = BlockList.from_json(json.dumps(data), lazy=True)
+
+        assert len(lazy) == len(block_list) + 1
+        with pytest.raises(BlockDuplicateError):
+            lazy.ids()
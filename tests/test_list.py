@@ -6,7 +6,7 @@ from typing import List
 import pytest
 from hypothesis import given, strategies as st
 
-from corelab_blockkit import BlockList, TextBlock
+from corelab_blockkit import AddOp, BlockList, MoveOp, RemoveOp, ReplaceOp, TextBlock
 from corelab_blockkit.exceptions import BlockDuplicateError, BlockNotFoundError
 
 
@@ -131,6 +131,40 @@ class TestBlockList:
         with pytest.raises(BlockNotFoundError):
             blocks.find_by_id(uuid.uuid4())
 
+    def test_index_of(self):
+        """Test getting the position of a block by ID."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        blocks = BlockList(blocks=[block1, block2]).move(block2.id, 0)
+        assert blocks.index_of(block2.id) == 0
+        assert blocks.index_of(block1.id) == 1
+        assert blocks.find_by_id(block1.id) == block1
+        with pytest.raises(BlockNotFoundError):
+            blocks.index_of(uuid.uuid4())
+
+    def test_find_by_id_after_remove(self):
+        """Test that removed blocks are no longer found by ID."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        blocks = BlockList(blocks=[block1, block2])
+        new_blocks = blocks.remove(block1.id)
+        with pytest.raises(BlockNotFoundError):
+            new_blocks.find_by_id(block1.id)
+        assert blocks.find_by_id(block1.id) == block1
+        # The removed ID can be added again
+        assert len(new_blocks.add(block1)) == 2
+
+    def test_model_construct(self):
+        """Test creating a block list from trusted blocks."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        blocks = BlockList.model_construct(blocks=[block1, block2])
+        assert blocks == BlockList(blocks=[block1, block2])
+        assert blocks.find_by_id(block2.id) == block2
+        assert len(BlockList.model_construct()) == 0
+        with pytest.raises(BlockDuplicateError):
+            BlockList.model_construct(blocks=[block1, block1])
+
     @given(st.lists(st.integers()))
     def test_property_add_remove_inverse(self, items: List[int]):
         """Property test: adding and then removing a block is an identity operation."""
@@ -148,3 +182,209 @@ class TestBlockList:
         for i, block in enumerate(added_blocks):
             blocks = blocks.remove(block.id)
             assert len(blocks) == len(added_blocks) - i - 1
+
+    def test_slice(self):
+        """Test getting a slice of blocks."""
+        blocks = [TextBlock(text=f"Block {i}") for i in range(5)]
+        block_list = BlockList(blocks=blocks)
+        assert block_list[1:3] == blocks[1:3]
+        assert block_list[-1] == blocks[-1]
+        with pytest.raises(IndexError):
+            block_list[5]
+
+    def test_equality(self):
+        """Test that block lists compare equal by their blocks."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        blocks = BlockList(blocks=[block1]).add(block2)
+        assert blocks == BlockList(blocks=[block1, block2])
+        assert blocks != BlockList(blocks=[block2, block1])
+
+    def test_model_dump(self):
+        """Test that model_dump still exposes the blocks field."""
+        block = TextBlock(text="Block 1")
+        blocks = BlockList().add(block)
+        assert blocks.model_dump() == {"blocks": [block.model_dump()]}
+        assert blocks.blocks == [block]
+
+    def test_repeated_insert_at_same_index(self):
+        """Test that many inserts into the same gap keep the right order."""
+        first = TextBlock(text="first")
+        last = TextBlock(text="last")
+        blocks = BlockList(blocks=[first, last])
+        inserted = []
+        for i in range(100):
+            block = TextBlock(text=f"Block {i}")
+            inserted.insert(0, block)
+            blocks = blocks.add(block, index=1)
+        assert list(blocks) == [first] + inserted + [last]
+
+    def test_fingerprint(self):
+        """Test that list fingerprints follow the blocks and their order."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        blocks = BlockList(blocks=[block1, block2])
+
+        fingerprint = blocks.fingerprint()
+        assert fingerprint == BlockList().add(block1).add(block2).fingerprint()
+        assert fingerprint == BlockList.from_json(blocks.to_json()).fingerprint()
+        assert fingerprint != BlockList(blocks=[block2, block1]).fingerprint()
+        assert fingerprint != blocks.remove(block2.id).fingerprint()
+        assert BlockList().fingerprint() != BlockList(blocks=[block1]).fingerprint()
+        assert BlockList(blocks=[block1]).fingerprint() != block1.fingerprint()
+
+    @given(st.lists(st.tuples(st.integers(0, 20), st.integers(0, 20)), max_size=30))
+    def test_property_move_matches_list(self, moves: List[tuple]):
+        """Property test: moving blocks behaves like popping and inserting."""
+        reference = [TextBlock(text=f"Block {i}") for i in range(5)]
+        blocks = BlockList(blocks=reference)
+        for source, target in moves:
+            source %= len(reference)
+            target %= len(reference)
+            block = reference.pop(source)
+            reference.insert(target, block)
+            blocks = blocks.move(block.id, target)
+        assert list(blocks) == reference
+
+
+class TestBlockListBatch:
+    """Tests for batch edits on a BlockList."""
+
+    def test_replace(self):
+        """Test replacing a block in place."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        blocks = BlockList(blocks=[block1, block2])
+        updated = TextBlock(id=block1.id, text="Updated")
+        new_blocks = blocks.replace(updated)
+        assert list(new_blocks) == [updated, block2]
+        assert new_blocks.find_by_id(block1.id) == updated
+        assert list(blocks) == [block1, block2]
+        with pytest.raises(BlockNotFoundError):
+            blocks.replace(TextBlock(text="Unknown"))
+
+    def test_apply_ops(self):
+        """Test applying a batch of operations."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        block3 = TextBlock(text="Block 3")
+        updated = TextBlock(id=block2.id, text="Updated")
+        blocks = BlockList(blocks=[block1, block2])
+        new_blocks = blocks.apply_ops(
+            [
+                AddOp(block=block3, index=0),
+                RemoveOp(block_id=block1.id),
+                MoveOp(block_id=block3.id, new_index=1),
+                ReplaceOp(block=updated),
+            ]
+        )
+        assert list(new_blocks) == [updated, block3]
+        assert new_blocks.find_by_id(block3.id) == block3
+        assert list(blocks) == [block1, block2]
+
+    def test_apply_ops_is_atomic(self):
+        """Test that a failing batch raises and produces no list."""
+        block1 = TextBlock(text="Block 1")
+        blocks = BlockList(blocks=[block1])
+        with pytest.raises(BlockDuplicateError):
+            blocks.apply_ops(
+                [
+                    RemoveOp(block_id=block1.id),
+                    AddOp(block=block1),
+                    AddOp(block=block1),
+                ]
+            )
+        with pytest.raises(BlockNotFoundError):
+            blocks.apply_ops([MoveOp(block_id=uuid.uuid4(), new_index=0)])
+        with pytest.raises(ValueError):
+            blocks.apply_ops([AddOp(block=TextBlock(text="Block 2"), index=5)])
+        assert list(blocks) == [block1]
+
+    def test_apply_no_ops(self):
+        """Test that an empty batch returns the same list."""
+        blocks = BlockList(blocks=[TextBlock(text="Block 1")])
+        assert blocks.apply_ops([]) is blocks
+
+    def test_transaction_context_manager(self):
+        """Test committing a transaction with a context manager."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        blocks = BlockList(blocks=[block1])
+        with blocks.transaction() as tx:
+            tx.add(block2, index=0)
+            tx.move(block1.id, 0)
+            assert len(tx) == 2
+        assert list(tx.result) == [block1, block2]
+        assert tx.result.index_of(block2.id) == 1
+
+    def test_transaction_not_committed_on_error(self):
+        """Test that a transaction is not committed when its block raises."""
+        blocks = BlockList()
+        with pytest.raises(RuntimeError):
+            with blocks.transaction() as tx:
+                tx.add(TextBlock(text="Block 1"))
+                raise RuntimeError("abort")
+        assert tx.result is None
+
+    def test_transaction_repeated_inserts(self):
+        """Test that inserting many blocks at one position keeps the order."""
+        first = TextBlock(text="First")
+        last = TextBlock(text="Last")
+        blocks = BlockList(blocks=[first, last])
+        inserted = [TextBlock(text=f"Block {i}") for i in range(300)]
+        with blocks.transaction() as tx:
+            for block in inserted:
+                tx.add(block, index=1)
+        assert list(tx.result) == [first] + inserted[::-1] + [last]
+        assert tx.result.index_of(inserted[0].id) == 300
+        assert list(blocks) == [first, last]
+
+    def test_transaction_edits_after_commit(self):
+        """Test that edits after a commit do not change the committed list."""
+        block1 = TextBlock(text="Block 1")
+        block2 = TextBlock(text="Block 2")
+        tx = BlockList(blocks=[block1]).transaction()
+        tx.add(block2)
+        committed = tx.commit()
+        tx.remove(block1.id)
+        assert list(committed) == [block1, block2]
+        assert committed.find_by_id(block1.id) == block1
+        assert list(tx.commit()) == [block2]
+
+    @given(
+        st.lists(
+            st.tuples(st.integers(0, 3), st.integers(0, 30), st.integers(0, 30)),
+            max_size=40,
+        )
+    )
+    def test_property_transaction_matches_list(self, ops: List[tuple]):
+        """Property test: transaction edits behave like edits of a plain list."""
+        reference = [TextBlock(text=f"Block {i}") for i in range(5)]
+        blocks = BlockList(blocks=reference)
+        reference = list(reference)
+        with blocks.transaction() as tx:
+            for kind, source, target in ops:
+                if kind == 0 or not reference:
+                    block = TextBlock(text=f"New {len(reference)}")
+                    index = target % (len(reference) + 1)
+                    reference.insert(index, block)
+                    tx.add(block, index)
+                    continue
+                block = reference[source % len(reference)]
+                if kind == 1:
+                    reference.remove(block)
+                    tx.remove(block.id)
+                elif kind == 2:
+                    index = target % len(reference)
+                    reference.remove(block)
+                    reference.insert(index, block)
+                    tx.move(block.id, index)
+                else:
+                    updated = TextBlock(id=block.id, text="Updated")
+                    reference[reference.index(block)] = updated
+                    tx.replace(updated)
+            assert len(tx) == len(reference)
+        assert list(tx.result) == reference
+        assert all(
+            tx.result.index_of(block.id) == i for i, block in enumerate(reference)
+        )
@@ -0,0 +1,222 @@
+"""Tests for the persistent collections."""
+
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given, strategies as st
+
+from corelab_blockkit.persistent import (
+    PersistentHashMap,
+    PersistentSortedMap,
+    PersistentTrie,
+)
+
+
+class TestPersistentSortedMap:
+    """Tests for the PersistentSortedMap class."""
+
+    def test_empty(self):
+        """Test an empty map."""
+        m = PersistentSortedMap()
+        assert len(m) == 0
+        assert list(m.items()) == []
+        assert m.get(1) is None
+        assert 1 not in m
+
+    def test_set_is_persistent(self):
+        """Test that set returns a new map and leaves the original unchanged."""
+        m1 = PersistentSortedMap().set(2, "b").set(1, "a")
+        m2 = m1.set(3, "c")
+        assert list(m1.items()) == [(1, "a"), (2, "b")]
+        assert list(m2.items()) == [(1, "a"), (2, "b"), (3, "c")]
+
+    def test_set_replaces_value(self):
+        """Test that setting an existing key replaces its value."""
+        m = PersistentSortedMap().set(1, "a").set(1, "z")
+        assert len(m) == 1
+        assert m.get(1) == "z"
+
+    def test_delete(self):
+        """Test deleting keys."""
+        m1 = PersistentSortedMap.from_sorted_items([(1, "a"), (2, "b"), (3, "c")])
+        m2 = m1.delete(2)
+        assert list(m2.keys()) == [1, 3]
+        assert list(m1.keys()) == [1, 2, 3]
+        with pytest.raises(KeyError):
+            m2.delete(2)
+
+    def test_positional_access(self):
+        """Test index, item_at and bisect_left."""
+        m = PersistentSortedMap.from_sorted_items((i * 10, i) for i in range(100))
+        assert m.index(500) == 50
+        assert m.item_at(50) == (500, 50)
+        assert m.item_at(-1) == (990, 99)
+        assert m.bisect_left(505) == 51
+        with pytest.raises(IndexError):
+            m.item_at(100)
+        with pytest.raises(KeyError):
+            m.index(505)
+
+    def test_from_sorted_items_rejects_unsorted(self):
+        """Test that from_sorted_items requires strictly increasing keys."""
+        with pytest.raises(ValueError):
+            PersistentSortedMap.from_sorted_items([(2, "b"), (1, "a")])
+
+    def test_irange(self):
+        """Test range iteration in both directions."""
+        m = PersistentSortedMap.from_sorted_items((i, str(i)) for i in range(10))
+        assert [k for k, _ in m.irange(3, 7)] == [3, 4, 5, 6]
+        assert [k for k, _ in m.irange(3, 7, reverse=True)] == [6, 5, 4, 3]
+        assert [k for k, _ in m.irange(minimum=8)] == [8, 9]
+        assert [k for k, _ in m.irange(maximum=2)] == [0, 1]
+
+    @given(
+        st.lists(
+            st.tuples(st.booleans(), st.integers(min_value=-50, max_value=50)),
+            max_size=200,
+        )
+    )
+    def test_property_matches_dict(self, ops: List[Tuple[bool, int]]):
+        """Property test: the map behaves like a sorted dict."""
+        m = PersistentSortedMap()
+        reference = {}
+        for is_set, key in ops:
+            if is_set:
+                m = m.set(key, key * 2)
+                reference[key] = key * 2
+            elif key in reference:
+                m = m.delete(key)
+                del reference[key]
+        assert list(m.items()) == sorted(reference.items())
+        for position, key in enumerate(sorted(reference)):
+            assert m.index(key) == position
+            assert m.item_at(position) == (key, reference[key])
+
+
+class _CollidingKey:
+    """A key whose hash collides with every other key of the same bucket."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return self.value % 3
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CollidingKey) and other.value == self.value
+
+
+class TestPersistentHashMap:
+    """Tests for the PersistentHashMap class."""
+
+    def test_empty(self):
+        """Test an empty map."""
+        m = PersistentHashMap()
+        assert len(m) == 0
+        assert m.get("a") is None
+        assert "a" not in m
+        with pytest.raises(KeyError):
+            m.delete("a")
+
+    def test_set_is_persistent(self):
+        """Test that set returns a new map and leaves the original unchanged."""
+        m1 = PersistentHashMap().set("a", 1)
+        m2 = m1.set("b", 2).set("a", 3)
+        assert dict(m1.items()) == {"a": 1}
+        assert dict(m2.items()) == {"a": 3, "b": 2}
+        assert len(m2) == 2
+
+    def test_from_dict(self):
+        """Test building a map from a dictionary."""
+        data = {i: str(i) for i in range(1000)}
+        m = PersistentHashMap.from_dict(data)
+        assert len(m) == 1000
+        assert dict(m.items()) == data
+        assert m.delete(500).get(500) is None
+
+    def test_hash_collisions(self):
+        """Test keys whose full hashes collide."""
+        m = PersistentHashMap()
+        keys = [_CollidingKey(i) for i in range(12)]
+        for key in keys:
+            m = m.set(key, key.value)
+        assert all(m.get(key) == key.value for key in keys)
+        for key in keys[:11]:
+            m = m.delete(key)
+        assert len(m) == 1
+        assert m.get(keys[11]) == 11
+        assert m.get(keys[0]) is None
+
+    @given(
+        st.lists(
+            st.tuples(st.booleans(), st.integers(min_value=-1000, max_value=1000)),
+            max_size=300,
+        )
+    )
+    def test_property_matches_dict(self, ops: List[Tuple[bool, int]]):
+        """Property test: the map behaves like a dict."""
+        m = PersistentHashMap()
+        reference = {}
+        for is_set, key in ops:
+            if is_set:
+                m = m.set(key, -key)
+                reference[key] = -key
+            elif key in reference:
+                m = m.delete(key)
+                del reference[key]
+        assert len(m) == len(reference)
+        assert dict(m.items()) == reference
+        assert all(m.get(key) == value for key, value in reference.items())
+
+
+class TestPersistentTrie:
+    """Tests for the PersistentTrie class."""
+
+    def test_empty(self):
+        """Test an empty trie."""
+        t = PersistentTrie()
+        assert len(t) == 0
+        assert list(t) == []
+        assert "" not in t
+        assert t.discard("a") is t
+
+    def test_add_is_persistent(self):
+        """Test that add and discard leave the original trie unchanged."""
+        t1 = PersistentTrie.from_keys(["cat", "car"])
+        t2 = t1.add("cart")
+        t3 = t2.discard("car")
+        assert list(t1) == ["car", "cat"]
+        assert list(t2) == ["car", "cart", "cat"]
+        assert list(t3) == ["cart", "cat"]
+        assert "car" in t2 and "car" not in t3
+        assert t2.add("cat") is t2
+
+    def test_prefix_keys(self):
+        """Test iterating over the keys with a prefix, in sorted order."""
+        t = PersistentTrie.from_keys(["osmosis", "os", "ozone", "cell", "osmium"])
+        assert list(t.keys("os")) == ["os", "osmium", "osmosis"]
+        assert list(t.keys("osm")) == ["osmium", "osmosis"]
+        assert list(t.keys("x")) == []
+        assert list(t.keys("")) == sorted(t)
+
+    @given(
+        st.lists(
+            st.tuples(st.booleans(), st.text(alphabet="abc", max_size=4)),
+            max_size=200,
+        )
+    )
+    def test_property_matches_set(self, ops: List[Tuple[bool, str]]):
+        """Property test: the trie behaves like a sorted set."""
+        t = PersistentTrie()
+        reference = set()
+        for is_add, key in ops:
+            if is_add:
+                t = t.add(key)
+                reference.add(key)
+            else:
+                t = t.discard(key)
+                reference.discard(key)
+        assert len(t) == len(reference)
+        assert list(t) == sorted(reference)
+        assert list(t.keys("a")) == sorted(k for k in reference if k.startswith("a"))
+        assert list(PersistentTrie.from_keys(reference)) == sorted(reference)
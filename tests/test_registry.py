@@ -1,10 +1,17 @@
 """Tests for the BlockTypeRegistry."""
 
+import importlib.metadata
+import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 import pytest
 
-from corelab_blockkit.blocks.base import BaseBlock
+from corelab_blockkit.blocks.base import BaseBlock, _known_kinds
 from corelab_blockkit.exceptions import RegistryError
-from corelab_blockkit.registry import BlockTypeRegistry
+from corelab_blockkit.registry import BlockTypeRegistry, _discover_entry_points
 
 
 class TestBlockTypeRegistry:
@@ -28,6 +35,9 @@ class TestBlockTypeRegistry:
         # Check that it's in the list of types
         assert "test_block" in registry.list_types()
 
+        # Registered kinds skip the kind pattern match from now on
+        assert "test_block" in _known_kinds
+
     def test_register_duplicate(self):
         """Test registering a duplicate block type."""
         registry = BlockTypeRegistry()
@@ -85,3 +95,222 @@ class TestBlockTypeRegistry:
         assert "test_block1" in types
         assert "test_block2" in types
         assert len(types) == 2
+
+    def test_clear(self):
+        """Test removing all block types."""
+        registry = BlockTypeRegistry()
+
+        class TestBlock(BaseBlock):
+            KIND = "test_block"
+
+        registry.register(TestBlock)
+        registry.clear()
+
+        assert registry.list_types() == []
+        registry.register(TestBlock)
+        assert registry.get("test_block") is TestBlock
+
+    def test_concurrent_register_and_get(self):
+        """Test registering and looking up block types from many threads."""
+        registry = BlockTypeRegistry()
+        classes = [
+            type(f"ThreadBlock{i}", (BaseBlock,), {"KIND": f"thread_block{i}"})
+            for i in range(64)
+        ]
+        start = threading.Barrier(8)
+
+        def work(offset):
+            start.wait()
+            for block_class in classes[offset::8]:
+                registry.register(block_class)
+                assert registry.get(block_class.KIND) is block_class
+            # Every type registered so far stays visible
+            for kind in registry.list_types():
+                registry.get(kind)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(8)))
+
+        assert sorted(registry.list_types()) == sorted(c.KIND for c in classes)
+
+
+@pytest.fixture
+def plugin_entry_points(tmp_path, monkeypatch):
+    """Entry points of a plugin module that is not imported yet.
+
+    The ``scans`` list records every scan of the installed distributions.
+    """
+    module_name = f"blockkit_test_plugin_{tmp_path.name}"
+    (tmp_path / f"{module_name}.py").write_text(
+        textwrap.dedent(
+            """
+            from corelab_blockkit.blocks.base import BaseBlock
+
+            class PluginBlock(BaseBlock):
+                KIND = "plugin_block"
+
+            class MisnamedBlock(BaseBlock):
+                KIND = "other_kind"
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    entry_points = [
+        importlib.metadata.EntryPoint(
+            name="plugin_block",
+            value=f"{module_name}:PluginBlock",
+            group="blockkit.blocks",
+        ),
+        importlib.metadata.EntryPoint(
+            name="misnamed_block",
+            value=f"{module_name}:MisnamedBlock",
+            group="blockkit.blocks",
+        ),
+        importlib.metadata.EntryPoint(
+            name="broken_block",
+            value=f"{module_name}:Missing",
+            group="blockkit.blocks",
+        ),
+    ]
+    scans = []
+
+    def fake_entry_points(group=None):
+        scans.append(group)
+        return entry_points
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", fake_entry_points)
+    yield SimpleNamespace(module=module_name, scans=scans)
+    sys.modules.pop(module_name, None)
+
+
+class TestEntryPoints:
+    """Tests for loading block types from entry points."""
+
+    def test_eager(self, plugin_entry_points):
+        """Test that eager loading imports and registers every plugin."""
+        registry = BlockTypeRegistry()
+        registry.load_entry_points()
+
+        assert plugin_entry_points.module in sys.modules
+        assert registry.get("plugin_block").__name__ == "PluginBlock"
+        assert sorted(registry.list_types()) == ["other_kind", "plugin_block"]
+
+    def test_lazy(self, plugin_entry_points):
+        """Test that lazy loading imports a plugin on its first lookup."""
+        registry = BlockTypeRegistry()
+        registry.load_entry_points(lazy=True)
+
+        assert plugin_entry_points.module not in sys.modules
+        assert sorted(registry.list_types()) == [
+            "broken_block",
+            "misnamed_block",
+            "plugin_block",
+        ]
+
+        block_class = registry.get("plugin_block")
+        assert plugin_entry_points.module in sys.modules
+        assert block_class.KIND == "plugin_block"
+        assert registry.get("plugin_block") is block_class
+
+    def test_lazy_concurrent_lookups(self, plugin_entry_points):
+        """Test that concurrent first lookups load a plugin once."""
+        registry = BlockTypeRegistry()
+        registry.load_entry_points(lazy=True)
+        start = threading.Barrier(8)
+
+        def lookup(_):
+            start.wait()
+            return registry.get("plugin_block")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lookup, range(8)))
+
+        assert len(set(results)) == 1
+        assert registry.list_types().count("plugin_block") == 1
+
+    def test_lazy_errors(self, plugin_entry_points):
+        """Test lookups of plugins that cannot be loaded."""
+        registry = BlockTypeRegistry()
+        registry.load_entry_points(lazy=True)
+
+        with pytest.raises(RegistryError, match="Failed to load"):
+            registry.get("broken_block")
+        with pytest.raises(RegistryError, match="not registered"):
+            registry.get("broken_block")
+
+    def test_lazy_misnamed_plugin(self, plugin_entry_points):
+        """Test that a plugin of another kind leaves the registry unchanged."""
+        registry = BlockTypeRegistry()
+        registry.load_entry_points(lazy=True)
+        types = dict(registry._types)
+
+        with pytest.raises(RegistryError, match="other_kind"):
+            registry.get("misnamed_block")
+
+        assert registry._types == types
+        with pytest.raises(RegistryError, match="not registered"):
+            registry.get("other_kind")
+        assert "other_kind" not in registry.list_types()
+
+    def test_lazy_keeps_registered_types(self, plugin_entry_points):
+        """Test that indexed entry points do not shadow registered types."""
+        registry = BlockTypeRegistry()
+
+        class LocalBlock(BaseBlock):
+            KIND = "plugin_block"
+
+        registry.register(LocalBlock)
+        registry.load_entry_points(lazy=True)
+
+        assert registry.get("plugin_block") is LocalBlock
+        assert registry.list_types().count("plugin_block") == 1
+
+
+class TestEntryPointCache:
+    """Tests for the on-disk cache of discovered entry points."""
+
+    def test_reuses_cache(self, plugin_entry_points, tmp_path):
+        """Test that a valid cache replaces scanning the distributions."""
+        cache_path = tmp_path / "cache" / "entry_points.json"
+        first = _discover_entry_points(cache_path)
+        assert len(plugin_entry_points.scans) == 1
+        assert cache_path.exists()
+
+        second = _discover_entry_points(cache_path)
+        assert len(plugin_entry_points.scans) == 1
+        assert [(ep.name, ep.value) for ep in second] == [
+            (ep.name, ep.value) for ep in first
+        ]
+
+        registry = BlockTypeRegistry()
+        registry.load_entry_points(lazy=True, cache_path=cache_path)
+        assert len(plugin_entry_points.scans) == 1
+        assert registry.get("plugin_block").KIND == "plugin_block"
+
+    def test_invalidated_by_installs(self, plugin_entry_points, tmp_path):
+        """Test that installing a distribution invalidates the cache."""
+        cache_path = tmp_path / "entry_points.json"
+        _discover_entry_points(cache_path)
+
+        # The plugin module's directory is on sys.path
+        (tmp_path / "new_package-1.0.dist-info").mkdir()
+        _discover_entry_points(cache_path)
+        assert len(plugin_entry_points.scans) == 2
+        _discover_entry_points(cache_path)
+        assert len(plugin_entry_points.scans) == 2
+
+    def test_invalid_cache(self, plugin_entry_points, tmp_path):
+        """Test that unreadable caches are ignored and rewritten."""
+        cache_path = tmp_path / "entry_points.json"
+        cache_path.write_text("not json")
+
+        assert len(_discover_entry_points(cache_path)) == 3
+        assert len(_discover_entry_points(cache_path)) == 3
+        assert len(plugin_entry_points.scans) == 1
+
+    def test_no_cache(self, plugin_entry_points):
+        """Test that entry points are scanned every time without a cache."""
+        _discover_entry_points(None)
+        _discover_entry_points(None)
+        assert len(plugin_entry_points.scans) == 2
@@ -7,7 +7,9 @@ from datetime import datetime, timezone
 import pytest
 
 from corelab_blockkit import BlockList, TextBlock, ImageBlock
+from corelab_blockkit.exceptions import SerializationError
 from corelab_blockkit.meta import BlockMeta
+from corelab_blockkit.ser import json_codec
 from corelab_blockkit.ser.json_codec import serialize_to_json, deserialize_from_json
 from corelab_blockkit.ser.yaml_codec import serialize_to_yaml, deserialize_from_yaml
 
@@ -119,6 +121,59 @@ class TestSerialization:
         assert deserialized[1].kind == blocks[1].kind
         assert deserialized[1].url == blocks[1].url
 
+    def test_trusted_round_trip_block_list(self):
+        """Test that trusted deserialization matches validated deserialization."""
+        meta = BlockMeta(
+            created_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2023, 1, 2, 3, 4, 5, 678),
+            tags=["test"],
+            extra={"author": "Test Author"},
+        )
+        blocks = BlockList(
+            blocks=[
+                TextBlock(text="Hello **world**!", meta=meta),
+                ImageBlock(url="https://example.com/image.jpg", caption="Caption"),
+            ]
+        )
+
+        for trusted in (
+            BlockList.from_json(blocks.to_json(), trusted=True),
+            BlockList.from_yaml(blocks.to_yaml(), trusted=True),
+        ):
+            assert trusted == blocks
+            assert isinstance(trusted[0], TextBlock)
+            assert trusted[0].meta.updated_at == meta.updated_at
+            assert trusted.find_by_id(blocks[1].id).caption == "Caption"
+
+    def test_trusted_single_block(self):
+        """Test trusted deserialization of a single block."""
+        block = TextBlock(text="Hello **world**!")
+        deserialized = deserialize_from_json(
+            serialize_to_json(block), target_type=TextBlock, trusted=True
+        )
+        assert deserialized == block
+
+    def test_json_mixed_kinds_keep_order(self):
+        """Test that blocks decoded in groups by kind keep their order."""
+        blocks = BlockList(
+            blocks=[
+                TextBlock(text=f"Text {i}")
+                if i % 3
+                else ImageBlock(url=f"https://example.com/{i}.jpg")
+                for i in range(12)
+            ]
+        )
+        for trusted in (False, True):
+            assert BlockList.from_json(blocks.to_json(), trusted=trusted) == blocks
+
+    def test_json_invalid_block_in_group(self):
+        """Test that an invalid block fails the deserialization of its list."""
+        data = json.loads(BlockList(blocks=[TextBlock(text="Hello")]).to_json())
+        data["blocks"].append({"kind": "image", "payload": {}})
+
+        with pytest.raises(SerializationError, match="kind 'image'"):
+            deserialize_from_json(json.dumps(data))
+
     def test_json_invalid_format(self):
         """Test deserializing invalid JSON."""
         with pytest.raises(Exception):
@@ -128,3 +183,56 @@ class TestSerialization:
         """Test deserializing invalid YAML."""
         with pytest.raises(Exception):
             deserialize_from_yaml("invalid: yaml: [")
+
+
+class TestCompiledJSON:
+    """Tests for JSON serialization with pydantic's compiled serializer."""
+
+    @pytest.fixture
+    def blocks(self):
+        """A block list with UTC, offset and naive timestamps."""
+        meta = BlockMeta(
+            created_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2023, 1, 2, 3, 4, 5, 678),
+            tags=["tëst"],
+            extra={"author": "Test Author", "scores": [1, 2.5, None]},
+        )
+        return BlockList(
+            blocks=[
+                TextBlock(text="Hello «world»!", meta=meta),
+                ImageBlock(url="https://example.com/image.jpg", caption="Caption"),
+            ]
+        )
+
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    def test_same_text_with_indent(self, blocks, ensure_ascii):
+        """Test that indented output is identical to json.dumps."""
+        for obj in (blocks, list(blocks), blocks[0]):
+            assert serialize_to_json(
+                obj, compiled=True, indent=2, ensure_ascii=ensure_ascii
+            ) == serialize_to_json(obj, indent=2, ensure_ascii=ensure_ascii)
+
+    def test_escape_without_pydantic_support(self, blocks, monkeypatch):
+        """Test escaping non-ASCII text with a pydantic lacking ensure_ascii."""
+        monkeypatch.setattr(json_codec, "_COMPILED_ENSURE_ASCII", False)
+        blocks = blocks.add(TextBlock(text="Smile 😀 ü"))
+        for ensure_ascii in (True, False):
+            assert serialize_to_json(
+                blocks, compiled=True, indent=2, ensure_ascii=ensure_ascii
+            ) == serialize_to_json(blocks, indent=2, ensure_ascii=ensure_ascii)
+
+    def test_compact_output(self, blocks):
+        """Test that output without an indent matches compact json.dumps."""
+        assert blocks.to_json(compiled=True) == blocks.to_json(separators=(",", ":"))
+        assert BlockList.from_json(blocks.to_json(compiled=True)) == blocks
+
+    def test_unsupported_options(self, blocks):
+        """Test that json.dumps-only options are rejected."""
+        with pytest.raises(SerializationError):
+            serialize_to_json(blocks, compiled=True, separators=(", ", ": "))
+        with pytest.raises(SerializationError):
+            serialize_to_json(blocks, compiled=True, indent="\t")
+        with pytest.raises(SerializationError):
+            serialize_to_json(blocks, compiled=True, sort_keys=True)
+        with pytest.raises(SerializationError):
+            serialize_to_json({"blocks": []}, compiled=True)